@@ -0,0 +1,35 @@
+"""AI API controller exposing operational endpoints for the AI layer."""
+
+from typing import List
+from fastapi import APIRouter, Depends, status
+
+from backend.ai.models.prompt_cache_stats import PromptCacheStats
+from backend.ai.models.token_usage import TokenUsage
+from backend.ai.services.gemini_service import GeminiService
+from backend.ai.services.prompt_cache import PromptCache
+from backend.config.dependencies import get_gemini_service, get_prompt_cache, require_admin
+
+router = APIRouter(prefix="/ai", tags=["ai"])
+
+@router.get("/cache", response_model=PromptCacheStats)
+async def get_prompt_cache_stats(prompt_cache: PromptCache = Depends(get_prompt_cache)):
+    """Get hit/miss metrics of the prompt cache.
+    
+    Returns:
+        Current prompt cache statistics.
+    """
+    return prompt_cache.stats()
+
+@router.delete("/cache", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_admin)])
+async def clear_prompt_cache(prompt_cache: PromptCache = Depends(get_prompt_cache)):
+    """Drop every in-memory prompt cache entry; requires the admin token."""
+    prompt_cache.clear()
+
+@router.get("/usage", response_model=List[TokenUsage])
+async def get_token_usage(gemini_service: GeminiService = Depends(get_gemini_service)):
+    """Get the input and output tokens consumed by model calls, per task.
+    
+    Returns:
+        Token usage accumulated since startup.
+    """
+    return gemini_service.get_token_usage()
@@ -0,0 +1,29 @@
+"""Exceptions raised by the AI layer when the model provider cannot answer."""
+
+from typing import Optional
+
+
+class AIServiceError(Exception):
+    """Base error for model calls that failed after the resilience policies.
+
+    Attributes:
+        status_code: HTTP status the error is reported with.
+        retry_after: Seconds after which the client may retry, when known.
+    """
+    status_code = 502
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class AIRateLimitError(AIServiceError):
+    """The provider quota or the local rate limit is exhausted."""
+    status_code = 429
+
+class AIUnavailableError(AIServiceError):
+    """The provider keeps failing, or the circuit breaker is open."""
+    status_code = 503
+
+class AIDeadlineExceededError(AIServiceError):
+    """The request deadline elapsed before the model answered."""
+    status_code = 504
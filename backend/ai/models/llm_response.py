@@ -0,0 +1,11 @@
+"""LLM response model definition."""
+
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class LLMResponse(BaseModel):
+    """Text returned by an LLM provider, whole or as one streamed chunk."""
+    text: str = Field(..., description="Generated text")
+    input_tokens: Optional[int] = Field(None, description="Prompt tokens reported by the provider")
+    output_tokens: Optional[int] = Field(None, description="Generated tokens reported by the provider")
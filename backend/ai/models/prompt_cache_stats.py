@@ -0,0 +1,13 @@
+"""Prompt cache statistics model definition."""
+
+from pydantic import BaseModel, Field
+
+
+class PromptCacheStats(BaseModel):
+    """Hit/miss metrics of the LLM prompt cache."""
+    memory_hits: int = Field(..., description="Lookups answered by the in-memory tier")
+    persistent_hits: int = Field(..., description="Lookups answered by the MongoDB tier")
+    misses: int = Field(..., description="Lookups that required a model call")
+    evictions: int = Field(..., description="Entries evicted from the in-memory tier")
+    entries: int = Field(..., description="Entries currently held in memory")
+    hit_ratio: float = Field(..., description="Share of lookups answered from cache")
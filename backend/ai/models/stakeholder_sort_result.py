@@ -0,0 +1,9 @@
+"""Stakeholder sort result model definition."""
+
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class StakeholderSortResult(BaseModel):
+    """Requirement ordering the model returns for a stakeholder."""
+    sorted_requirement_ids: List[str] = Field(default_factory=list, description="Requirement IDs, most important first")
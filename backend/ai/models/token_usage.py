@@ -0,0 +1,11 @@
+"""Token usage model definition."""
+
+from pydantic import BaseModel, Field
+
+
+class TokenUsage(BaseModel):
+    """Accumulated token counts of the model calls made for one task."""
+    task: str = Field(..., description="Prompt task, e.g. wiegers or glossary")
+    calls: int = Field(..., description="Number of model calls made")
+    input_tokens: int = Field(..., description="Total prompt tokens sent")
+    output_tokens: int = Field(..., description="Total response tokens received")
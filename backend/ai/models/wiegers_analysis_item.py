@@ -0,0 +1,14 @@
+"""Wiegers analysis item model definition."""
+
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class WiegersAnalysisItem(BaseModel):
+    """Wiegers scores the model assigns to one requirement."""
+    requirement_id: str = Field(..., description="ID of the analysed requirement")
+    requirement_title: Optional[str] = Field(None, description="Title echoed by the model")
+    value: int = Field(..., ge=1, le=5, description="Value to user (1-5)")
+    cost: int = Field(..., ge=1, le=5, description="Implementation cost (1-5)")
+    risk: int = Field(..., ge=1, le=5, description="Technical risk (1-5)")
+    urgency: int = Field(..., ge=1, le=5, description="Urgency (1-5)")
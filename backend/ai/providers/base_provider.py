@@ -0,0 +1,48 @@
+"""Interface implemented by every LLM backend."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from backend.ai.models.llm_response import LLMResponse
+
+
+class LLMProvider(ABC):
+    """Backend able to answer prompts, whole or streamed.
+
+    Attributes:
+        name: Stable identifier of the provider and model, used for cache
+            keys and per-backend rate limits.
+        remote: Whether calls leave the process and need the resilience
+            policies (rate limit, retries, circuit breaker).
+    """
+
+    name: str
+    remote: bool = True
+
+    @abstractmethod
+    async def generate(self, prompt: str, task: str, json_mode: bool = False) -> LLMResponse:
+        """Answer a prompt.
+
+        Args:
+            prompt: The prompt text.
+            task: Name of the operation, e.g. wiegers or glossary.
+            json_mode: Ask for a JSON response.
+
+        Returns:
+            The generated text with token counts when known.
+        """
+
+    @abstractmethod
+    async def open_stream(self, prompt: str, task: str) -> AsyncIterator[LLMResponse]:
+        """Start a streamed answer to a prompt.
+
+        Errors opening the stream are raised by this coroutine; closing the
+        returned iterator early cancels the generation.
+
+        Args:
+            prompt: The prompt text.
+            task: Name of the operation.
+
+        Returns:
+            Async iterator over the chunks of the answer.
+        """
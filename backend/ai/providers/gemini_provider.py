@@ -0,0 +1,90 @@
+"""Google Gemini implementation of the LLM provider interface."""
+
+import logging
+from typing import Any, AsyncIterator, Optional
+
+import google.generativeai as genai
+
+from backend.ai.models.llm_response import LLMResponse
+from backend.ai.providers.base_provider import LLMProvider
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+JSON_GENERATION_CONFIG = genai.GenerationConfig(response_mime_type="application/json")
+
+class GeminiProvider(LLMProvider):
+    """LLM provider calling a Gemini model through `google.generativeai`.
+
+    Attributes:
+        model_name: Name of the Gemini model.
+        model: The generative model client.
+    """
+
+    def __init__(self, api_key: Optional[str], model_name: str, model: Any = None):
+        """Initialize the GeminiProvider.
+
+        Args:
+            api_key: Gemini API key.
+            model_name: Name of the Gemini model.
+            model: Client to use instead of `genai.GenerativeModel`, e.g. a test double.
+
+        Raises:
+            ValueError: When no API key is configured and no client is given.
+        """
+        self.name = f"gemini:{model_name}"
+        self.model_name = model_name
+        if model is None:
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY must be set to use the Gemini provider")
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel(model_name)
+        self.model = model
+
+    async def generate(self, prompt: str, task: str, json_mode: bool = False) -> LLMResponse:
+        """Answer a prompt with a single Gemini call."""
+        options = {"generation_config": JSON_GENERATION_CONFIG} if json_mode else {}
+        response = await self.model.generate_content_async(prompt, **options)
+        return self._to_response(response.text, getattr(response, "usage_metadata", None))
+
+    async def open_stream(self, prompt: str, task: str) -> AsyncIterator[LLMResponse]:
+        """Start a streamed Gemini call; the first chunk is awaited here."""
+        response = await self.model.generate_content_async(prompt, stream=True)
+        return self._iterate(response)
+
+    async def _iterate(self, response: Any) -> AsyncIterator[LLMResponse]:
+        """Yield the text chunks of a streamed response, cancelling the RPC if abandoned."""
+        completed = False
+        iterator = response.__aiter__()
+        try:
+            async for chunk in iterator:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    continue
+                yield self._to_response(text, getattr(chunk, "usage_metadata", None))
+            completed = True
+        finally:
+            if not completed:
+                self._cancel_stream(response)
+            await iterator.aclose()
+
+    @staticmethod
+    def _cancel_stream(response: Any):
+        """Cancel the RPC behind an abandoned streaming response, when it exposes one.
+
+        The Gemini client keeps the underlying gRPC stream on `_iterator`.
+        """
+        upstream = getattr(response, "_iterator", response)
+        cancel = getattr(upstream, "cancel", None)
+        if callable(cancel):
+            cancel()
+            logger.info("Cancelled abandoned Gemini stream")
+
+    @staticmethod
+    def _to_response(text: str, usage_metadata: Any) -> LLMResponse:
+        return LLMResponse(
+            text=text,
+            input_tokens=getattr(usage_metadata, "prompt_token_count", None),
+            output_tokens=getattr(usage_metadata, "candidates_token_count", None)
+        )
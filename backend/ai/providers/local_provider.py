@@ -0,0 +1,129 @@
+"""Deterministic offline implementation of the LLM provider interface."""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import AsyncIterator, Callable, Dict, List
+
+from backend.ai.models.llm_response import LLMResponse
+from backend.ai.providers.base_provider import LLMProvider
+
+LISTING_PATTERN = re.compile(r"ID: (?P<id>[^,\s]+), Título: (?P<title>[^,\n]*)")
+TITLE_PATTERN = re.compile(r"Título: (?P<title>[^\n]+)")
+DESCRIPTION_PATTERN = re.compile(r"Descrição: (?P<description>[^\n]+)")
+DETAILS_PATTERN = re.compile(r"^\s*Detalhes: (?P<details>.*)$", re.MULTILINE)
+TYPE_PATTERN = re.compile(r"^\s*Tipo: (?P<type>.+)$", re.MULTILINE)
+STAKEHOLDERS_PATTERN = re.compile(r"^\s*Partes Interessadas: (?P<stakeholders>.*)$", re.MULTILINE)
+
+class LocalProvider(LLMProvider):
+    """Template-based provider answering every task without network access.
+
+    Answers are derived from the requirement listings embedded in the
+    prompt, so they are deterministic and well-formed: Wiegers scores are
+    a hash of the requirement ID, the stakeholder sort keeps the order of
+    the listing, glossary terms come from the titles and descriptions are
+    filled from a fixed template. It is meant for CI, benchmarks and load
+    tests, and as a zero-cost route for tasks that do not need a model.
+
+    Attributes:
+        latency: Simulated seconds per call, spread over streamed chunks.
+    """
+
+    name = "local"
+    remote = False
+
+    def __init__(self, latency: float = 0.0):
+        """Initialize the LocalProvider.
+
+        Args:
+            latency: Simulated seconds per call.
+        """
+        self.latency = latency
+        self._handlers: Dict[str, Callable[[str], str]] = {
+            "description": self._description,
+            "description_stream": self._description,
+            "wiegers": self._wiegers,
+            "stakeholder_sort": self._stakeholder_sort,
+            "glossary": self._glossary,
+        }
+
+    def answer(self, prompt: str, task: str) -> str:
+        """Render the template answer of a task, without simulated latency.
+
+        Args:
+            prompt: Prompt the answer is derived from.
+            task: Task name; unknown tasks echo the prompt.
+
+        Returns:
+            The answer text.
+        """
+        return self._handlers.get(task, self._echo)(prompt)
+
+    async def generate(self, prompt: str, task: str, json_mode: bool = False) -> LLMResponse:
+        """Answer a prompt from the template of its task."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return LLMResponse(text=self.answer(prompt, task))
+
+    async def open_stream(self, prompt: str, task: str) -> AsyncIterator[LLMResponse]:
+        """Start a streamed answer, split into word-sized chunks."""
+        return self._iterate(self.answer(prompt, task).split(" "))
+
+    async def _iterate(self, words: List[str]) -> AsyncIterator[LLMResponse]:
+        delay = self.latency / max(len(words), 1)
+        for index, word in enumerate(words):
+            if delay:
+                await asyncio.sleep(delay)
+            yield LLMResponse(text=word if index == 0 else " " + word)
+
+    @staticmethod
+    def _score(requirement_id: str, criterion: str) -> int:
+        digest = hashlib.sha256(f"{requirement_id}:{criterion}".encode("utf-8")).digest()
+        return digest[0] % 5 + 1
+
+    def _wiegers(self, prompt: str) -> str:
+        return json.dumps([
+            {
+                "requirement_id": match["id"],
+                "requirement_title": match["title"].strip(),
+                "value": self._score(match["id"], "value"),
+                "cost": self._score(match["id"], "cost"),
+                "risk": self._score(match["id"], "risk"),
+                "urgency": self._score(match["id"], "urgency"),
+            }
+            for match in LISTING_PATTERN.finditer(prompt)
+        ], ensure_ascii=False)
+
+    @staticmethod
+    def _stakeholder_sort(prompt: str) -> str:
+        return json.dumps({"sorted_requirement_ids": [match["id"] for match in LISTING_PATTERN.finditer(prompt)]})
+
+    @staticmethod
+    def _glossary(prompt: str) -> str:
+        titles = [match["title"].strip() for match in TITLE_PATTERN.finditer(prompt)]
+        descriptions = [match["description"].strip() for match in DESCRIPTION_PATTERN.finditer(prompt)]
+        return json.dumps([
+            {"name": title, "definition": description if description != "N/A" else f"Termo referente a {title}."}
+            for title, description in zip(titles, descriptions)
+        ], ensure_ascii=False)
+
+    @staticmethod
+    def _description(prompt: str) -> str:
+        def field(pattern: re.Pattern, group: str) -> str:
+            match = pattern.search(prompt)
+            return match[group].strip() if match else ""
+
+        title = field(TITLE_PATTERN, "title")
+        details = field(DETAILS_PATTERN, "details")
+        description = (
+            f"O requisito \"{title}\" ({field(TYPE_PATTERN, 'type')}) atende às partes interessadas "
+            f"{field(STAKEHOLDERS_PATTERN, 'stakeholders')}. Propósito: garantir que o sistema contemple {title.lower()}."
+        )
+        if details:
+            description += f" Funcionalidades principais: {details}"
+        return description
+
+    @staticmethod
+    def _echo(prompt: str) -> str:
+        return f"Resposta local para: {' '.join(prompt.split())[:200]}"
@@ -0,0 +1,27 @@
+"""Construction of LLM providers from configuration strings."""
+
+from backend.ai.providers.base_provider import LLMProvider
+from backend.ai.providers.gemini_provider import GeminiProvider
+from backend.ai.providers.local_provider import LocalProvider
+from backend.config.settings import settings
+
+def create_provider(spec: str) -> LLMProvider:
+    """Build the provider described by a configuration string.
+
+    Args:
+        spec: `local`, `gemini` for the configured GEMINI_MODEL, or
+            `gemini:<model>` for another Gemini model.
+
+    Returns:
+        The configured provider.
+
+    Raises:
+        ValueError: When the provider is unknown or misconfigured.
+    """
+    kind, _, model_name = spec.strip().partition(":")
+    kind = kind.lower()
+    if kind == "local":
+        return LocalProvider(latency=settings.LOCAL_PROVIDER_LATENCY_SECONDS)
+    if kind == "gemini":
+        return GeminiProvider(settings.GEMINI_API_KEY, model_name or settings.GEMINI_MODEL)
+    raise ValueError(f"Unknown AI provider: {spec}")
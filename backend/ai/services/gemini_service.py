@@ -1,19 +1,240 @@
 """Gemini AI service for handling AI-powered content generation."""
 
-import json
-import google.generativeai as genai
-from typing import List, Dict, Any
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Any, Optional, Tuple, Type
+from backend.ai.exceptions import AIServiceError
+from backend.ai.models.llm_response import LLMResponse
+from backend.ai.models.stakeholder_sort_result import StakeholderSortResult
+from backend.ai.models.wiegers_analysis_item import WiegersAnalysisItem
+from backend.ai.providers.base_provider import LLMProvider
+from backend.ai.providers.provider_factory import create_provider
+from backend.ai.services.prompt_builder import PromptBuilder
+from backend.ai.services.prompt_cache import PromptCache
+from backend.ai.services.resilience import ResilientCaller
+from backend.ai.services.structured_output import ModelT, parse_items, parse_model
 from backend.config.settings import settings
+from backend.core.metrics.registry import AI_CALL_DURATION, AI_TOKENS
+from backend.requirements.models.glossary import GlossaryTerm
 from backend.requirements.models.requirement import Requirement
 
+# Set up logging
+logger = logging.getLogger(__name__)
 
 class GeminiService:
-    """Service class for handling Gemini AI operations."""
+    """Service class for handling AI operations.
     
-    def __init__(self):
-        """Initialize the GeminiService with API configuration."""
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
+    Prompts are answered by the LLM provider selected with AI_PROVIDER,
+    Gemini by default. Individual tasks can be routed to another provider
+    with AI_TASK_ROUTES, e.g. a cheaper model or the offline local one.
+    """
+    
+    def __init__(self, prompt_cache: Optional[PromptCache] = None, provider: Optional[LLMProvider] = None):
+        """Initialize the GeminiService with API configuration.
+        
+        Args:
+            prompt_cache: Optional cache for prompt results
+            provider: Default provider, instead of the one selected by AI_PROVIDER
+        """
+        self.provider = provider or create_provider(settings.AI_PROVIDER)
+        self.routes = {task: create_provider(spec) for task, spec in settings.AI_TASK_ROUTES.items()}
+        self.timeout = settings.GEMINI_TIMEOUT_SECONDS
+        self.prompt_cache = prompt_cache
+        self.prompt_builder = PromptBuilder(settings.PROMPT_MAX_INPUT_TOKENS, settings.PROMPT_MAX_DESCRIPTION_TOKENS)
+        self.token_usage: Dict[str, Dict[str, int]] = {}
+        self.resilience = ResilientCaller(
+            rate_per_second=settings.GEMINI_RATE_LIMIT_PER_MINUTE / 60,
+            burst=settings.GEMINI_RATE_LIMIT_BURST,
+            max_retries=settings.GEMINI_MAX_RETRIES,
+            backoff_base=settings.GEMINI_BACKOFF_BASE_SECONDS,
+            backoff_max=settings.GEMINI_BACKOFF_MAX_SECONDS,
+            failure_threshold=settings.GEMINI_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.GEMINI_CIRCUIT_RESET_SECONDS,
+            deadline=settings.GEMINI_DEADLINE_SECONDS
+        )
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+    
+    def provider_for(self, task: str) -> LLMProvider:
+        """Return the provider answering a task.
+        
+        Args:
+            task: Name of the operation, e.g. wiegers or glossary
+            
+        Returns:
+            The routed provider, or the default one
+        """
+        return self.routes.get(task, self.provider)
+    
+    async def generate_text(self, prompt: str, use_cache: bool = True, task: str = "text", json_mode: bool = False) -> str:
+        """Run a raw prompt through the provider of the task.
+        
+        Results are served from the prompt cache when one is configured.
+        Calls are bounded by a semaphore so that a burst of AI requests
+        cannot exhaust the worker, and each attempt is cancelled once it
+        exceeds the configured timeout. Calls go through the resilience
+        layer: a per-model rate limit, retries with backoff on rate limit
+        and server errors, a circuit breaker and an overall deadline;
+        local providers skip it.
+        
+        Args:
+            prompt: The prompt to send to the model
+            use_cache: Whether to read and write the prompt cache
+            task: Name under which the token usage of the call is reported
+            json_mode: Ask the model for a JSON response
+            
+        Returns:
+            The text of the model response
+            
+        Raises:
+            AIServiceError: When the model cannot answer within the resilience policies
+        """
+        if self.prompt_cache is None or not use_cache:
+            return await self._call_model(prompt, task, json_mode)
+        
+        key = PromptCache.make_key(self.provider_for(task).name, prompt)
+        return await self.prompt_cache.get_or_create(key, lambda: self._call_model(prompt, task, json_mode))
+    
+    def get_token_usage(self) -> List[Dict[str, Any]]:
+        """Return the accumulated token usage of model calls, per task.
+        
+        Cached responses do not reach the model and are not counted.
+        
+        Returns:
+            List of dictionaries with the task name, number of calls and
+            input and output token totals
+        """
+        return [{"task": task, **usage} for task, usage in sorted(self.token_usage.items())]
+    
+    async def _generate_items(self, prompt: str, item_model: Type[ModelT], task: str) -> List[ModelT]:
+        """Run a JSON prompt and keep every array element that validates.
+        
+        Responses with rejected or no usable elements are evicted from the
+        prompt cache so that asking again reaches the model.
+        
+        Args:
+            prompt: The prompt to send to the model
+            item_model: Model every element is validated against
+            task: Name under which the token usage of the call is reported
+            
+        Returns:
+            The valid items of the response
+        """
+        items, _ = await self._generate_checked_items(prompt, item_model, task)
+        return items
+    
+    async def _generate_checked_items(self, prompt: str, item_model: Type[ModelT], task: str) -> Tuple[List[ModelT], bool]:
+        """Run a JSON prompt like `_generate_items`, also telling whether the response was fully valid.
+        
+        Returns:
+            The valid items, and False when the response had rejected or
+            no usable elements
+        """
+        response_text = await self.generate_text(prompt, task=task, json_mode=True)
+        items, rejected = parse_items(response_text, item_model)
+        if rejected or not items:
+            logger.warning(f"Gemini {task} response had {len(items)} valid and {rejected} invalid items")
+            await self._invalidate(prompt, task)
+            return items, False
+        return items, True
+    
+    async def _generate_model(self, prompt: str, model: Type[ModelT], task: str) -> ModelT:
+        """Run a JSON prompt and validate the response as a single object.
+        
+        Args:
+            prompt: The prompt to send to the model
+            model: Model the response is validated against
+            task: Name under which the token usage of the call is reported
+            
+        Returns:
+            The validated response
+            
+        Raises:
+            ValueError: When the response does not contain a valid object
+        """
+        response_text = await self.generate_text(prompt, task=task, json_mode=True)
+        try:
+            return parse_model(response_text, model)
+        except ValueError:
+            await self._invalidate(prompt, task)
+            raise
+    
+    async def _invalidate(self, prompt: str, task: str):
+        if self.prompt_cache is not None:
+            await self.prompt_cache.invalidate(PromptCache.make_key(self.provider_for(task).name, prompt))
+    
+    async def _call_model(self, prompt: str, task: str, json_mode: bool = False) -> str:
+        provider = self.provider_for(task)
+        
+        async def attempt(remaining: float) -> LLMResponse:
+            async with self._semaphore:
+                return await asyncio.wait_for(
+                    provider.generate(prompt, task, json_mode),
+                    timeout=min(self.timeout, remaining)
+                )
+        
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self._call_provider(provider, attempt)
+            outcome = "success"
+        finally:
+            AI_CALL_DURATION.labels(provider.name, task, outcome).observe(time.perf_counter() - start)
+        self._record_usage(provider, task, prompt, response.text, response.input_tokens, response.output_tokens)
+        return response.text
+    
+    async def _call_provider(self, provider: LLMProvider, operation: Callable[[float], Awaitable[Any]]) -> Any:
+        """Run a provider operation, under the resilience policies when it is remote."""
+        if provider.remote:
+            return await self.resilience.call(provider.name, operation)
+        return await operation(self.timeout)
+    
+    def _record_usage(
+        self,
+        provider: LLMProvider,
+        task: str,
+        prompt: str,
+        response_text: str,
+        input_tokens: Optional[int],
+        output_tokens: Optional[int]
+    ):
+        """Log and accumulate the token counts of a model call.
+        
+        Counts come from the provider response, falling back to the
+        prompt builder estimate when the provider does not report them.
+        """
+        if input_tokens is None:
+            input_tokens = self.prompt_builder.estimate_tokens(prompt)
+        if output_tokens is None:
+            output_tokens = self.prompt_builder.estimate_tokens(response_text)
+        
+        usage = self.token_usage.setdefault(task, {"calls": 0, "input_tokens": 0, "output_tokens": 0})
+        usage["calls"] += 1
+        usage["input_tokens"] += input_tokens
+        usage["output_tokens"] += output_tokens
+        AI_TOKENS.labels(provider.name, task, "input").inc(input_tokens)
+        AI_TOKENS.labels(provider.name, task, "output").inc(output_tokens)
+        logger.info(f"{provider.name} call for {task}: {input_tokens} input tokens, {output_tokens} output tokens")
+    
+    async def _generate_item_batches(self, template: str, listings: List[str], item_model: Type[ModelT], task: str) -> List[ModelT]:
+        """Run one JSON array prompt per requirement listing, concurrently.
+        
+        Args:
+            template: Prompt template with a `requirements_text` placeholder
+            listings: Requirement listings produced by the prompt builder
+            item_model: Model every array element is validated against
+            task: Name under which the token usage of the calls is reported
+            
+        Returns:
+            The valid items of every call, in listing order
+        """
+        if len(listings) > 1:
+            logger.info(f"Splitting {task} prompt across {len(listings)} calls to fit the token budget")
+        batches = await asyncio.gather(*(
+            self._generate_items(template.format(requirements_text=listing), item_model, task)
+            for listing in listings
+        ))
+        return [item for batch in batches for item in batch]
     
     async def generate_requirement_description(self, title: str, requirement_type: str, stakeholders: list, details: str) -> str:
         """Generate a detailed requirement description using Gemini AI.
@@ -29,13 +250,122 @@ class GeminiService:
         Raises:
             Exception: When AI generation fails
         """
-        prompt = f"""
+        prompt = self._description_prompt(title, requirement_type, stakeholders, details)
+        
+        try:
+            return await self.generate_text(prompt, task="description")
+        except AIServiceError:
+            raise
+        except Exception as e:
+            raise Exception(f"Falha ao gerar descrição com IA: {str(e)}")
+    
+    async def stream_requirement_description(self, title: str, requirement_type: str, stakeholders: list, details: str) -> AsyncIterator[str]:
+        """Generate a requirement description, yielding text as the model produces it.
+        
+        A cached description is yielded at once. Otherwise the model is
+        called with streaming enabled; opening the stream goes through the
+        resilience layer, and each chunk must arrive within the configured
+        timeout. The response is read by a background task that buffers
+        fragments, so the model slot is released when the model finishes
+        rather than when a slow client has read everything. The full text
+        is cached once the stream completes. Closing the iterator before
+        the model finished cancels the upstream generation.
+        
+        Args:
+            title: The requirement title
+            requirement_type: The type of requirement
+            stakeholders: List of stakeholders
+            details: Free-form details about the requirement
+            
+        Yields:
+            Successive fragments of the description
+            
+        Raises:
+            AIServiceError: When the stream cannot be opened within the resilience policies
+        """
+        task = "description_stream"
+        provider = self.provider_for(task)
+        prompt = self._description_prompt(title, requirement_type, stakeholders, details)
+        key = PromptCache.make_key(provider.name, prompt)
+        if self.prompt_cache is not None:
+            cached = await self.prompt_cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        pump = asyncio.create_task(self._pump_stream(provider, task, prompt, key, queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            if not pump.done():
+                pump.cancel()
+                await asyncio.gather(pump, return_exceptions=True)
+    
+    async def _pump_stream(self, provider: LLMProvider, task: str, prompt: str, key: str, queue: asyncio.Queue):
+        """Read a streamed model response into a queue, holding a model slot only while upstream runs.
+        
+        Fragments are queued as they arrive, followed by None once the
+        stream completed, or by the exception that ended it. The semaphore
+        is released as soon as the model finished, however slowly the
+        queue is drained. Cancelling the task cancels the upstream call.
+        """
+        async def attempt(remaining: float) -> AsyncIterator[LLMResponse]:
+            return await asyncio.wait_for(provider.open_stream(prompt, task), timeout=min(self.timeout, remaining))
+        
+        start = time.perf_counter()
+        outcome = "error"
+        fragments = []
+        last_chunk = None
+        try:
+            async with self._semaphore:
+                stream = await self._call_provider(provider, attempt)
+                try:
+                    while True:
+                        try:
+                            chunk = await asyncio.wait_for(stream.__anext__(), timeout=self.timeout)
+                        except StopAsyncIteration:
+                            break
+                        last_chunk = chunk
+                        fragments.append(chunk.text)
+                        queue.put_nowait(chunk.text)
+                finally:
+                    await stream.aclose()
+            outcome = "success"
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            queue.put_nowait(e)
+            return
+        finally:
+            AI_CALL_DURATION.labels(provider.name, task, outcome).observe(time.perf_counter() - start)
+        
+        description = "".join(fragments)
+        self._record_usage(
+            provider, task, prompt, description,
+            last_chunk.input_tokens if last_chunk else None,
+            last_chunk.output_tokens if last_chunk else None
+        )
+        if self.prompt_cache is not None and description:
+            await self.prompt_cache.set(key, description)
+        queue.put_nowait(None)
+    
+    def _description_prompt(self, title: str, requirement_type: str, stakeholders: list, details: str) -> str:
+        """Build the description prompt, truncating details to the token budget."""
+        template = """
         Com base nas seguintes informações do requisito, gere uma descrição em texto puro, sem markdown
         
         Título: {title}
         Tipo: {requirement_type}
         Detalhes: {details}
-        Partes Interessadas: {', '.join(stakeholders)}
+        Partes Interessadas: {stakeholders}
         
         Por favor, forneça uma descrição abrangente que inclua:
         - Propósito e objetivos
@@ -44,30 +374,29 @@ class GeminiService:
         Mantenha a descrição profissional e adequada para um documento de requisitos de software.
         Responda em português brasileiro.
         """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            raise Exception(f"Falha ao gerar descrição com IA: {str(e)}")
+        fields = {"title": title, "requirement_type": requirement_type, "stakeholders": ", ".join(stakeholders)}
+        details_budget = self.prompt_builder.max_input_tokens - self.prompt_builder.estimate_tokens(template.format(details="", **fields))
+        return template.format(details=self.prompt_builder.truncate(details, details_budget), **fields)
     
-    async def generate_wiegers_matrix(self, requirements: List[Requirement]) -> List[Dict[str, Any]]:
+    async def generate_wiegers_matrix(self, requirements: List[Requirement]) -> List[WiegersAnalysisItem]:
         """Generate Wiegers matrix analysis for requirements using Gemini AI.
         
+        Requirements that do not fit the prompt token budget are analysed
+        across several calls and the results are concatenated. Requirements
+        missing from the responses, or whose scores fail validation, are
+        asked for again on their own, up to GEMINI_REPAIR_ATTEMPTS times.
+        
         Args:
             requirements: List of requirement objects
             
         Returns:
-            List of dictionaries with requirement analysis
+            Validated analysis of every requirement the model scored, in
+            input order
             
         Raises:
             Exception: When AI generation fails
         """
-        requirements_text = ""
-        for req in requirements:
-            requirements_text += f"- ID: {req.id}, Título: {req.title}, Descrição: {req.description or 'N/A'}, Tipo: {req.type.value}\n"
-        
-        prompt = f"""
+        template = """
         Você é um especialista em Engenharia de Requisitos. Só me entregue o json
 
         Considere os seguintes requisitos:
@@ -99,26 +428,43 @@ class GeminiService:
         }}
         ]
         """
+        analysis_by_id: Dict[str, WiegersAnalysisItem] = {}
+        pending = list(requirements)
         
         try:
-            response = self.model.generate_content(prompt)
-            # Extract JSON from response
-            response_text = response.text.strip()
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            return json.loads(response_text.strip())
+            for attempt in range(settings.GEMINI_REPAIR_ATTEMPTS + 1):
+                if attempt:
+                    logger.warning(f"Re-asking Wiegers analysis for {len(pending)} missing requirements")
+                listings = self.prompt_builder.pack(
+                    pending,
+                    lambda req, description: f"- ID: {req.id}, Título: {req.title}, Descrição: {description}, Tipo: {req.type.value}",
+                    template
+                )
+                pending_ids = {req.id for req in pending}
+                for item in await self._generate_item_batches(template, listings, WiegersAnalysisItem, "wiegers"):
+                    if item.requirement_id in pending_ids:
+                        analysis_by_id.setdefault(item.requirement_id, item)
+                pending = [req for req in pending if req.id not in analysis_by_id]
+                if not pending:
+                    break
+            return [analysis_by_id[req.id] for req in requirements if req.id in analysis_by_id]
+        except AIServiceError:
+            raise
         except Exception as e:
             raise Exception(f"Falha ao gerar análise Wiegers com IA: {str(e)}")
     
     async def sort_requirements_by_stakeholder(self, requirements: List[Requirement], stakeholder_name: str) -> List[str]:
         """Sort requirements based on stakeholder priorities using Gemini AI.
         
+        Requirements are expected in local ranking order. When they do not
+        fit one prompt, each call orders its own share and the orderings are
+        merged by relative position, ties keeping the local order. IDs the
+        model leaves out are asked for again on their own, up to
+        GEMINI_REPAIR_ATTEMPTS times, and ranked after the others; those
+        still missing are appended in local order.
+        
         Args:
-            requirements: List of requirement objects
+            requirements: List of requirement objects, best local score first
             stakeholder_name: Name of the stakeholder to consider for sorting
             
         Returns:
@@ -127,11 +473,7 @@ class GeminiService:
         Raises:
             Exception: When AI generation fails
         """
-        requirements_text = ""
-        for req in requirements:
-            requirements_text += f"- ID: {req.id}, Título: {req.title}, Descrição: {req.description or 'N/A'}, Tipo: {req.type.value}, Partes Interessadas: {', '.join(req.stakeholders)}\n"
-        
-        prompt = f"""
+        template = """
         Você é um especialista em Engenharia de Requisitos. Só me entregue o json.
 
         Considere os seguintes requisitos:
@@ -151,25 +493,72 @@ class GeminiService:
             "sorted_requirement_ids": ["id1", "id2", "id3", ...]
         }}
         """
-        
+        ranking: List[str] = []
+        pending = list(requirements)
         try:
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            result = json.loads(response_text.strip())
-            return result.get("sorted_requirement_ids", [])
+            for attempt in range(settings.GEMINI_REPAIR_ATTEMPTS + 1):
+                if attempt:
+                    logger.warning(f"Re-asking stakeholder sort for {len(pending)} left-out requirements")
+                groups = self.prompt_builder.pack_groups(
+                    pending,
+                    lambda req, description: f"- ID: {req.id}, Título: {req.title}, Descrição: {description}, Tipo: {req.type.value}, Partes Interessadas: {', '.join(req.stakeholders)}",
+                    template.format(requirements_text="", stakeholder_name=stakeholder_name)
+                )
+                if len(groups) > 1:
+                    logger.info(f"Splitting stakeholder_sort prompt across {len(groups)} calls to fit the token budget")
+                results = await asyncio.gather(*(
+                    self._generate_model(
+                        template.format(requirements_text=listing, stakeholder_name=stakeholder_name),
+                        StakeholderSortResult,
+                        "stakeholder_sort"
+                    )
+                    for _, listing in groups
+                ))
+                ranking.extend(self._merge_orderings(
+                    [req.id for req in pending],
+                    [([req.id for req in members], result.sorted_requirement_ids) for (members, _), result in zip(groups, results)]
+                ))
+                ranked = set(ranking)
+                pending = [req for req in pending if req.id not in ranked]
+                if not pending:
+                    break
+        except AIServiceError:
+            raise
         except Exception as e:
             raise Exception(f"Falha ao ordenar requisitos por parte interessada com IA: {str(e)}")
+        
+        if pending:
+            logger.warning(f"Stakeholder sort left out {len(pending)} requirements, appending them in local order")
+        return ranking + [req.id for req in pending]
+    
+    @staticmethod
+    def _merge_orderings(local_order: List[str], orderings: List[Tuple[List[str], List[str]]]) -> List[str]:
+        """Merge the orderings of several calls into one ranking of `local_order`.
+        
+        Each call's IDs are placed by their relative position in its own
+        ordering, ties broken by local order. IDs a call invented are
+        ignored and IDs it left out are missing from the result.
+        """
+        local_position = {req_id: position for position, req_id in enumerate(local_order)}
+        placed = {}
+        for members, sorted_ids in orderings:
+            member_ids = set(members)
+            ranked = []
+            for req_id in sorted_ids:
+                if req_id in member_ids and req_id not in placed and req_id not in ranked:
+                    ranked.append(req_id)
+            for position, req_id in enumerate(ranked):
+                placed[req_id] = position / len(ranked)
+        
+        return sorted(placed, key=lambda req_id: (placed[req_id], local_position[req_id]))
     
     async def generate_glossary(self, requirements: List[Requirement]) -> List[Dict[str, str]]:
         """Generate a glossary of technical terms from requirements using Gemini AI.
         
+        Requirements that do not fit the prompt token budget are split
+        across several calls; the terms of every valid call are
+        concatenated and left for the caller to deduplicate.
+        
         Args:
             requirements: List of requirement objects
             
@@ -179,15 +568,28 @@ class GeminiService:
         Raises:
             Exception: When AI generation fails
         """
-        requirements_text = ""
-        for req in requirements:
-            requirements_text += f"Título: {req.title}\n"
-            if req.description:
-                requirements_text += f"Descrição: {req.description}\n"
-            requirements_text += f"Tipo: {req.type.value}\n"
-            requirements_text += f"Partes Interessadas: {', '.join(req.stakeholders)}\n\n"
+        batches = await self.generate_glossary_batches(requirements)
+        return [term for _, terms in batches for term in terms]
+    
+    async def generate_glossary_batches(self, requirements: List[Requirement]) -> List[Tuple[List[Requirement], List[Dict[str, str]]]]:
+        """Generate glossary terms per prompt call, reporting the requirements each call covered.
+        
+        Requirements of a call whose response has rejected or no usable
+        terms are asked for again, up to GEMINI_REPAIR_ATTEMPTS times.
+        Calls that fail, or are still invalid after the repairs, are left
+        out, so their requirements can be sent again later.
         
-        prompt = f"""
+        Args:
+            requirements: List of requirement objects
+            
+        Returns:
+            `(requirements, terms)` pairs of the calls that returned valid terms
+            
+        Raises:
+            AIServiceError: When every call failed and the first failure was a model error
+            Exception: When AI generation fails for every call
+        """
+        template = """
         A partir dos requisitos a seguir: {requirements_text}, identifique termos técnicos ou ambíguos que devem ser incluídos em um glossário. Sugira definições claras e compreensíveis. RETORNE APENAS UM JSON como no exemplo:
         [
             {{
@@ -200,17 +602,43 @@ class GeminiService:
             }}
         ]
         """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+        batches = []
+        errors = []
+        pending = list(requirements)
+        for attempt in range(settings.GEMINI_REPAIR_ATTEMPTS + 1):
+            if attempt:
+                logger.warning(f"Re-asking glossary terms for {len(pending)} requirements without a valid response")
+            groups = self.prompt_builder.pack_groups(
+                pending,
+                lambda req, description: f"Título: {req.title}\nDescrição: {description}\n",
+                template
+            )
+            if len(groups) > 1:
+                logger.info(f"Splitting glossary prompt across {len(groups)} calls to fit the token budget")
+            outcomes = await asyncio.gather(*(
+                self._generate_checked_items(template.format(requirements_text=listing), GlossaryTerm, "glossary")
+                for _, listing in groups
+            ), return_exceptions=True)
             
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            return json.loads(response_text.strip())
-        except Exception as e:
-            raise Exception(f"Falha ao gerar glossário com IA: {str(e)}")
+            pending = []
+            for (members, _), outcome in zip(groups, outcomes):
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    errors.append(outcome)
+                    continue
+                terms, valid = outcome
+                if valid:
+                    batches.append((members, [term.model_dump() for term in terms]))
+                else:
+                    pending.extend(members)
+            if not pending:
+                break
+        
+        if errors:
+            logger.warning(f"{len(errors)} glossary calls failed: {str(errors[0])}")
+            if not batches:
+                if isinstance(errors[0], AIServiceError):
+                    raise errors[0]
+                raise Exception(f"Falha ao gerar glossário com IA: {str(errors[0])}")
+        return batches
@@ -0,0 +1,122 @@
+"""Token-budgeted assembly of requirement listings for LLM prompts."""
+
+import math
+from typing import Callable, List, Sequence, Tuple
+
+from backend.requirements.models.requirement import Requirement
+
+TRUNCATION_MARKER = " [...]"
+
+RequirementFormatter = Callable[[Requirement, str], str]
+
+class PromptBuilder:
+    """Builds requirement listings that fit within a prompt token budget.
+
+    Token counts are estimated from the character length of the text,
+    which is close enough to the model tokenizer to size prompts without
+    an extra API round trip. Descriptions are truncated to a per-item
+    budget, and listings that would not fit a single prompt are split
+    into several batches, each meant for a separate call.
+
+    Attributes:
+        max_input_tokens: Token budget of a whole prompt.
+        max_description_tokens: Token budget of a single description.
+        chars_per_token: Average number of characters per token.
+    """
+
+    def __init__(self, max_input_tokens: int, max_description_tokens: int, chars_per_token: float = 4.0):
+        """Initialize the PromptBuilder.
+
+        Args:
+            max_input_tokens: Token budget of a whole prompt.
+            max_description_tokens: Token budget of a single description.
+            chars_per_token: Average number of characters per token.
+        """
+        self.max_input_tokens = max_input_tokens
+        self.max_description_tokens = max_description_tokens
+        self.chars_per_token = chars_per_token
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimate the number of tokens of a text.
+
+        Args:
+            text: The text to measure.
+
+        Returns:
+            Estimated token count.
+        """
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Shorten a text to a token budget, cutting on a word boundary.
+
+        Args:
+            text: The text to shorten.
+            max_tokens: Token budget of the result.
+
+        Returns:
+            The text itself when it fits, otherwise its head followed by
+            a truncation marker, or just its head when the budget is too
+            small for the marker.
+        """
+        max_chars = max(int(max_tokens * self.chars_per_token), 0)
+        if len(text) <= max_chars:
+            return text
+        if max_chars <= len(TRUNCATION_MARKER):
+            return text[:max_chars]
+
+        head = text[:max(max_chars - len(TRUNCATION_MARKER), 0)]
+        boundary = head.rfind(" ")
+        if boundary > len(head) // 2:
+            head = head[:boundary]
+        return head.rstrip() + TRUNCATION_MARKER
+
+    def pack(self, requirements: Sequence[Requirement], formatter: RequirementFormatter, template: str) -> List[str]:
+        """Render requirements into listings that fit the prompt budget.
+
+        Args:
+            requirements: Requirements to list, in order.
+            formatter: Renders one requirement given its truncated description.
+            template: Prompt text surrounding the listing, used to size it.
+
+        Returns:
+            One listing per call needed, preserving the requirement order.
+        """
+        return [listing for _, listing in self.pack_groups(requirements, formatter, template)]
+
+    def pack_groups(self, requirements: Sequence[Requirement], formatter: RequirementFormatter, template: str) -> List[Tuple[List[Requirement], str]]:
+        """Render requirements into listings like `pack`, keeping the requirements of each listing.
+
+        A requirement whose line alone exceeds the budget still gets a
+        listing of its own rather than being dropped.
+
+        Args:
+            requirements: Requirements to list, in order.
+            formatter: Renders one requirement given its truncated description.
+            template: Prompt text surrounding the listing, used to size it.
+
+        Returns:
+            `(requirements, listing)` pairs, one per call needed, preserving
+            the requirement order.
+        """
+        available = self.max_input_tokens - self.estimate_tokens(template)
+        groups = []
+        members = []
+        lines = []
+        used = 0
+        for requirement in requirements:
+            description = self.truncate(requirement.description or "N/A", self.max_description_tokens)
+            line = formatter(requirement, description)
+            cost = self.estimate_tokens(line) + 1
+            if lines and used + cost > available:
+                groups.append((members, "\n".join(lines)))
+                members = []
+                lines = []
+                used = 0
+            members.append(requirement)
+            lines.append(line)
+            used += cost
+
+        if lines:
+            groups.append((members, "\n".join(lines)))
+        return groups
@@ -0,0 +1,220 @@
+"""Content-addressed cache for LLM prompt results."""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pymongo import ASCENDING, IndexModel
+
+from backend.config.database import get_database
+from backend.config.indexes import register_indexes
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+register_indexes("prompt_cache", [
+    IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+])
+
+class PromptCache:
+    """Two-tier cache for LLM responses keyed by a hash of model and prompt.
+
+    The first tier is an in-memory LRU with a per-entry TTL. The optional
+    second tier persists entries in the `prompt_cache` MongoDB collection
+    so they survive restarts and are shared between workers. Concurrent
+    lookups for the same key share a single upstream call.
+
+    Attributes:
+        max_entries: Maximum number of entries kept in memory.
+        ttl_seconds: Time to live of each cached entry.
+        persistent: Whether the MongoDB tier is enabled.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int, persistent: bool = False):
+        """Initialize the PromptCache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory.
+            ttl_seconds: Time to live of each cached entry.
+            persistent: Enable the MongoDB-backed tier.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._metrics = {
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        """Build the content address of a prompt.
+
+        Args:
+            model_name: Name of the model answering the prompt.
+            prompt: The prompt text.
+
+        Returns:
+            Hex SHA-256 digest of the model name and prompt.
+        """
+        return hashlib.sha256(f"{model_name}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            key: Content address built with `make_key`.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        value = self._get_memory(key)
+        if value is not None:
+            return value
+        return await self._get_below_memory(key)
+
+    async def set(self, key: str, value: str):
+        """Store a response in every enabled tier.
+
+        Args:
+            key: Content address built with `make_key`.
+            value: The response to cache.
+        """
+        self._set_memory(key, value)
+        if self.persistent:
+            await self._set_persistent(key, value)
+
+    async def get_or_create(self, key: str, factory: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached response or compute it exactly once.
+
+        Every lookup below the memory tier and the factory call run in one
+        task per key, registered before the first await, so concurrent
+        callers share it. Callers await it through `asyncio.shield`: a
+        cancelled caller, including the one that started the task, does
+        not cancel the computation the other callers are waiting for.
+
+        Args:
+            key: Content address built with `make_key`.
+            factory: Coroutine factory producing the response on a miss.
+
+        Returns:
+            The cached or freshly computed response.
+        """
+        cached = self._get_memory(key)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, factory))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish_load(key, done))
+        return await asyncio.shield(task)
+
+    async def invalidate(self, key: str):
+        """Remove an entry from every enabled tier.
+
+        Args:
+            key: Content address built with `make_key`.
+        """
+        self._entries.pop(key, None)
+        if self.persistent:
+            try:
+                await get_database().prompt_cache.delete_one({"_id": key})
+            except Exception as e:
+                logger.warning(f"Failed to invalidate prompt cache entry: {str(e)}")
+
+    def clear(self):
+        """Drop every in-memory entry."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and the current cache size.
+
+        Returns:
+            Dictionary with hit, miss and eviction counters, the number
+            of in-memory entries and the overall hit ratio.
+        """
+        hits = self._metrics["memory_hits"] + self._metrics["persistent_hits"]
+        lookups = hits + self._metrics["misses"]
+        return {
+            **self._metrics,
+            "entries": len(self._entries),
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    async def _load(self, key: str, factory: Callable[[], Awaitable[str]]) -> str:
+        cached = await self._get_below_memory(key)
+        if cached is not None:
+            return cached
+        value = await factory()
+        await self.set(key, value)
+        return value
+
+    def _finish_load(self, key: str, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self._metrics["memory_hits"] += 1
+        return value
+
+    async def _get_below_memory(self, key: str) -> Optional[str]:
+        if self.persistent:
+            value = await self._get_persistent(key)
+            if value is not None:
+                self._metrics["persistent_hits"] += 1
+                self._set_memory(key, value)
+                return value
+        self._metrics["misses"] += 1
+        return None
+
+    def _set_memory(self, key: str, value: str):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._metrics["evictions"] += 1
+
+    async def _get_persistent(self, key: str) -> Optional[str]:
+        try:
+            document = await get_database().prompt_cache.find_one(
+                {"_id": key, "expires_at": {"$gt": datetime.utcnow()}}
+            )
+        except Exception as e:
+            logger.warning(f"Prompt cache lookup failed, falling back to model: {str(e)}")
+            return None
+        return document["response"] if document else None
+
+    async def _set_persistent(self, key: str, value: str):
+        now = datetime.utcnow()
+        try:
+            await get_database().prompt_cache.replace_one(
+                {"_id": key},
+                {
+                    "response": value,
+                    "created_at": now,
+                    "expires_at": now + timedelta(seconds=self.ttl_seconds)
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist prompt cache entry: {str(e)}")
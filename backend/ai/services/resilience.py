@@ -0,0 +1,252 @@
+"""Rate limiting, retries and circuit breaking around model provider calls."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from google.api_core import exceptions as google_exceptions
+
+from backend.ai.exceptions import AIDeadlineExceededError, AIRateLimitError, AIServiceError, AIUnavailableError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ERRORS = (google_exceptions.TooManyRequests,)
+TRANSIENT_ERRORS = (google_exceptions.ServerError, asyncio.TimeoutError)
+RETRYABLE_ERRORS = RATE_LIMIT_ERRORS + TRANSIENT_ERRORS
+
+ResultT = TypeVar("ResultT")
+
+class TokenBucket:
+    """Token bucket limiting the call rate while allowing short bursts.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens, i.e. the burst size.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the TokenBucket, full.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens, i.e. the burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, timeout: float) -> bool:
+        """Take one token, waiting for the bucket to refill if needed.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            True once a token was taken, False if none is available in time.
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait = self.wait_time()
+                if wait > timeout:
+                    return False
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+            return True
+
+    def wait_time(self) -> float:
+        """Seconds until the next token becomes available."""
+        return max(1 - self._tokens, 0) / self.rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+class CircuitBreaker:
+    """Circuit breaker failing fast while a provider is degraded.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls are rejected for `reset_timeout` seconds. A single probe call is
+    then let through: its success closes the circuit, its failure opens
+    it again.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before a probe.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """Initialize the CircuitBreaker, closed.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a probe.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self):
+        """Admit a call, or reject it while the circuit is open.
+
+        Raises:
+            AIUnavailableError: When the circuit is open or a probe is running.
+        """
+        if self._opened_at is None:
+            return
+        elapsed = time.monotonic() - self._opened_at
+        if elapsed < self.reset_timeout or self._probing:
+            raise AIUnavailableError(
+                "Serviço de IA indisponível no momento, tente novamente mais tarde",
+                retry_after=max(self.reset_timeout - elapsed, 1.0)
+            )
+        self._probing = True
+
+    def record_success(self):
+        """Close the circuit after a call reached the provider."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        """Count a failed call, opening the circuit when the threshold is hit."""
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            logger.warning(f"Opening circuit after {self._failures} consecutive failures")
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self):
+        """Forget an admitted probe whose outcome is unknown, e.g. on cancellation."""
+        self._probing = False
+
+class ResilientCaller:
+    """Runs provider calls under rate limiting, retries, a breaker and a deadline.
+
+    Each provider key (e.g. a model name) gets its own token bucket and
+    circuit breaker. Rate limit and server errors are retried with
+    exponential backoff and full jitter until the retry budget or the
+    deadline of the call is exhausted; other errors propagate unchanged.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        failure_threshold: int,
+        reset_timeout: float,
+        deadline: float
+    ):
+        """Initialize the ResilientCaller.
+
+        Args:
+            rate_per_second: Sustained calls per second allowed per key.
+            burst: Calls allowed in a burst per key.
+            max_retries: Retries after the first attempt.
+            backoff_base: Backoff ceiling of the first retry, in seconds.
+            backoff_max: Maximum backoff ceiling, in seconds.
+            failure_threshold: Consecutive failures that open a circuit.
+            reset_timeout: Seconds a circuit stays open before a probe.
+            deadline: Seconds a call may take including retries and waits.
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.deadline = deadline
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """Return the circuit breaker of a provider key."""
+        if key not in self._breakers:
+            self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[key]
+
+    def bucket(self, key: str) -> TokenBucket:
+        """Return the token bucket of a provider key."""
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket(self.rate_per_second, self.burst)
+        return self._buckets[key]
+
+    async def call(self, key: str, operation: Callable[[float], Awaitable[ResultT]]) -> ResultT:
+        """Run an operation under the resilience policies of a key.
+
+        Args:
+            key: Provider key selecting the bucket and breaker, e.g. the model name.
+            operation: Coroutine factory receiving the seconds left before the deadline.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            AIRateLimitError: When the rate limit or provider quota is exhausted.
+            AIUnavailableError: When the circuit is open or server errors persist.
+            AIDeadlineExceededError: When the deadline elapses first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        breaker = self.breaker(key)
+        bucket = self.bucket(key)
+        attempt = 0
+
+        while True:
+            breaker.before_call()
+            try:
+                if not await bucket.acquire(deadline - loop.time()):
+                    breaker.release()
+                    raise AIRateLimitError("Limite de requisições à IA excedido", retry_after=bucket.wait_time())
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    breaker.release()
+                    raise AIDeadlineExceededError("Prazo da requisição à IA esgotado")
+                result = await operation(remaining)
+            except RETRYABLE_ERRORS as e:
+                breaker.record_failure()
+                attempt += 1
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+                if attempt > self.max_retries or loop.time() + delay >= deadline:
+                    raise self._translate(e, deadline - loop.time()) from e
+                logger.warning(f"Retryable error from {key} (attempt {attempt}/{self.max_retries}), retrying in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                continue
+            except AIServiceError:
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+
+            breaker.record_success()
+            return result
+
+    def _translate(self, error: BaseException, remaining: float) -> AIServiceError:
+        """Map an exhausted retryable error to the AI error reported to clients."""
+        if isinstance(error, RATE_LIMIT_ERRORS):
+            return AIRateLimitError(f"Cota da IA excedida: {str(error)}", retry_after=self.backoff_max)
+        if isinstance(error, asyncio.TimeoutError) and remaining <= 0:
+            return AIDeadlineExceededError("Prazo da requisição à IA esgotado")
+        return AIUnavailableError(f"Serviço de IA indisponível: {str(error) or type(error).__name__}", retry_after=self.reset_timeout)
@@ -0,0 +1,121 @@
+"""Tolerant parsing of JSON model responses into Pydantic models."""
+
+import json
+import logging
+from typing import Any, Iterator, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_decoder = json.JSONDecoder()
+
+def extract_json(text: str) -> Any:
+    """Decode the first complete JSON value found in a response.
+
+    Leading prose, markdown fences and trailing text around the value are
+    ignored.
+
+    Args:
+        text: Raw model response.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        ValueError: When the response contains no complete JSON value.
+    """
+    for start in _value_starts(text, "[{"):
+        try:
+            value, _ = _decoder.raw_decode(text, start)
+            return value
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("A resposta da IA não contém um JSON válido")
+
+def salvage_array(text: str) -> List[Any]:
+    """Decode the leading complete elements of a possibly truncated JSON array.
+
+    Args:
+        text: Raw model response containing a JSON array.
+
+    Returns:
+        Every element decoded before the first malformed one.
+    """
+    for start in _value_starts(text, "["):
+        items = []
+        position = start + 1
+        while True:
+            while position < len(text) and text[position] in " \t\r\n,":
+                position += 1
+            if position >= len(text) or text[position] == "]":
+                break
+            try:
+                item, position = _decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                break
+            items.append(item)
+        if items:
+            return items
+    return []
+
+def parse_items(text: str, item_model: Type[ModelT]) -> Tuple[List[ModelT], int]:
+    """Parse a JSON array response, keeping every element that validates.
+
+    A complete array, an object wrapping an array, or the intact head of a
+    truncated array are all accepted.
+
+    Args:
+        text: Raw model response.
+        item_model: Model every element is validated against.
+
+    Returns:
+        The valid items, and the number of elements that were rejected.
+    """
+    try:
+        value = extract_json(text)
+    except ValueError:
+        value = None
+    if isinstance(value, dict):
+        value = next((member for member in value.values() if isinstance(member, list)), value)
+
+    if not isinstance(value, list):
+        salvaged = salvage_array(text)
+        if salvaged:
+            logger.warning(f"Salvaged {len(salvaged)} items from a malformed JSON array")
+            value = salvaged
+        else:
+            value = [value] if value is not None else []
+
+    items = []
+    rejected = 0
+    for element in value:
+        try:
+            items.append(item_model.model_validate(element))
+        except ValidationError:
+            rejected += 1
+    return items, rejected
+
+def parse_model(text: str, model: Type[ModelT]) -> ModelT:
+    """Parse a JSON object response into a model.
+
+    Args:
+        text: Raw model response.
+        model: Model the object is validated against.
+
+    Returns:
+        The validated model instance.
+
+    Raises:
+        ValueError: When no JSON value is found or it does not validate.
+    """
+    return model.model_validate(extract_json(text))
+
+def _value_starts(text: str, openers: str) -> Iterator[int]:
+    """Yield the positions of every character that may open a JSON value."""
+    for position, character in enumerate(text):
+        if character in openers:
+            yield position
@@ -0,0 +1,4 @@
+"""Offline benchmark and load-test suite for the backend.
+
+Run with `python -m backend.benchmarks --help` from the repository root.
+"""
@@ -0,0 +1,153 @@
+"""Command line entry point of the benchmark suite.
+
+The suite needs the development requirements
+(`pip install -r backend/requirements-dev.txt`). Examples, from the
+repository root:
+
+    python -m backend.benchmarks micro --sizes 1000,10000,100000
+    python -m backend.benchmarks load --requests 2000 --concurrency 32
+    python -m backend.benchmarks micro --save-baseline baseline.json
+    python -m backend.benchmarks micro --baseline baseline.json
+    python -m backend.benchmarks explain --mongo-url mongodb://localhost:27017
+
+Everything runs offline: MongoDB is replaced by an in-memory stand-in
+unless `--mongo-url` points at a disposable local mongod, and the model by
+a template provider with simulated latency. mongomock scans are slow, so
+the 100k corpus takes tens of minutes without a local mongod. Results are only comparable
+with a baseline recorded on the same machine and settings. The exit status
+is 1 when a regression against `--baseline` is found.
+
+The explain mode needs a mongod: it seeds `--corpus` requirements and
+checks that the plans of the filtered and sorted service queries use their
+indexes, exiting with 1 when one scans a collection or picks another index.
+"""
+
+from typing import List, Optional
+import argparse
+import asyncio
+import logging
+import platform
+import sys
+import tempfile
+
+from backend.benchmarks.config import configure_environment
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks", description="Offline benchmarks of the SpecForge backend.")
+    parser.add_argument("mode", choices=["micro", "load", "explain"], help="Service microbenchmarks, HTTP load test or query plan check")
+    parser.add_argument("--mongo-url", help="Disposable local mongod to use instead of the in-memory stand-in")
+    parser.add_argument("--provider", choices=["local", "fake-gemini"], default="local", help="Offline model implementation")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per model call")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated corpus sizes for the micro mode")
+    parser.add_argument("--iterations", type=int, default=5, help="Measured runs per microbenchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests sent by each pass of the load mode")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients in the load mode")
+    parser.add_argument("--corpus", type=int, default=10000, help="Requirements seeded before the load test or the plan check")
+    parser.add_argument("--url", help="Load test a running server instead of the in-process application")
+    parser.add_argument("--baseline", help="Baseline JSON file to compare the results with")
+    parser.add_argument("--save-baseline", help="Write the results to this baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown before flagging a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Smallest absolute slowdown flagged as a regression")
+    args = parser.parse_args(argv)
+    if args.mode == "explain" and not args.mongo_url:
+        parser.error("the explain mode needs --mongo-url")
+    return args
+
+def describe_environment(args: argparse.Namespace) -> dict:
+    """Describe the settings that make two runs comparable."""
+    return {
+        "mode": args.mode,
+        "database": "mongod" if args.mongo_url else "mongomock",
+        "target": args.url or "in-process",
+        "provider": args.provider,
+        "latency": str(args.latency),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+
+async def run(args: argparse.Namespace) -> List:
+    """Start the environment, run the selected mode and return its results."""
+    import httpx
+
+    from backend.benchmarks.environment import BenchmarkEnvironment
+    from backend.benchmarks.explain import check_query_plans
+    from backend.benchmarks.load import REQUEST_TIMEOUT_SECONDS, fetch_requirement_ids, run_load_comparison
+    from backend.benchmarks.micro import run_microbenchmarks
+
+    if args.mode == "load" and args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=REQUEST_TIMEOUT_SECONDS) as client:
+            requirement_ids = await fetch_requirement_ids(client)
+            return await run_load_comparison(client, requirement_ids, args.requests, args.concurrency)
+
+    environment = BenchmarkEnvironment(args.mongo_url, args.provider, args.latency)
+    await environment.start()
+    try:
+        if args.mode == "explain":
+            return await check_query_plans(environment, args.corpus)
+        if args.mode == "micro":
+            sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+            return await run_microbenchmarks(environment, sizes, args.iterations)
+
+        from backend.main import app
+
+        requirement_ids = await environment.seed_requirements(args.corpus)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=REQUEST_TIMEOUT_SECONDS) as client:
+            return await run_load_comparison(client, requirement_ids, args.requests, args.concurrency)
+    finally:
+        await environment.stop()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks and compare them with the baseline.
+
+    Returns:
+        The process exit status.
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="specforge-benchmark-") as workdir:
+        configure_environment(workdir, args.latency, args.mongo_url)
+        from backend.benchmarks.baseline import Baseline, find_regressions, format_regressions, load_baseline, save_baseline
+        from backend.benchmarks.results import format_results
+
+        results = asyncio.run(run(args))
+
+    if args.mode == "explain":
+        from backend.benchmarks.explain import format_query_plans
+
+        print(format_query_plans(results))
+        return 0 if all(row["passed"] for row in results) else 1
+
+    print(format_results(results))
+    if args.mode == "load":
+        from backend.benchmarks.load import format_crud_comparison
+
+        print(f"\n{format_crud_comparison(results)}")
+    else:
+        from backend.benchmarks.micro import format_metrics_overhead, skipped_benchmarks
+
+        print(f"\n{format_metrics_overhead(results)}")
+        skipped = skipped_benchmarks(args.mongo_url is not None, [int(size) for size in args.sizes.split(",") if size.strip()])
+        if skipped:
+            print("\nSkipped without --mongo-url:\n" + "\n".join(f"  {line}" for line in skipped))
+    environment = describe_environment(args)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, Baseline(environment=environment, results=results))
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = load_baseline(args.baseline)
+        if baseline.environment != environment:
+            print(f"\nWarning: baseline recorded under {baseline.environment}, current run is {environment}")
+        regressions = find_regressions(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print("\n" + format_regressions(regressions))
+            return 1
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Stored baselines and regression detection."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+
+from pydantic import BaseModel, Field
+
+from backend.benchmarks.results import BenchmarkResult
+
+MIN_MEMORY_DELTA_MB = 4.0
+
+
+class Baseline(BaseModel):
+    """Results of a reference run, stored as JSON.
+
+    Attributes:
+        created_at: When the reference run finished.
+        environment: Description of the run, e.g. database backend and model
+            latency; results are only comparable under the same environment.
+        results: Result of every benchmark of the run.
+    """
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    environment: Dict[str, str] = Field(default_factory=dict)
+    results: List[BenchmarkResult] = Field(default_factory=list)
+
+
+class Regression(BaseModel):
+    """A benchmark metric that got worse than its baseline allows.
+
+    Attributes:
+        name: Benchmark name.
+        metric: Compared metric, e.g. `median_ms`.
+        baseline: Value in the baseline.
+        current: Value in the current run.
+    """
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline, e.g. 0.3 for 30% slower."""
+        return self.current / self.baseline - 1.0 if self.baseline else float("inf")
+
+def load_baseline(path: str) -> Baseline:
+    """Read a baseline file."""
+    with open(path, "r", encoding="utf-8") as baseline_file:
+        return Baseline.model_validate(json.load(baseline_file))
+
+def save_baseline(path: str, baseline: Baseline):
+    """Write a baseline file."""
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        baseline_file.write(baseline.model_dump_json(indent=2))
+        baseline_file.write("\n")
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Baseline,
+    tolerance: float,
+    min_delta_ms: float
+) -> List[Regression]:
+    """Compare results with a baseline.
+
+    A benchmark regresses when its median or p95 latency exceeds the
+    baseline by more than `tolerance` and by at least `min_delta_ms`, the
+    latter keeping sub-millisecond benchmarks from flagging noise. Load
+    results also regress when their throughput drops by more than
+    `tolerance`, memory-tracking results when their peak heap growth exceeds
+    the baseline by more than `tolerance` and by at least
+    `MIN_MEMORY_DELTA_MB`, and any result when it reports
+    errors the baseline did not have. Benchmarks missing from either side
+    are ignored.
+
+    Args:
+        results: Results of the current run.
+        baseline: Reference run.
+        tolerance: Allowed relative slowdown, e.g. 0.25 for 25%.
+        min_delta_ms: Smallest absolute slowdown reported, in milliseconds.
+
+    Returns:
+        Every regression found, in result order.
+    """
+    reference = {result.name: result for result in baseline.results}
+    regressions = []
+    for result in results:
+        expected: Optional[BenchmarkResult] = reference.get(result.name)
+        if expected is None:
+            continue
+
+        for metric in ("median_ms", "p95_ms"):
+            current, allowed = getattr(result, metric), getattr(expected, metric)
+            if current > allowed * (1.0 + tolerance) and current - allowed >= min_delta_ms:
+                regressions.append(Regression(name=result.name, metric=metric, baseline=allowed, current=current))
+
+        if result.throughput_rps is not None and expected.throughput_rps:
+            if result.throughput_rps < expected.throughput_rps * (1.0 - tolerance):
+                regressions.append(Regression(
+                    name=result.name,
+                    metric="throughput_rps",
+                    baseline=expected.throughput_rps,
+                    current=result.throughput_rps
+                ))
+
+        if result.peak_memory_mb is not None and expected.peak_memory_mb:
+            allowed = expected.peak_memory_mb
+            if result.peak_memory_mb > allowed * (1.0 + tolerance) and result.peak_memory_mb - allowed >= MIN_MEMORY_DELTA_MB:
+                regressions.append(Regression(
+                    name=result.name,
+                    metric="peak_memory_mb",
+                    baseline=allowed,
+                    current=result.peak_memory_mb
+                ))
+
+        if result.errors > expected.errors:
+            regressions.append(Regression(name=result.name, metric="errors", baseline=expected.errors, current=result.errors))
+    return regressions
+
+def format_regressions(regressions: List[Regression]) -> str:
+    """Render regressions as one line each."""
+    return "\n".join(
+        f"REGRESSION {regression.name} {regression.metric}: {regression.baseline:.2f} -> {regression.current:.2f} "
+        f"({regression.change:+.0%})"
+        for regression in regressions
+    )
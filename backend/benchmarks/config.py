@@ -0,0 +1,32 @@
+"""Settings overrides applied before the backend modules are imported."""
+
+from typing import Optional
+import os
+
+BENCHMARK_DATABASE_NAME = "specforge_benchmark"
+
+def configure_environment(workdir: str, latency: float, mongo_url: Optional[str] = None):
+    """Point the backend settings at an offline, disposable environment.
+
+    Settings are read once when `backend.config.settings` is first
+    imported, so this must run before any other backend module is loaded.
+    Environment variables take precedence over a local `.env` file.
+
+    Args:
+        workdir: Scratch directory for on-disk state such as the similarity index.
+        latency: Simulated seconds per model call.
+        mongo_url: URL of a disposable local mongod, or None for the
+            in-memory stand-in.
+    """
+    os.environ.update({
+        "MONGODB_URL": mongo_url or "mongodb://localhost:27017",
+        "DATABASE_NAME": BENCHMARK_DATABASE_NAME,
+        "AI_PROVIDER": "local",
+        "AI_TASK_ROUTES": "{}",
+        "LOCAL_PROVIDER_LATENCY_SECONDS": str(latency),
+        "GEMINI_RATE_LIMIT_PER_MINUTE": "1000000000",
+        "GEMINI_RATE_LIMIT_BURST": "1000000",
+        "PROMPT_CACHE_PERSISTENT": "false",
+        "SIMILARITY_INDEX_DIR": os.path.join(workdir, "similarity_index"),
+        "PROFILING_ADMIN_TOKEN": "",
+    })
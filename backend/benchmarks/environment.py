@@ -0,0 +1,248 @@
+"""Offline application stack used by the benchmarks."""
+
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+import random
+import shutil
+
+from bson import ObjectId
+
+from backend.ai.providers.gemini_provider import GeminiProvider
+from backend.ai.providers.local_provider import LocalProvider
+from backend.benchmarks.fake_generative_model import FakeGenerativeModel
+from backend.config import database
+from backend.config.dependencies import close_services, init_services, services
+from backend.config.indexes import ensure_indexes
+from backend.config.settings import settings
+from backend.requirements.dtos.requirement_dto import RequirementDTO
+from backend.requirements.services.similarity_service import SimilarityService
+
+SEED_BATCH_SIZE = 5000
+BASE_TIME = datetime(2024, 1, 1)
+STAKEHOLDERS = ["Ana", "Bruno", "Carla", "Diego", "Equipe Financeira", "Suporte", "Gestor de Produto", "Auditoria"]
+ACTIONS = ["Cadastrar", "Consultar", "Aprovar", "Exportar", "Notificar", "Validar", "Cancelar", "Agendar"]
+SUBJECTS = ["usuário", "pedido", "fatura recorrente", "apólice", "relatório mensal", "pagamento", "contrato", "perfil de acesso"]
+QUALIFIERS = ["por e-mail", "em lote", "com auditoria", "via API", "no painel", "com assinatura digital", "offline", "por perfil"]
+PRIORITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+LEVELS = ["LOW", "MEDIUM", "HIGH"]
+STATUSES = ["DRAFT", "REVIEW", "APPROVED", "IMPLEMENTED"]
+COLLECTIONS = ["requirements", "wiegers_matrices", "glossaries", "jobs"]
+LOCAL_TEMPLATES = LocalProvider()
+
+def requirement_document(index: int, rng: random.Random) -> dict:
+    """Build a realistic requirement document.
+
+    Args:
+        index: Position of the requirement in the corpus, made part of the title.
+        rng: Random source; a fixed seed makes the corpus reproducible.
+
+    Returns:
+        A requirement as stored in MongoDB, without `_id`.
+    """
+    action, subject, qualifier = rng.choice(ACTIONS), rng.choice(SUBJECTS), rng.choice(QUALIFIERS)
+    title = f"{action} {subject} {qualifier} #{index}"
+    return {
+        "created_at": BASE_TIME + timedelta(seconds=index),
+        "title": title,
+        "details": f"O sistema deve permitir {action.lower()} {subject} {qualifier}, registrando data, responsável e situação.",
+        "description": None if index % 3 == 0 else f"Permite que as partes interessadas possam {action.lower()} {subject} {qualifier} sem retrabalho.",
+        "stakeholders": rng.sample(STAKEHOLDERS, rng.randint(1, 3)),
+        "type": "FUNCTIONAL" if index % 4 else "NON_FUNCTIONAL",
+        "attributes": {
+            "priority": rng.choice(PRIORITIES),
+            "risk": rng.choice(LEVELS),
+            "complexity": rng.choice(LEVELS),
+            "effort_estimation": rng.randint(1, 13)
+        },
+        "version": "1.0",
+        "status": rng.choice(STATUSES)
+    }
+
+def requirement_dto(index: int, rng: random.Random) -> RequirementDTO:
+    """Build a new requirement as received by the create endpoints."""
+    document = requirement_document(index, rng)
+    del document["created_at"]
+    return RequirementDTO.model_validate(document)
+
+def _respond_like_local_provider(prompt: str) -> str:
+    """Answer a Gemini prompt with the LocalProvider template of its task."""
+    if "sorted_requirement_ids" in prompt:
+        task = "stakeholder_sort"
+    elif '"urgency"' in prompt:
+        task = "wiegers"
+    elif "glossário" in prompt:
+        task = "glossary"
+    else:
+        task = "description"
+    return LOCAL_TEMPLATES.answer(prompt, task)
+
+def _patch_mongomock() -> Callable[[], None]:
+    """Let mongomock accept the `sort` option pymongo 4.13 passes to bulk replaces and updates.
+
+    Returns:
+        A function restoring the original mongomock methods.
+    """
+    import mongomock.collection
+
+    builder = mongomock.collection.BulkOperationBuilder
+    originals = {name: builder.__dict__[name] for name in ("add_replace", "add_update")}
+    for name, original in originals.items():
+        def without_sort(self, *args, _original=original, **kwargs):
+            kwargs.pop("sort", None)
+            return _original(self, *args, **kwargs)
+
+        setattr(builder, name, without_sort)
+
+    def restore():
+        for name, original in originals.items():
+            setattr(builder, name, original)
+
+    return restore
+
+class BenchmarkEnvironment:
+    """Backend services wired to a disposable database and an offline model.
+
+    Without a MongoDB URL the database is an in-memory mongomock stand-in,
+    which needs no server but does not support `$text` search or `$convert`
+    and is much slower than mongod on large scans; absolute numbers are only
+    comparable between runs on the same backend. With a URL, a dedicated
+    database on that server is dropped before and after the run.
+
+    The model is either the template-based LocalProvider, or the Gemini
+    provider wrapping a FakeGenerativeModel so that the Gemini adapter is
+    exercised too. Both answer after `latency` seconds.
+
+    Attributes:
+        mongo_url: URL of a disposable mongod, or None for the in-memory stand-in.
+        provider: `local` or `fake-gemini`.
+        latency: Simulated seconds per model call.
+        rng: Seeded random source generating the corpus.
+    """
+
+    def __init__(self, mongo_url: Optional[str], provider: str, latency: float, seed: int = 42):
+        """Initialize the BenchmarkEnvironment.
+
+        Args:
+            mongo_url: URL of a disposable mongod, or None for the in-memory stand-in.
+            provider: `local` or `fake-gemini`.
+            latency: Simulated seconds per model call.
+            seed: Seed of the generated corpus.
+        """
+        self.mongo_url = mongo_url
+        self.provider = provider
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self._next_index = 0
+        self._restore_mongomock: Optional[Callable[[], None]] = None
+
+    @property
+    def uses_mongod(self) -> bool:
+        """Whether the benchmarks run against a real MongoDB server."""
+        return self.mongo_url is not None
+
+    async def start(self):
+        """Connect to the database, create indexes and start the shared services."""
+        if self.uses_mongod:
+            await database.connect_to_mongo()
+            await database.mongodb.client.drop_database(settings.DATABASE_NAME)
+        else:
+            import mongomock_motor
+
+            self._restore_mongomock = _patch_mongomock()
+            database.mongodb.client = mongomock_motor.AsyncMongoMockClient()
+            database.mongodb.database = database.mongodb.client[settings.DATABASE_NAME]
+
+        await ensure_indexes()
+        await init_services()
+        if self.provider == "fake-gemini":
+            model = FakeGenerativeModel(_respond_like_local_provider, latency=self.latency)
+            services.gemini.provider = GeminiProvider(None, "benchmark", model=model)
+
+    async def stop(self):
+        """Stop the services, drop the benchmark database and undo the mongomock patch."""
+        await close_services()
+        if self.uses_mongod:
+            await database.mongodb.client.drop_database(settings.DATABASE_NAME)
+        await database.close_mongo_connection()
+        shutil.rmtree(settings.SIMILARITY_INDEX_DIR, ignore_errors=True)
+        if self._restore_mongomock:
+            self._restore_mongomock()
+            self._restore_mongomock = None
+
+    async def pause_background_tasks(self):
+        """Stop the ranking rebuilds and job workers so they do not skew timings."""
+        await services.ranking.stop()
+        await services.jobs.stop()
+
+    async def reset(self):
+        """Empty every collection, the prompt cache and the similarity index.
+
+        Seeded requirements bypass the services and carry no ranking score,
+        so stakeholder listings rank on the fly until the next rescore.
+        """
+        db = database.get_database()
+        for collection_name in COLLECTIONS:
+            await db[collection_name].delete_many({})
+        services.prompt_cache.clear()
+        services.ranking.ready = False
+
+        await services.similarity.stop()
+        shutil.rmtree(settings.SIMILARITY_INDEX_DIR, ignore_errors=True)
+        similarity = SimilarityService(index_dir=settings.SIMILARITY_INDEX_DIR, dimensions=settings.SIMILARITY_DIMENSIONS)
+        await similarity.start()
+        services.similarity = similarity
+        services.requirements.similarity_service = similarity
+
+    async def seed_requirements(self, count: int) -> List[str]:
+        """Insert generated requirements directly, bypassing the services.
+
+        Args:
+            count: Number of requirements to insert.
+
+        Returns:
+            IDs of the inserted requirements, in insertion order.
+        """
+        db = database.get_database()
+        requirement_ids = []
+        for start in range(0, count, SEED_BATCH_SIZE):
+            documents = [
+                {"_id": ObjectId(), **requirement_document(self._take_index(), self.rng)}
+                for _ in range(min(SEED_BATCH_SIZE, count - start))
+            ]
+            await db.requirements.insert_many(documents, ordered=False)
+            requirement_ids.extend(str(document["_id"]) for document in documents)
+        return requirement_ids
+
+    async def seed_wiegers_matrices(self, requirement_ids: List[str]):
+        """Insert one latest Wiegers matrix per requirement with seeded scores.
+
+        Args:
+            requirement_ids: Requirements to attach a matrix to.
+        """
+        db = database.get_database()
+        now = datetime.utcnow()
+        for start in range(0, len(requirement_ids), SEED_BATCH_SIZE):
+            documents = []
+            for requirement_id in requirement_ids[start:start + SEED_BATCH_SIZE]:
+                value, urgency, cost, risk = (self.rng.randint(1, 5) for _ in range(4))
+                documents.append({
+                    "requirement_id": requirement_id,
+                    "requirement_title": "",
+                    "value": value,
+                    "urgency": urgency,
+                    "cost": cost,
+                    "risk": risk,
+                    "priority": 0.0,
+                    "latest": True,
+                    "created_at": now
+                })
+            await db.wiegers_matrices.insert_many(documents, ordered=False)
+
+    def next_requirement(self) -> RequirementDTO:
+        """Generate a new requirement for the create benchmarks."""
+        return requirement_dto(self._take_index(), self.rng)
+
+    def _take_index(self) -> int:
+        index = self._next_index
+        self._next_index += 1
+        return index
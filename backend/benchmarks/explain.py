@@ -0,0 +1,118 @@
+"""Query plan checks of the filtered and sorted queries issued by the services."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from backend.benchmarks.environment import BenchmarkEnvironment
+from backend.config import database
+from backend.requirements.dtos.requirement_filter_dto import RequirementFilterDTO
+from backend.requirements.enums.priority_level import PriorityLevel
+from backend.requirements.enums.requirement_status import RequirementStatus
+from backend.requirements.enums.requirement_type import RequirementType
+
+KEYSET_ORDER = [("_id", ASCENDING)]
+RANKING_ORDER = [("ranking_score", DESCENDING), ("_id", ASCENDING)]
+
+PlanCheck = Tuple[str, str, Dict[str, Any], List[Tuple[str, int]], Optional[Dict[str, int]], str]
+
+def plan_checks(requirement_id: str) -> List[PlanCheck]:
+    """List the service queries whose plans must use an index.
+
+    Args:
+        requirement_id: Existing requirement used as cursor and Wiegers key.
+
+    Returns:
+        `(name, collection, filter, sort, projection, expected index)` tuples.
+    """
+    cursor = ObjectId(requirement_id)
+    return [
+        ("list_page", "requirements", {"_id": {"$gt": cursor}}, KEYSET_ORDER, None, "_id_"),
+        ("filter_status", "requirements", RequirementFilterDTO(status=[RequirementStatus.APPROVED]).to_query(), KEYSET_ORDER, None, "status_id"),
+        ("filter_type", "requirements", RequirementFilterDTO(type=[RequirementType.FUNCTIONAL]).to_query(), KEYSET_ORDER, None, "type_id"),
+        ("filter_stakeholders", "requirements", RequirementFilterDTO(stakeholders=["Ana"]).to_query(), KEYSET_ORDER, None, "stakeholders_id"),
+        ("filter_priority", "requirements", RequirementFilterDTO(priority=[PriorityLevel.HIGH]).to_query(), KEYSET_ORDER, None, "priority_id"),
+        ("ranked_members", "requirements", {"$and": [{"stakeholder_keys": "ana"}]}, RANKING_ORDER, None, "stakeholder_keys_ranking_score_id"),
+        ("ranked_others", "requirements", {"$and": [{"stakeholder_keys": {"$ne": "ana"}}]}, RANKING_ORDER, None, "ranking_score_id"),
+        ("wiegers_latest_priorities", "wiegers_matrices", {"latest": True}, [], {"_id": 0, "requirement_id": 1, "priority": 1}, "latest_priority_requirement_id"),
+        ("wiegers_list", "wiegers_matrices", {"latest": True}, [("priority", DESCENDING), ("requirement_id", ASCENDING)], None, "latest_priority_requirement_id"),
+        ("wiegers_by_requirement", "wiegers_matrices", {"requirement_id": requirement_id}, [("created_at", DESCENDING), ("_id", DESCENDING)], None, "requirement_id_created_at"),
+        ("latest_glossary", "glossaries", {}, [("created_at", DESCENDING)], None, "created_at"),
+    ]
+
+async def check_query_plans(environment: BenchmarkEnvironment, corpus: int) -> List[Dict[str, Any]]:
+    """Explain every service query against a seeded corpus.
+
+    Args:
+        environment: Started benchmark environment connected to a mongod.
+        corpus: Number of requirements to seed, each with a Wiegers matrix.
+
+    Returns:
+        One row per query with the indexes and stages of its winning plan;
+        a row passes when the plan uses the expected index and scans no
+        collection.
+
+    Raises:
+        ValueError: When the environment runs on the in-memory stand-in,
+            which has no query planner.
+    """
+    if not environment.uses_mongod:
+        raise ValueError("Query plans can only be checked against a mongod, pass --mongo-url")
+
+    await environment.pause_background_tasks()
+    await environment.reset()
+    requirement_ids = await environment.seed_requirements(corpus)
+    await environment.seed_wiegers_matrices(requirement_ids)
+
+    db = database.get_database()
+    rows = []
+    for name, collection, query, sort, projection, expected_index in plan_checks(requirement_ids[len(requirement_ids) // 2]):
+        cursor = db[collection].find(query, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        plan = (await cursor.explain())["queryPlanner"]["winningPlan"]
+        stages, indexes = _plan_stages(plan)
+        rows.append({
+            "name": name,
+            "expected_index": expected_index,
+            "indexes": indexes,
+            "stages": stages,
+            "passed": "COLLSCAN" not in stages and expected_index in indexes,
+        })
+    return rows
+
+def format_query_plans(rows: List[Dict[str, Any]]) -> str:
+    """Render query plan rows as a fixed-width table."""
+    header = f"{'query':<28} {'expected index':<36} {'plan':<10} stages"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        if row["passed"]:
+            verdict = "ok"
+        elif "COLLSCAN" in row["stages"]:
+            verdict = "COLLSCAN"
+        else:
+            verdict = ",".join(row["indexes"]) or "-"
+        lines.append(f"{row['name']:<28} {row['expected_index']:<36} {verdict:<10} {' > '.join(row['stages'])}")
+    return "\n".join(lines)
+
+def _plan_stages(plan: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Collect the stages and index names of a plan tree, outermost first.
+
+    Newer servers nest the classic plan under `queryPlan`; both shapes are
+    walked the same way.
+    """
+    stages, indexes = [], []
+    pending = [plan]
+    while pending:
+        node = pending.pop(0)
+        if "queryPlan" in node:
+            node = node["queryPlan"]
+        if "stage" in node:
+            stages.append(node["stage"])
+        if "indexName" in node:
+            indexes.append(node["indexName"])
+        if "inputStage" in node:
+            pending.append(node["inputStage"])
+        pending.extend(node.get("inputStages", []))
+    return stages, indexes
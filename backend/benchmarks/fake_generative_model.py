@@ -0,0 +1,83 @@
+"""Offline stand-in for the Gemini client used to exercise the AI layer."""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Callable, List, Union
+
+
+class FakeResponse:
+    """Minimal response object exposing the attributes GeminiService reads."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.usage_metadata = None
+
+class FakeStreamResponse:
+    """Streaming response yielding the text in word-sized chunks.
+
+    Attributes:
+        cancelled: Whether the consumer abandoned the stream early.
+    """
+
+    def __init__(self, text: str, latency: float):
+        self._words = text.split(" ")
+        self._latency = latency
+        self.cancelled = False
+
+    async def __aiter__(self) -> AsyncIterator[FakeResponse]:
+        for index, word in enumerate(self._words):
+            if self._latency:
+                await asyncio.sleep(self._latency)
+            yield FakeResponse(word if index == 0 else " " + word)
+
+    def cancel(self):
+        """Record that the stream was abandoned, like cancelling the RPC."""
+        self.cancelled = True
+
+class FakeGenerativeModel:
+    """Test double for `genai.GenerativeModel` that never leaves the process.
+
+    Responses come from a fixed text or a function of the prompt, after an
+    optional simulated latency. Errors queued with `fail_next` are raised
+    by the following calls, which makes retries, backoff and the circuit
+    breaker observable without network access.
+
+    Attributes:
+        calls: Every prompt received, in order.
+        streams: Every streaming response returned, in order.
+    """
+
+    def __init__(self, responder: Union[str, Callable[[str], str]] = "{}", latency: float = 0.0):
+        """Initialize the FakeGenerativeModel.
+
+        Args:
+            responder: Response text, or a function building it from the prompt.
+            latency: Simulated seconds per call.
+        """
+        self.responder = responder
+        self.latency = latency
+        self.calls: List[str] = []
+        self.streams: List[FakeStreamResponse] = []
+        self._failures: deque = deque()
+
+    def fail_next(self, *errors: BaseException):
+        """Raise the given errors on the next calls, one per call."""
+        self._failures.extend(errors)
+
+    async def generate_content_async(self, prompt: str, stream: bool = False, **kwargs: Any) -> Any:
+        """Answer a prompt like `genai.GenerativeModel.generate_content_async`.
+
+        With `stream` set the text is returned as a `FakeStreamResponse`
+        whose chunks each take the simulated latency.
+        """
+        self.calls.append(prompt)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._failures:
+            raise self._failures.popleft()
+        text = self.responder(prompt) if callable(self.responder) else self.responder
+        if stream:
+            response = FakeStreamResponse(text, self.latency)
+            self.streams.append(response)
+            return response
+        return FakeResponse(text)
@@ -0,0 +1,174 @@
+"""HTTP load generator replaying a weighted mix of API calls."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import random
+import time
+
+import httpx
+
+from backend.benchmarks.environment import requirement_dto
+from backend.benchmarks.results import BenchmarkResult
+
+PAGE_SIZE = 50
+REQUEST_TIMEOUT_SECONDS = 60.0
+WIEGERS_BATCH_SIZE = 5
+
+RequestPlan = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+def _list_page(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    return "GET /requirement?limit", "GET", f"/requirement?limit={PAGE_SIZE}&after={rng.choice(requirement_ids)}", None
+
+def _get_by_id(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    return "GET /requirement/{id}", "GET", f"/requirement/{rng.choice(requirement_ids)}", None
+
+def _create(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    body = requirement_dto(rng.randrange(1_000_000, 2_000_000), rng).model_dump(mode="json")
+    return "POST /requirement", "POST", "/requirement", body
+
+def _create_with_ai_description(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    body = requirement_dto(rng.randrange(2_000_000, 3_000_000), rng).model_dump(mode="json")
+    return "POST /requirement/ai-description", "POST", "/requirement/ai-description", body
+
+def _analyze_wiegers(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    body = {"requirement_ids": rng.sample(requirement_ids, min(WIEGERS_BATCH_SIZE, len(requirement_ids)))}
+    return "POST /requirement/wiegers/analyze", "POST", "/requirement/wiegers/analyze", body
+
+def _similar(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    return "GET /requirement/{id}/similar", "GET", f"/requirement/{rng.choice(requirement_ids)}/similar?limit=5", None
+
+def _wiegers_weights(requirement_ids: List[str], rng: random.Random) -> RequestPlan:
+    return "GET /requirement/wiegers/weights", "GET", "/requirement/wiegers/weights", None
+
+ENDPOINT_MIX: List[Tuple[Callable[[List[str], random.Random], RequestPlan], int]] = [
+    (_list_page, 40),
+    (_get_by_id, 30),
+    (_create, 15),
+    (_similar, 10),
+    (_wiegers_weights, 5),
+    (_create_with_ai_description, 6),
+    (_analyze_wiegers, 4),
+]
+AI_BUILDERS = {_create_with_ai_description, _analyze_wiegers}
+AI_ENDPOINTS = {"POST /requirement/ai-description", "POST /requirement/wiegers/analyze"}
+
+def plan_requests(requirement_ids: List[str], total_requests: int, include_ai: bool = True, seed: int = 7) -> List[RequestPlan]:
+    """Draw a reproducible sequence of requests from the endpoint mix.
+
+    Args:
+        requirement_ids: Existing requirements the read requests refer to.
+        total_requests: Number of requests to plan.
+        include_ai: Include the endpoints calling the model.
+        seed: Seed of the random draw.
+
+    Returns:
+        `(endpoint, method, url, body)` tuples in the order they are sent.
+    """
+    rng = random.Random(seed)
+    mix = [(builder, weight) for builder, weight in ENDPOINT_MIX if include_ai or builder not in AI_BUILDERS]
+    builders = [builder for builder, _ in mix]
+    weights = [weight for _, weight in mix]
+    return [rng.choices(builders, weights)[0](requirement_ids, rng) for _ in range(total_requests)]
+
+async def fetch_requirement_ids(client: httpx.AsyncClient, count: int = 1000) -> List[str]:
+    """Read existing requirement IDs from a running server.
+
+    Raises:
+        ValueError: When the server has no requirements to read.
+    """
+    response = await client.get(f"/requirement?limit={count}")
+    response.raise_for_status()
+    requirement_ids = [requirement["_id"] for requirement in response.json()]
+    if not requirement_ids:
+        raise ValueError("The target server has no requirements; seed some before running the load test")
+    return requirement_ids
+
+async def run_load_comparison(
+    client: httpx.AsyncClient,
+    requirement_ids: List[str],
+    total_requests: int,
+    concurrency: int
+) -> List[BenchmarkResult]:
+    """Load test the CRUD mix alone, then with AI calls in flight.
+
+    The model calls of the second pass hold worker slots for the simulated
+    model latency, so comparing the `crud` rows of both passes shows how
+    much in-flight AI work slows the plain CRUD endpoints.
+
+    Args:
+        client: HTTP client bound to the server under test.
+        requirement_ids: Existing requirements the read requests refer to.
+        total_requests: Number of requests sent by each pass.
+        concurrency: Number of concurrent workers.
+
+    Returns:
+        The results of the `load[crud-only]` pass, then of the `load[with-ai]` pass.
+    """
+    crud_only = await run_load_test(
+        client, plan_requests(requirement_ids, total_requests, include_ai=False), concurrency, label="load[crud-only]"
+    )
+    with_ai = await run_load_test(
+        client, plan_requests(requirement_ids, total_requests), concurrency, label="load[with-ai]"
+    )
+    return crud_only + with_ai
+
+def format_crud_comparison(results: List[BenchmarkResult]) -> str:
+    """Summarize the CRUD p95 latency of both passes of `run_load_comparison`."""
+    crud = {result.name: result for result in results if result.name.endswith(":crud")}
+    alone, with_ai = crud["load[crud-only]:crud"], crud["load[with-ai]:crud"]
+    return (
+        f"CRUD p95: {alone.p95_ms:.2f} ms alone, {with_ai.p95_ms:.2f} ms with AI calls in flight "
+        f"({with_ai.p95_ms / alone.p95_ms - 1.0 if alone.p95_ms else 0.0:+.0%})"
+    )
+
+async def run_load_test(client: httpx.AsyncClient, requests: List[RequestPlan], concurrency: int, label: str = "load") -> List[BenchmarkResult]:
+    """Send planned requests from concurrent workers and summarize latencies.
+
+    Each worker sends its next request as soon as the previous one
+    completed, so the offered load adapts to the server (closed loop).
+    Responses with a status of 400 or above count as errors.
+
+    Args:
+        client: HTTP client bound to the server under test.
+        requests: Planned requests, consumed in order.
+        concurrency: Number of concurrent workers.
+        label: Prefix of the result names.
+
+    Returns:
+        One result per endpoint, then a `crud` result over the endpoints
+        that do not call the model and an overall `total` result.
+    """
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    pending = iter(requests)
+
+    async def worker():
+        for endpoint, method, url, body in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            if failed:
+                errors[endpoint] = errors.get(endpoint, 0) + 1
+            else:
+                samples.setdefault(endpoint, []).append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    endpoints = sorted(set(samples) | set(errors))
+    results = [
+        BenchmarkResult.from_samples(f"{label}:{endpoint}", samples.get(endpoint, []), errors.get(endpoint, 0), elapsed)
+        for endpoint in endpoints
+    ]
+    crud_endpoints = [endpoint for endpoint in endpoints if endpoint not in AI_ENDPOINTS]
+    crud_samples = [sample for endpoint in crud_endpoints for sample in samples.get(endpoint, [])]
+    results.append(BenchmarkResult.from_samples(
+        f"{label}:crud", crud_samples, sum(errors.get(endpoint, 0) for endpoint in crud_endpoints), elapsed
+    ))
+    all_samples = [sample for endpoint_samples in samples.values() for sample in endpoint_samples]
+    results.append(BenchmarkResult.from_samples(f"{label}:total", all_samples, sum(errors.values()), elapsed))
+    return results
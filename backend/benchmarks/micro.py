@@ -0,0 +1,390 @@
+"""Service-level microbenchmarks of the hot paths."""
+
+from typing import List, Optional, Tuple
+import asyncio
+import json
+import time
+
+import httpx
+import numpy as np
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.benchmarks.environment import BenchmarkEnvironment
+from backend.ai.providers.gemini_provider import GeminiProvider
+from backend.ai.services.gemini_service import GeminiService
+from backend.benchmarks.results import BenchmarkResult, measure, measure_peak_memory
+from backend.config.dependencies import get_requirements_service, services
+from backend.config.settings import settings
+from backend.core.metrics.middleware import MetricsMiddleware
+from backend.requirements.controllers.requirements_controller import REQUIREMENT_LIST_ADAPTER
+from backend.requirements.services.requirements_service import RequirementsService
+from backend.requirements.services.wiegers_priority_engine import WiegersPriorityEngine
+
+AI_WORKFLOW_SIZE = 100
+LARGE_CORPUS = 50_000
+HTTP_OVERHEAD_CORPUS = 1000
+MONGOMOCK_BULK_WRITE_LIMIT = 1000
+PAGE_SIZE = 50
+SEARCH_QUERY = "fatura recorrente"
+STAKEHOLDER = "Ana"
+
+async def run_microbenchmarks(environment: BenchmarkEnvironment, sizes: List[int], iterations: int) -> List[BenchmarkResult]:
+    """Run every microbenchmark against a fresh corpus of each size.
+
+    Args:
+        environment: Started benchmark environment.
+        sizes: Corpus sizes for the read benchmarks, e.g. 1k, 10k and 100k.
+        iterations: Measured runs per benchmark; reduced on large corpora.
+
+    Returns:
+        One result per benchmark.
+    """
+    await environment.pause_background_tasks()
+    results = []
+
+    await environment.reset()
+    results.extend(await _benchmark_writes(environment, iterations))
+
+    await environment.reset()
+    results.extend(await _benchmark_ai_workflows(environment, iterations))
+
+    await environment.reset()
+    requirement_ids = await environment.seed_requirements(HTTP_OVERHEAD_CORPUS)
+    results.extend(await _benchmark_metrics_overhead(environment, requirement_ids, iterations))
+    results.extend(await _benchmark_dependency_overhead(requirement_ids, iterations))
+
+    for size in sizes:
+        await environment.reset()
+        requirement_ids = await environment.seed_requirements(size)
+        runs = iterations if size < LARGE_CORPUS else max(1, iterations // 5)
+        results.extend(await _benchmark_reads(environment, requirement_ids, runs))
+        results.extend(await _benchmark_export_http(requirement_ids, runs))
+        results.extend(await _benchmark_wiegers_at_scale(environment, requirement_ids, runs))
+    return results
+
+def _cheap_runs(environment: BenchmarkEnvironment, size: int, runs: int) -> int:
+    """Runs of an indexed lookup, which mongomock still answers with a full scan."""
+    return runs if size >= LARGE_CORPUS and not environment.uses_mongod else runs * 10
+
+async def _benchmark_writes(environment: BenchmarkEnvironment, iterations: int) -> List[BenchmarkResult]:
+    """Single requirement creation, with and without an AI description."""
+    async def create():
+        await services.requirements.create_requirement(environment.next_requirement())
+
+    async def create_with_description():
+        await services.requirements.create_requirement_with_ai_description(environment.next_requirement())
+
+    return [
+        await measure("create_requirement", create, iterations * 10),
+        await measure("create_requirement_with_ai_description", create_with_description, iterations),
+    ]
+
+async def _benchmark_ai_workflows(environment: BenchmarkEnvironment, iterations: int) -> List[BenchmarkResult]:
+    """Wiegers analysis and glossary generation over a small corpus, with a cold prompt cache."""
+    requirement_ids = await environment.seed_requirements(AI_WORKFLOW_SIZE)
+
+    async def clear_prompt_cache():
+        services.prompt_cache.clear()
+
+    async def analyze():
+        await services.wiegers.generate_and_save_matrices(requirement_ids)
+
+    async def rebuild_glossary():
+        await services.glossary.generate_and_save_glossary(full_rebuild=True)
+
+    async def update_glossary():
+        await services.glossary.generate_and_save_glossary()
+
+    return [
+        await measure(f"wiegers_analysis[{AI_WORKFLOW_SIZE}]", analyze, iterations, setup=clear_prompt_cache),
+        await measure(f"glossary_full_rebuild[{AI_WORKFLOW_SIZE}]", rebuild_glossary, iterations, setup=clear_prompt_cache),
+        await measure(f"glossary_incremental_unchanged[{AI_WORKFLOW_SIZE}]", update_glossary, iterations),
+    ]
+
+async def _benchmark_metrics_overhead(environment: BenchmarkEnvironment, requirement_ids: List[str], iterations: int) -> List[BenchmarkResult]:
+    """The same CRUD requests through the application with and without MetricsMiddleware.
+
+    Both variants share the services and the MongoDB command listener, so
+    the difference is the cost of the middleware alone. Runs alternate
+    between the variants, which cancels out drift such as a growing
+    collection.
+    """
+    from backend.main import app
+
+    middle_id = requirement_ids[len(requirement_ids) // 2]
+    runs = iterations * 20
+    variants = {"metrics": app, "no-metrics": _without_middleware(app, MetricsMiddleware)}
+    samples = {name: [] for name in variants}
+
+    for run in range(runs + 1):
+        order = list(variants.items()) if run % 2 else list(reversed(variants.items()))
+        for name, asgi_app in order:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://benchmark") as client:
+                started = time.perf_counter()
+                responses = [
+                    await client.get(f"/requirement/{middle_id}"),
+                    await client.get(f"/requirement?limit={PAGE_SIZE}&after={middle_id}"),
+                    await client.post("/requirement", json=environment.next_requirement().model_dump(mode="json")),
+                ]
+                elapsed = time.perf_counter() - started
+            for response in responses:
+                response.raise_for_status()
+            if run > 0:
+                samples[name].append(elapsed)
+    return [BenchmarkResult.from_samples(f"http_crud[{name}]", name_samples) for name, name_samples in samples.items()]
+
+def format_metrics_overhead(results: List[BenchmarkResult]) -> str:
+    """Summarize the median CRUD overhead of MetricsMiddleware."""
+    by_name = {result.name: result for result in results}
+    instrumented, bare = by_name["http_crud[metrics]"], by_name["http_crud[no-metrics]"]
+    overhead = instrumented.median_ms / bare.median_ms - 1.0 if bare.median_ms else 0.0
+    return f"MetricsMiddleware overhead on CRUD requests: {instrumented.median_ms - bare.median_ms:+.3f} ms median ({overhead:+.2%})"
+
+def skipped_benchmarks(uses_mongod: bool, sizes: List[int]) -> List[str]:
+    """List the microbenchmarks the in-memory stand-in cannot run, with the reason.
+
+    Args:
+        uses_mongod: Whether the run targets a real MongoDB server.
+        sizes: Corpus sizes of the read benchmarks.
+
+    Returns:
+        One line per skipped benchmark; empty against a mongod.
+    """
+    if uses_mongod:
+        return []
+    skipped = [
+        f"search{sizes}: mongomock does not support $text search",
+        f"wiegers_prioritized_page{sizes}: mongomock does not support $convert",
+    ]
+    large_sizes = [size for size in sizes if size > MONGOMOCK_BULK_WRITE_LIMIT]
+    if large_sizes:
+        skipped.append(f"wiegers_recompute_priorities{large_sizes}: mongomock bulk writes scan the collection above {MONGOMOCK_BULK_WRITE_LIMIT} matrices")
+    return skipped
+
+async def _benchmark_dependency_overhead(requirement_ids: List[str], iterations: int) -> List[BenchmarkResult]:
+    """Shared service instances against building the service graph for every request.
+
+    The per-request variant rebuilds what each request constructed before
+    services were shared: a GeminiService with its own Gemini client and a
+    RequirementsService. It is measured on its own and through
+    `GET /requirement/{id}`, with the dependency overridden, alternating
+    runs with the shared variant.
+    """
+    from backend.main import app
+
+    def build_per_request() -> RequirementsService:
+        provider = GeminiProvider("benchmark", settings.GEMINI_MODEL)
+        gemini = GeminiService(services.prompt_cache, provider=provider)
+        return RequirementsService(gemini, services.ranking, services.similarity)
+
+    async def shared_lookup():
+        get_requirements_service()
+
+    async def per_request_construction():
+        build_per_request()
+
+    results = [
+        await measure("di_shared_lookup", shared_lookup, iterations * 100),
+        await measure("di_per_request_construction", per_request_construction, iterations * 100),
+    ]
+
+    middle_id = requirement_ids[len(requirement_ids) // 2]
+    variants = {"shared": {}, "per-request": {get_requirements_service: build_per_request}}
+    samples = {name: [] for name in variants}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        for run in range(iterations * 20 + 1):
+            order = list(variants.items()) if run % 2 else list(reversed(variants.items()))
+            for name, overrides in order:
+                app.dependency_overrides.update(overrides)
+                try:
+                    started = time.perf_counter()
+                    response = await client.get(f"/requirement/{middle_id}")
+                    elapsed = time.perf_counter() - started
+                finally:
+                    app.dependency_overrides.clear()
+                response.raise_for_status()
+                if run > 0:
+                    samples[name].append(elapsed)
+    results.extend(BenchmarkResult.from_samples(f"http_get_requirement[di-{name}]", name_samples) for name, name_samples in samples.items())
+    return results
+
+def _without_middleware(app: FastAPI, middleware_class: type) -> ASGIApp:
+    """Build the ASGI stack of an application without one of its user middlewares."""
+    user_middleware = app.user_middleware
+    app.user_middleware = [middleware for middleware in user_middleware if middleware.cls is not middleware_class]
+    try:
+        stack = app.build_middleware_stack()
+    finally:
+        app.user_middleware = user_middleware
+
+    async def bare_app(scope: Scope, receive: Receive, send: Send):
+        scope["app"] = app
+        await stack(scope, receive, send)
+
+    return bare_app
+
+async def _benchmark_reads(environment: BenchmarkEnvironment, requirement_ids: List[str], runs: int) -> List[BenchmarkResult]:
+    """Listing, ranking, serialization, export, similarity and search at one corpus size."""
+    size = len(requirement_ids)
+    cheap_runs = _cheap_runs(environment, size, runs)
+    middle_id = requirement_ids[size // 2]
+    requirements = await services.requirements.get_all_requirements()
+
+    async def list_all():
+        await services.requirements.get_all_requirements()
+
+    async def list_page():
+        await services.requirements.get_all_requirements(limit=PAGE_SIZE, after=middle_id)
+
+    async def list_for_stakeholder():
+        await services.requirements.get_all_requirements(stakeholder_name=STAKEHOLDER, limit=PAGE_SIZE)
+
+    async def rebuild_rankings():
+        await services.ranking.rebuild_rankings()
+
+    async def serialize_type_adapter():
+        REQUIREMENT_LIST_ADAPTER.dump_json(requirements, by_alias=True, exclude_unset=True)
+
+    async def serialize_json_encoder():
+        json.dumps(jsonable_encoder(requirements, by_alias=True, exclude_unset=True)).encode("utf-8")
+
+    async def export_documents():
+        async for _ in services.requirements.iter_requirement_documents():
+            pass
+
+    async def sync_similarity():
+        await services.similarity.sync()
+
+    async def find_similar():
+        await services.requirements.find_similar_requirements(middle_id, limit=10)
+
+    results = [
+        await measure(f"get_all_requirements[{size}]", list_all, runs),
+        await measure(f"get_all_requirements_page[{size}]", list_page, cheap_runs),
+        await measure(f"get_all_requirements_stakeholder_unranked[{size}]", list_for_stakeholder, runs),
+        await measure(f"rebuild_rankings[{size}]", rebuild_rankings, runs),
+        await measure(f"get_all_requirements_stakeholder_ranked[{size}]", list_for_stakeholder, cheap_runs),
+        await measure(f"serialize_type_adapter[{size}]", serialize_type_adapter, runs),
+        await measure(f"serialize_json_encoder[{size}]", serialize_json_encoder, runs),
+        await measure(f"export_documents[{size}]", export_documents, runs),
+        await measure(f"similarity_sync[{size}]", sync_similarity, 1, warmup=0),
+        await measure(f"find_similar[{size}]", find_similar, runs * 10),
+    ]
+
+    if environment.uses_mongod:
+        async def search():
+            await services.search.search(SEARCH_QUERY, limit=20)
+
+        results.append(await measure(f"search[{size}]", search, cheap_runs))
+    return results
+
+async def _benchmark_export_http(requirement_ids: List[str], runs: int) -> List[BenchmarkResult]:
+    """Time to first byte, total time and peak memory of the NDJSON export against listing everything.
+
+    Requests are driven straight through the ASGI interface and response
+    chunks are dropped as they arrive, so the client buffers nothing and
+    the memory growth is the server's.
+    """
+    from backend.main import app
+
+    size = len(requirement_ids)
+    results = []
+    for name, path in (("http_export", "/requirement/export"), ("http_list_all", "/requirement")):
+        first_byte_samples, total_samples = [], []
+        for run in range(runs + 1):
+            first_byte, total = await _stream_asgi_get(app, path)
+            if run > 0:
+                first_byte_samples.append(first_byte)
+                total_samples.append(total)
+
+        async def request():
+            await _stream_asgi_get(app, path)
+
+        peak_memory = await measure_peak_memory(request)
+        results.append(BenchmarkResult.from_samples(f"{name}_ttfb[{size}]", first_byte_samples))
+        results.append(BenchmarkResult.from_samples(f"{name}[{size}]", total_samples, peak_memory_mb=peak_memory))
+    return results
+
+async def _stream_asgi_get(app: ASGIApp, path: str) -> Tuple[float, float]:
+    """Send a GET request to an ASGI application and discard the response body.
+
+    Returns:
+        Seconds until the first non-empty body chunk and until the response completed.
+
+    Raises:
+        RuntimeError: When the response status is 400 or above.
+    """
+    disconnected = asyncio.Event()
+    request_sent = False
+    status_code = 500
+    first_byte: Optional[float] = None
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message):
+        nonlocal status_code, first_byte
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body") and first_byte is None:
+            first_byte = time.perf_counter() - started
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    started = time.perf_counter()
+    try:
+        await app(scope, receive, send)
+    finally:
+        disconnected.set()
+    total = time.perf_counter() - started
+    if status_code >= 400:
+        raise RuntimeError(f"GET {path} answered {status_code}")
+    return first_byte if first_byte is not None else total, total
+
+async def _benchmark_wiegers_at_scale(environment: BenchmarkEnvironment, requirement_ids: List[str], runs: int) -> List[BenchmarkResult]:
+    """Priority recomputation and the prioritized listing over one matrix per requirement.
+
+    mongomock applies each bulk update with a full collection scan, so the
+    recomputation is skipped on large in-memory corpora.
+    """
+    size = len(requirement_ids)
+    cheap_runs = _cheap_runs(environment, size, runs)
+    await environment.seed_wiegers_matrices(requirement_ids)
+    matrices = await services.wiegers.get_all()
+    columns = [np.array([getattr(matrix, name) for matrix in matrices], dtype=np.float64) for name in ("value", "urgency", "cost", "risk")]
+
+    async def compute():
+        WiegersPriorityEngine.compute(*columns, services.wiegers.weights)
+
+    async def recompute():
+        await services.wiegers.recompute_priorities()
+
+    results = [await measure(f"wiegers_engine_compute[{size}]", compute, runs * 10)]
+    if environment.uses_mongod or size <= MONGOMOCK_BULK_WRITE_LIMIT:
+        results.append(await measure(f"wiegers_recompute_priorities[{size}]", recompute, runs))
+
+    if environment.uses_mongod:
+        async def prioritized():
+            await services.wiegers.get_prioritized(limit=PAGE_SIZE)
+
+        results.append(await measure(f"wiegers_prioritized_page[{size}]", prioritized, cheap_runs))
+    return results
@@ -0,0 +1,141 @@
+"""Benchmark result model and timing helpers."""
+
+from typing import Awaitable, Callable, List, Optional
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+from pydantic import BaseModel
+
+
+class BenchmarkResult(BaseModel):
+    """Latency summary of one benchmark.
+
+    Attributes:
+        name: Unique benchmark name, used to match the baseline.
+        iterations: Number of measured runs.
+        median_ms: Median latency in milliseconds.
+        p95_ms: 95th percentile latency in milliseconds.
+        p99_ms: 99th percentile latency in milliseconds.
+        mean_ms: Mean latency in milliseconds.
+        min_ms: Fastest run in milliseconds.
+        errors: Number of failed runs, not included in the latencies.
+        throughput_rps: Completed runs per second, for load tests.
+        peak_memory_mb: Peak Python heap growth during a run, in megabytes,
+            for benchmarks that track memory.
+    """
+
+    name: str
+    iterations: int
+    median_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    min_ms: float
+    errors: int = 0
+    throughput_rps: Optional[float] = None
+    peak_memory_mb: Optional[float] = None
+
+    @classmethod
+    def from_samples(
+        cls,
+        name: str,
+        samples: List[float],
+        errors: int = 0,
+        elapsed: Optional[float] = None,
+        peak_memory_mb: Optional[float] = None
+    ) -> "BenchmarkResult":
+        """Summarize latency samples.
+
+        Args:
+            name: Benchmark name.
+            samples: Latencies of the successful runs, in seconds.
+            errors: Number of failed runs.
+            elapsed: Wall-clock seconds of the whole run, to report throughput.
+            peak_memory_mb: Peak Python heap growth of a run, in megabytes.
+
+        Returns:
+            The summarized result.
+        """
+        values = np.asarray(samples, dtype=np.float64) * 1000.0 if samples else np.zeros(1)
+        return cls(
+            name=name,
+            iterations=len(samples),
+            median_ms=float(np.median(values)),
+            p95_ms=float(np.percentile(values, 95)),
+            p99_ms=float(np.percentile(values, 99)),
+            mean_ms=float(values.mean()),
+            min_ms=float(values.min()),
+            errors=errors,
+            throughput_rps=len(samples) / elapsed if elapsed else None,
+            peak_memory_mb=peak_memory_mb
+        )
+
+
+async def measure(
+    name: str,
+    operation: Callable[[], Awaitable[object]],
+    iterations: int,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Awaitable[object]]] = None
+) -> BenchmarkResult:
+    """Time repeated runs of an async operation.
+
+    Args:
+        name: Benchmark name.
+        operation: Coroutine function to time.
+        iterations: Number of measured runs.
+        warmup: Number of untimed runs before measuring.
+        setup: Optional untimed coroutine function run before every run,
+            e.g. to clear caches.
+
+    Returns:
+        The latency summary.
+    """
+    samples = []
+    for run in range(warmup + iterations):
+        if setup is not None:
+            await setup()
+        started = time.perf_counter()
+        await operation()
+        if run >= warmup:
+            samples.append(time.perf_counter() - started)
+    return BenchmarkResult.from_samples(name, samples)
+
+async def measure_peak_memory(operation: Callable[[], Awaitable[object]]) -> float:
+    """Measure the peak Python heap growth of one run of an async operation.
+
+    Allocations are traced with tracemalloc, which slows the run down, so
+    the traced run is kept apart from the timed ones. Unlike the resident
+    set size, the traced peak is not hidden by memory the allocator kept
+    from earlier runs.
+
+    Args:
+        operation: Coroutine function to run once.
+
+    Returns:
+        Peak allocated memory above the level before the run, in megabytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        await operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / (1024 * 1024)
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Render results as a fixed-width table."""
+    header = f"{'benchmark':<48} {'runs':>6} {'median ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'errors':>7} {'rps':>9} {'mem MB':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        rps = f"{result.throughput_rps:.1f}" if result.throughput_rps is not None else "-"
+        memory = f"{result.peak_memory_mb:.1f}" if result.peak_memory_mb is not None else "-"
+        lines.append(
+            f"{result.name:<48} {result.iterations:>6} {result.median_ms:>10.2f} {result.p95_ms:>10.2f} "
+            f"{result.p99_ms:>10.2f} {result.errors:>7} {rps:>9} {memory:>8}"
+        )
+    return "\n".join(lines)
@@ -1,5 +1,6 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from .settings import settings
+from backend.core.metrics.mongo_listener import CommandMetricsListener
 
 class MongoDB:
     client: AsyncIOMotorClient = None
@@ -8,7 +9,7 @@ class MongoDB:
 mongodb = MongoDB()
 
 async def connect_to_mongo():
-    mongodb.client = AsyncIOMotorClient(settings.MONGODB_URL)
+    mongodb.client = AsyncIOMotorClient(settings.MONGODB_URL, event_listeners=[CommandMetricsListener()])
     mongodb.database = mongodb.client[settings.DATABASE_NAME]
 
 async def close_mongo_connection():
@@ -0,0 +1,146 @@
+"""Process-wide service instances exposed as FastAPI dependencies."""
+
+from typing import Optional
+import hmac
+
+from fastapi import Header, HTTPException
+
+from backend.ai.services.gemini_service import GeminiService
+from backend.ai.services.prompt_cache import PromptCache
+from backend.config.settings import settings
+from backend.requirements.services.requirements_service import RequirementsService
+from backend.requirements.services.search_service import SearchService
+from backend.requirements.services.similarity_service import SimilarityService
+from backend.requirements.services.stakeholder_ranking_service import StakeholderRankingService
+from backend.requirements.services.wiegers_service import WiegersService
+from backend.requirements.services.glossary_service import GlossaryService
+from backend.requirements.dtos.requirement_dto import RequirementDTO
+from backend.jobs.enums.job_type import JobType
+from backend.jobs.services.job_service import JobService
+from backend.profiling.services.profile_store import ProfileStore
+
+
+class Services:
+    """Container holding the services shared by every request."""
+    prompt_cache: PromptCache = None
+    gemini: GeminiService = None
+    ranking: StakeholderRankingService = None
+    similarity: SimilarityService = None
+    requirements: RequirementsService = None
+    wiegers: WiegersService = None
+    glossary: GlossaryService = None
+    search: SearchService = None
+    jobs: JobService = None
+    profiles: ProfileStore = None
+
+services = Services()
+
+async def init_services():
+    """Build the shared services once the database connection is open."""
+    services.prompt_cache = PromptCache(
+        max_entries=settings.PROMPT_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.PROMPT_CACHE_TTL_SECONDS,
+        persistent=settings.PROMPT_CACHE_PERSISTENT
+    )
+    services.gemini = GeminiService(services.prompt_cache)
+    services.ranking = StakeholderRankingService(services.gemini)
+    services.similarity = SimilarityService(
+        index_dir=settings.SIMILARITY_INDEX_DIR,
+        dimensions=settings.SIMILARITY_DIMENSIONS
+    )
+    services.requirements = RequirementsService(services.gemini, services.ranking, services.similarity)
+    services.wiegers = WiegersService(services.requirements, services.gemini, services.ranking)
+    services.glossary = GlossaryService(services.requirements, services.gemini)
+    services.search = SearchService()
+    services.jobs = JobService(
+        worker_count=settings.JOB_WORKERS,
+        poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+        stale_after=settings.JOB_STALE_SECONDS
+    )
+    _register_job_handlers(services.jobs)
+    services.profiles = ProfileStore(max_profiles=settings.PROFILING_MAX_PROFILES)
+    await services.ranking.start()
+    await services.similarity.start()
+    await services.wiegers.start()
+    await services.jobs.start()
+
+async def close_services():
+    """Release the shared services on application shutdown."""
+    if services.jobs is not None:
+        await services.jobs.stop()
+    services.jobs = None
+    services.profiles = None
+    if services.ranking is not None:
+        await services.ranking.stop()
+    if services.similarity is not None:
+        await services.similarity.stop()
+    services.search = None
+    services.glossary = None
+    services.wiegers = None
+    services.requirements = None
+    services.similarity = None
+    services.ranking = None
+    services.gemini = None
+    services.prompt_cache = None
+
+def get_prompt_cache() -> PromptCache:
+    """FastAPI dependency returning the shared PromptCache."""
+    return services.prompt_cache
+
+def get_gemini_service() -> GeminiService:
+    """FastAPI dependency returning the shared GeminiService."""
+    return services.gemini
+
+def get_requirements_service() -> RequirementsService:
+    """FastAPI dependency returning the shared RequirementsService."""
+    return services.requirements
+
+def get_wiegers_service() -> WiegersService:
+    """FastAPI dependency returning the shared WiegersService."""
+    return services.wiegers
+
+def get_glossary_service() -> GlossaryService:
+    """FastAPI dependency returning the shared GlossaryService."""
+    return services.glossary
+
+def get_search_service() -> SearchService:
+    """FastAPI dependency returning the shared SearchService."""
+    return services.search
+
+def get_job_service() -> JobService:
+    """FastAPI dependency returning the shared JobService."""
+    return services.jobs
+
+def get_profile_store() -> ProfileStore:
+    """FastAPI dependency returning the shared ProfileStore."""
+    return services.profiles
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """FastAPI dependency allowing only requests carrying the admin token.
+    
+    The token is PROFILING_ADMIN_TOKEN; without it the admin endpoints
+    are disabled.
+    
+    Raises:
+        HTTPException: 404 when no admin token is configured, 403 on a wrong token.
+    """
+    if not settings.PROFILING_ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled")
+    if not hmac.compare_digest((x_admin_token or "").encode("utf-8"), settings.PROFILING_ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+def _register_job_handlers(job_service: JobService):
+    """Wire each background job type to the service that executes it."""
+    async def run_glossary(payload: dict):
+        return await services.glossary.generate_and_save_glossary(full_rebuild=payload.get("full_rebuild", False))
+    
+    async def run_wiegers_analysis(payload: dict):
+        return await services.wiegers.generate_and_save_matrices(payload["requirement_ids"])
+    
+    async def run_ai_description(payload: dict):
+        requirement = RequirementDTO.model_validate(payload["requirement"])
+        return await services.requirements.create_requirement_with_ai_description(requirement)
+    
+    job_service.register_handler(JobType.GLOSSARY, run_glossary)
+    job_service.register_handler(JobType.WIEGERS_ANALYSIS, run_wiegers_analysis)
+    job_service.register_handler(JobType.AI_DESCRIPTION, run_ai_description)
@@ -0,0 +1,40 @@
+"""Declarative MongoDB index registry applied at application startup."""
+
+import logging
+from typing import Dict, List
+
+from pymongo import IndexModel
+
+from .database import get_database
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+_index_registry: Dict[str, List[IndexModel]] = {}
+
+def register_indexes(collection_name: str, indexes: List[IndexModel]):
+    """Declare indexes that a module needs on a collection.
+
+    Args:
+        collection_name: Name of the MongoDB collection.
+        indexes: Index definitions to create on that collection.
+    """
+    _index_registry.setdefault(collection_name, []).extend(indexes)
+
+def get_registered_indexes() -> Dict[str, List[IndexModel]]:
+    """Return a copy of every declared index grouped by collection."""
+    return {name: list(indexes) for name, indexes in _index_registry.items()}
+
+async def ensure_indexes():
+    """Create every registered index that does not exist yet.
+
+    Index creation is idempotent, so this runs on every startup. A failure
+    on one collection is logged and does not prevent the others.
+    """
+    database = get_database()
+    for collection_name, indexes in _index_registry.items():
+        try:
+            created = await database[collection_name].create_indexes(indexes)
+            logger.info(f"Ensured indexes on {collection_name}: {', '.join(created)}")
+        except Exception as e:
+            logger.error(f"Failed to ensure indexes on {collection_name}: {str(e)}")
@@ -1,10 +1,58 @@
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
-    GEMINI_API_KEY: str
-    GEMINI_MODEL: str
     MONGODB_URL: str
     DATABASE_NAME: str
+    AI_PROVIDER: str = "gemini"
+    AI_TASK_ROUTES: Dict[str, str] = {}
+    LOCAL_PROVIDER_LATENCY_SECONDS: float = 0.0
+    GEMINI_API_KEY: Optional[str] = None
+    GEMINI_MODEL: str = "gemini-2.5-flash"
+    GEMINI_MAX_CONCURRENCY: int = 4
+    GEMINI_TIMEOUT_SECONDS: float = 60.0
+    GEMINI_REPAIR_ATTEMPTS: int = 1
+    GEMINI_RATE_LIMIT_PER_MINUTE: float = 60.0
+    GEMINI_RATE_LIMIT_BURST: int = 10
+    GEMINI_MAX_RETRIES: int = 3
+    GEMINI_BACKOFF_BASE_SECONDS: float = 0.5
+    GEMINI_BACKOFF_MAX_SECONDS: float = 8.0
+    GEMINI_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    GEMINI_CIRCUIT_RESET_SECONDS: float = 30.0
+    GEMINI_DEADLINE_SECONDS: float = 120.0
+    PROMPT_CACHE_MAX_ENTRIES: int = 1024
+    PROMPT_CACHE_TTL_SECONDS: int = 86400
+    PROMPT_CACHE_PERSISTENT: bool = False
+    PROMPT_MAX_INPUT_TOKENS: int = 30000
+    PROMPT_MAX_DESCRIPTION_TOKENS: int = 300
+    EXPORT_BATCH_SIZE: int = 500
+    BULK_IMPORT_CHUNK_SIZE: int = 1000
+    BULK_IMPORT_DESCRIPTION_BATCH_SIZE: int = 10
+    WIEGERS_CHUNK_SIZE: int = 20
+    WIEGERS_MAX_PARALLEL_CHUNKS: int = 4
+    WIEGERS_CHUNK_RETRIES: int = 2
+    WIEGERS_WEIGHT_BENEFIT: float = 2.0
+    WIEGERS_WEIGHT_PENALTY: float = 1.0
+    WIEGERS_WEIGHT_COST: float = 1.0
+    WIEGERS_WEIGHT_RISK: float = 0.5
+    JOB_WORKERS: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_STALE_SECONDS: float = 900.0
+    RANKING_WEIGHT_MEMBERSHIP: float = 4.0
+    RANKING_WEIGHT_PRIORITY: float = 2.0
+    RANKING_WEIGHT_RISK: float = -0.5
+    RANKING_WEIGHT_COMPLEXITY: float = -0.5
+    RANKING_WEIGHT_EFFORT: float = -0.5
+    RANKING_WEIGHT_WIEGERS: float = 1.5
+    RANKING_AI_REFINE_TOP_N: int = 50
+    RANKING_REBUILD_INTERVAL_SECONDS: float = 300.0
+    RANKING_REBUILD_DEBOUNCE_SECONDS: float = 2.0
+    SIMILARITY_INDEX_DIR: str = "data/similarity_index"
+    SIMILARITY_DIMENSIONS: int = 512
+    SIMILARITY_DUPLICATE_THRESHOLD: float = 0.6
+    PROFILING_ADMIN_TOKEN: Optional[str] = None
+    PROFILING_MAX_PROFILES: int = 20
+    PROFILING_INTERVAL_SECONDS: float = 0.002
 
 settings = Settings()
\ No newline at end of file
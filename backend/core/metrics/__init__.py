@@ -0,0 +1 @@
+"""Core metrics package exporting Prometheus instrumentation."""
@@ -0,0 +1,53 @@
+"""ASGI middleware recording the latency of every HTTP request."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.metrics.registry import HTTP_REQUEST_DURATION, OTHER_LABEL
+
+KNOWN_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+UNMATCHED_ROUTE = "unmatched"
+
+class MetricsMiddleware:
+    """Pure ASGI middleware observing request latency by route template.
+
+    Requests are labelled with the path template of the matched route
+    (e.g. `/requirement/{requirement_id}`) rather than the raw path, and
+    unknown methods and unmatched paths share one label value, which keeps
+    the number of series bounded by the route table. Streaming responses
+    are measured until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize the MetricsMiddleware.
+
+        Args:
+            app: The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            method = scope["method"] if scope["method"] in KNOWN_METHODS else OTHER_LABEL
+            HTTP_REQUEST_DURATION.labels(
+                method,
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code)
+            ).observe(time.perf_counter() - start)
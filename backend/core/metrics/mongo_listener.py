@@ -0,0 +1,47 @@
+"""PyMongo command listener recording MongoDB command timings."""
+
+from typing import Dict, Tuple
+
+from pymongo import monitoring
+
+from backend.core.metrics.registry import MONGO_COMMAND_DURATION, MONGO_COMMAND_FAILURES, OTHER_LABEL, BoundedLabel
+
+KNOWN_COMMANDS = frozenset({
+    "find", "getMore", "insert", "update", "delete", "aggregate", "count", "distinct",
+    "findAndModify", "createIndexes", "listIndexes", "killCursors", "bulkWrite",
+})
+MAX_COLLECTIONS = 64
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Command listener observing the duration of every MongoDB command.
+
+    The collection is only present on the started event, so it is kept by
+    request ID until the command succeeds or fails. Commands outside the
+    CRUD set and collections beyond `MAX_COLLECTIONS` are reported as
+    "other".
+    """
+
+    def __init__(self):
+        """Initialize the CommandMetricsListener."""
+        self._pending: Dict[Tuple[int, Tuple], str] = {}
+        self._collections = BoundedLabel(MAX_COLLECTIONS)
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        target = event.command.get("collection") if event.command_name == "getMore" else event.command.get(event.command_name)
+        collection = self._collections(target) if isinstance(target, str) else OTHER_LABEL
+        self._pending[(event.request_id, event.connection_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        collection, command = self._labels(event)
+        MONGO_COMMAND_DURATION.labels(collection, command).observe(event.duration_micros / 1_000_000)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        collection, command = self._labels(event)
+        MONGO_COMMAND_DURATION.labels(collection, command).observe(event.duration_micros / 1_000_000)
+        MONGO_COMMAND_FAILURES.labels(collection, command).inc()
+
+    def _labels(self, event) -> Tuple[str, str]:
+        """Collection and command labels of a finished command."""
+        collection = self._pending.pop((event.request_id, event.connection_id), OTHER_LABEL)
+        command = event.command_name if event.command_name in KNOWN_COMMANDS else OTHER_LABEL
+        return collection, command
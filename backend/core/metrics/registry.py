@@ -0,0 +1,71 @@
+"""Prometheus metric definitions shared by the instrumentation."""
+
+from typing import Set
+import threading
+
+from prometheus_client import Counter, Histogram
+
+OTHER_LABEL = "other"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests by route template.",
+    ["method", "route", "status"],
+)
+
+MONGO_COMMAND_DURATION = Histogram(
+    "mongo_command_duration_seconds",
+    "Latency of MongoDB commands by collection and command.",
+    ["collection", "command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+MONGO_COMMAND_FAILURES = Counter(
+    "mongo_command_failures_total",
+    "MongoDB commands that returned an error, by collection and command.",
+    ["collection", "command"],
+)
+
+AI_CALL_DURATION = Histogram(
+    "ai_call_duration_seconds",
+    "Latency of model calls, including retries, by provider, task and outcome.",
+    ["provider", "task", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+AI_TOKENS = Counter(
+    "ai_tokens_total",
+    "Tokens consumed by model calls, by provider, task and direction.",
+    ["provider", "task", "direction"],
+)
+
+class BoundedLabel:
+    """Caps the number of distinct values a label can take.
+
+    The first `limit` distinct values are kept as they are; any later
+    value is reported as "other", so unexpected inputs cannot grow the
+    number of time series without bound.
+
+    Attributes:
+        limit: Maximum number of distinct values kept.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the BoundedLabel.
+
+        Args:
+            limit: Maximum number of distinct values kept.
+        """
+        self.limit = limit
+        self._values: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, value: str) -> str:
+        """Return the value to report for a label value."""
+        if value in self._values:
+            return value
+        with self._lock:
+            if len(self._values) < self.limit:
+                self._values.add(value)
+                return value
+        return OTHER_LABEL
@@ -0,0 +1 @@
+"""Core utilities package containing shared helper functions."""
@@ -0,0 +1,66 @@
+"""Text normalization shared by glossary, similarity and search features."""
+
+import re
+import unicodedata
+from typing import List
+
+WORD_PATTERN = re.compile(r"\w+")
+
+STOPWORDS = frozenset("""
+a ao aos as com como da das de do dos e em entre era essa esse esta este eu foi ha isso ja la mais mas me mesmo
+na nas nao no nos o os ou para pela pelas pelo pelos por qual quando que se sem ser seu sua sao so tambem te tem
+um uma umas uns deve devem pode podem sistema
+an and are be by for from in is it of on or the this to with
+""".split())
+
+SUFFIXES = (
+    "amentos", "imentos", "amento", "imento", "idades", "acoes", "icoes", "aveis", "iveis",
+    "idade", "mente", "istas", "ismos", "acao", "icao", "avel", "ivel", "ista", "ismo",
+    "ores", "oes", "ais", "eis", "es", "s", "a", "o", "e",
+)
+
+def fold_text(text: str) -> str:
+    """Remove accents, fold case and collapse whitespace.
+
+    Args:
+        text: Text to normalize.
+
+    Returns:
+        The folded text, e.g. "Autenticação  de Usuário" -> "autenticacao de usuario".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(without_accents.casefold().split())
+
+def stem(word: str) -> str:
+    """Reduce a folded Portuguese word to a light stem.
+
+    Strips a single inflectional or derivational suffix, trying the
+    longest first, while keeping at least three characters, which merges plurals, gender and common
+    nominalizations (e.g. "autenticacao" and "autenticacoes"). A plain
+    plural "s" is removed before the suffix so that "usuarios" and
+    "usuario" share a stem.
+
+    Args:
+        word: Folded word.
+
+    Returns:
+        The stem.
+    """
+    if word.endswith("s") and not word.endswith(SUFFIXES[:-4]) and len(word) > 4:
+        word = word[:-1]
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+def tokenize(text: str) -> List[str]:
+    """Split text into folded, stemmed tokens without stopwords.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        Stems in order of appearance.
+    """
+    return [stem(word) for word in WORD_PATTERN.findall(fold_text(text)) if word not in STOPWORDS and len(word) > 1]
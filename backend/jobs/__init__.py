@@ -0,0 +1 @@
+"""Jobs package for running long operations in the background."""
@@ -0,0 +1,44 @@
+"""Jobs API controller for polling background job status and results."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+import logging
+
+from backend.jobs.models.job import Job
+from backend.jobs.services.job_service import JobService
+from backend.config.dependencies import get_job_service
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.get("/{job_id}", response_model=Job)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=60, description="Seconds to long-poll until the job finishes"),
+    service: JobService = Depends(get_job_service)
+):
+    """Get the status and, once finished, the result of a job.
+    
+    Args:
+        job_id: The unique identifier of the job.
+        wait: Seconds to wait for the job to finish before answering.
+        
+    Returns:
+        The job in its latest state.
+        
+    Raises:
+        HTTPException: When job ID is invalid or job not found.
+    """
+    try:
+        job = await service.wait_for_job(job_id, wait) if wait else await service.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to retrieve job: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve job: {str(e)}")
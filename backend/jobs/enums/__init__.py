@@ -0,0 +1,6 @@
+"""Enums package for jobs module."""
+
+from .job_status import JobStatus
+from .job_type import JobType
+
+__all__ = ["JobStatus", "JobType"]
@@ -0,0 +1,12 @@
+"""Job status enumeration."""
+
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """Enumeration for background job states."""
+    
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
@@ -0,0 +1,11 @@
+"""Job type enumeration."""
+
+from enum import Enum
+
+
+class JobType(str, Enum):
+    """Enumeration for the operations that can run as background jobs."""
+    
+    GLOSSARY = "GLOSSARY"
+    WIEGERS_ANALYSIS = "WIEGERS_ANALYSIS"
+    AI_DESCRIPTION = "AI_DESCRIPTION"
@@ -0,0 +1,5 @@
+"""Models package for jobs module."""
+
+from .job import Job
+
+__all__ = ["Job"]
@@ -0,0 +1,43 @@
+"""Job model definition."""
+
+from typing import Any, Dict, Optional
+from datetime import datetime
+from bson import ObjectId
+from pydantic import ConfigDict, Field
+
+from backend.core.models.base_model import BaseModel
+from backend.jobs.enums.job_status import JobStatus
+from backend.jobs.enums.job_type import JobType
+
+class Job(BaseModel):
+    """Job model tracking a long-running operation executed in the background."""
+    
+    id: Optional[str] = Field(None, alias="_id")
+    type: JobType = Field(..., description="Operation executed by the job")
+    status: JobStatus = Field(JobStatus.QUEUED, description="Current job state")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Input of the operation")
+    result: Optional[Any] = Field(None, description="Output of the operation once it succeeded")
+    error: Optional[str] = Field(None, description="Error message once the job failed")
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_encoders={
+            ObjectId: str,
+            datetime: lambda v: v.isoformat() if v else None
+        }
+    )
+    
+    @classmethod
+    def from_mongo(cls, data: dict):
+        """Create a Job instance from MongoDB document."""
+        if data is None:
+            return None
+        
+        if "_id" in data:
+            data["id"] = str(data["_id"])
+            del data["_id"]
+        
+        return cls(**data)
@@ -0,0 +1,238 @@
+"""Job service for queueing and executing long-running operations."""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+import asyncio
+import hashlib
+import json
+import logging
+
+from backend.config.database import get_database
+from backend.config.indexes import register_indexes
+from backend.jobs.enums.job_status import JobStatus
+from backend.jobs.enums.job_type import JobType
+from backend.jobs.models.job import Job
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED}
+SUBMIT_ATTEMPTS = 3
+
+register_indexes("jobs", [
+    IndexModel([("status", ASCENDING), ("created_at", ASCENDING)], name="status_created_at"),
+    IndexModel(
+        [("dedupe_key", ASCENDING)],
+        name="active_dedupe_key",
+        unique=True,
+        partialFilterExpression={"active": True}
+    ),
+])
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+class JobService:
+    """Service class for the MongoDB-backed background job queue.
+
+    Jobs are persisted in the `jobs` collection and executed by worker
+    tasks running inside the application. Submitting a job whose type and
+    payload match a queued or running job returns that job instead of
+    creating a new one.
+
+    Attributes:
+        worker_count: Number of worker tasks consuming the queue.
+        poll_interval: Seconds between queue polls when idle.
+        stale_after: Seconds after which a running job is considered abandoned.
+    """
+
+    def __init__(self, worker_count: int, poll_interval: float, stale_after: float):
+        """Initialize the JobService.
+
+        Args:
+            worker_count: Number of worker tasks consuming the queue.
+            poll_interval: Seconds between queue polls when idle.
+            stale_after: Seconds after which a running job is considered abandoned.
+        """
+        self.db = get_database()
+        self.worker_count = worker_count
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._handlers: Dict[JobType, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    def register_handler(self, job_type: JobType, handler: JobHandler):
+        """Register the coroutine executing jobs of a given type.
+
+        Args:
+            job_type: The job type handled.
+            handler: Coroutine receiving the job payload and returning its result.
+        """
+        self._handlers[job_type] = handler
+
+    async def start(self):
+        """Requeue abandoned jobs and start the worker tasks."""
+        stale_before = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        requeued = await self.db.jobs.update_many(
+            {"status": JobStatus.RUNNING.value, "started_at": {"$lt": stale_before}},
+            {"$set": {"status": JobStatus.QUEUED.value, "started_at": None}}
+        )
+        if requeued.modified_count:
+            logger.warning(f"Requeued {requeued.modified_count} abandoned jobs")
+
+        self._workers = [asyncio.create_task(self._worker_loop()) for _ in range(self.worker_count)]
+        logger.info(f"Started {self.worker_count} job workers")
+
+    async def stop(self):
+        """Cancel the worker tasks and wait for them to finish."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, job_type: JobType, payload: Dict[str, Any]) -> Job:
+        """Queue a job, reusing an active job with the same inputs.
+
+        Args:
+            job_type: The operation to run.
+            payload: JSON-serializable input of the operation.
+
+        Returns:
+            The queued job, or the already active job with the same inputs.
+
+        Raises:
+            Exception: When the insert keeps conflicting with an active job
+                that can no longer be found, e.g. because it completed in
+                between or the unique partial index is not honoured.
+        """
+        dedupe_key = self._dedupe_key(job_type, payload)
+        for _ in range(SUBMIT_ATTEMPTS):
+            job_doc = {
+                "type": job_type.value,
+                "status": JobStatus.QUEUED.value,
+                "payload": payload,
+                "dedupe_key": dedupe_key,
+                "active": True,
+                "created_at": datetime.utcnow()
+            }
+            try:
+                await self.db.jobs.insert_one(job_doc)
+                break
+            except DuplicateKeyError:
+                existing_doc = await self.db.jobs.find_one({"dedupe_key": dedupe_key, "active": True})
+                if existing_doc:
+                    logger.info(f"Reusing active {job_type.value} job {existing_doc['_id']}")
+                    return Job.from_mongo(existing_doc)
+        else:
+            raise Exception(
+                f"Failed to queue {job_type.value} job: the insert kept conflicting with "
+                f"an active job that could not be found after {SUBMIT_ATTEMPTS} attempts"
+            )
+
+        self._wakeup.set()
+        logger.info(f"Queued {job_type.value} job {job_doc['_id']}")
+        return Job.from_mongo(job_doc)
+
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """Retrieve a job by its ID.
+
+        Args:
+            job_id: The unique identifier of the job.
+
+        Returns:
+            The job if found, None otherwise.
+
+        Raises:
+            ValueError: When the job ID is invalid.
+        """
+        if not ObjectId.is_valid(job_id):
+            raise ValueError("Invalid job ID format")
+
+        job_doc = await self.db.jobs.find_one({"_id": ObjectId(job_id)})
+        return Job.from_mongo(job_doc) if job_doc else None
+
+    async def wait_for_job(self, job_id: str, timeout: float) -> Optional[Job]:
+        """Long-poll a job until it finishes or the timeout elapses.
+
+        Args:
+            job_id: The unique identifier of the job.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            The job in its latest state, None if it does not exist.
+
+        Raises:
+            ValueError: When the job ID is invalid.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            job = await self.get_job(job_id)
+            remaining = deadline - loop.time()
+            if job is None or job.status in TERMINAL_STATUSES or remaining <= 0:
+                return job
+            await asyncio.sleep(min(self.poll_interval, remaining))
+
+    async def _worker_loop(self):
+        """Claim and run queued jobs until cancelled."""
+        while True:
+            try:
+                job_doc = await self._claim_next()
+            except Exception as e:
+                logger.error(f"Failed to claim next job: {str(e)}")
+                job_doc = None
+
+            if job_doc is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(job_doc)
+
+    async def _claim_next(self) -> Optional[dict]:
+        """Atomically move the oldest queued job to the running state."""
+        return await self.db.jobs.find_one_and_update(
+            {"status": JobStatus.QUEUED.value},
+            {"$set": {"status": JobStatus.RUNNING.value, "started_at": datetime.utcnow()}},
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _run(self, job_doc: dict):
+        """Execute a claimed job and record its outcome."""
+        job_id = job_doc["_id"]
+        handler = self._handlers.get(JobType(job_doc["type"]))
+        try:
+            if handler is None:
+                raise Exception(f"No handler registered for job type {job_doc['type']}")
+            result = await handler(job_doc["payload"])
+            update = {
+                "status": JobStatus.SUCCEEDED.value,
+                "result": jsonable_encoder(result, by_alias=True)
+            }
+            logger.info(f"Job {job_id} succeeded")
+        except asyncio.CancelledError:
+            await self.db.jobs.update_one(
+                {"_id": job_id},
+                {"$set": {"status": JobStatus.QUEUED.value, "started_at": None}}
+            )
+            raise
+        except Exception as e:
+            update = {"status": JobStatus.FAILED.value, "error": str(e)}
+            logger.error(f"Job {job_id} failed: {str(e)}")
+
+        update.update({"active": False, "finished_at": datetime.utcnow()})
+        await self.db.jobs.update_one({"_id": job_id}, {"$set": update})
+
+    @staticmethod
+    def _dedupe_key(job_type: JobType, payload: Dict[str, Any]) -> str:
+        """Hash the job type and canonical payload."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(f"{job_type.value}:{canonical}".encode("utf-8")).hexdigest()
@@ -1,14 +1,26 @@
 """FastAPI application entry point for SpecForge backend."""
 
-from fastapi import FastAPI
+import math
+
+from fastapi import FastAPI, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-import google.generativeai as genai
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from backend.config.settings import settings
+from backend.ai.exceptions import AIServiceError
+from backend.ai.services.gemini_service import GeminiService
 from backend.config.database import connect_to_mongo, close_mongo_connection
+from backend.config.indexes import ensure_indexes
+from backend.config.dependencies import init_services, close_services, get_gemini_service, get_profile_store
+from backend.config.settings import settings
+from backend.core.metrics.middleware import MetricsMiddleware
 from backend.requirements.controllers.requirements_controller import router as requirements_router
+from backend.ai.controllers.ai_controller import router as ai_router
+from backend.jobs.controllers.jobs_controller import router as jobs_router
+from backend.profiling.controllers.profiling_controller import router as profiling_router
+from backend.profiling.middleware import ProfilingMiddleware
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -17,21 +29,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Possible-Duplicates", "X-Profile-Id"],
 )
+app.add_middleware(MetricsMiddleware)
+if settings.PROFILING_ADMIN_TOKEN:
+    app.add_middleware(
+        ProfilingMiddleware,
+        admin_token=settings.PROFILING_ADMIN_TOKEN,
+        interval=settings.PROFILING_INTERVAL_SECONDS,
+        get_store=get_profile_store
+    )
 
-app.include_router(requirements_router)
+@app.exception_handler(AIServiceError)
+async def ai_service_error_handler(request: Request, exc: AIServiceError):
+    """Report model provider failures with their status code and retry hint.
+    
+    Returns:
+        429 when rate limited, 503 when unavailable, 504 on deadline.
+    """
+    headers = {"Retry-After": str(math.ceil(exc.retry_after))} if exc.retry_after else None
+    return ORJSONResponse(status_code=exc.status_code, content={"detail": str(exc)}, headers=headers)
 
-genai.configure(api_key=settings.GEMINI_API_KEY)
-model = genai.GenerativeModel(settings.GEMINI_MODEL)
+app.include_router(requirements_router)
+app.include_router(ai_router)
+app.include_router(jobs_router)
+app.include_router(profiling_router)
 
 @app.on_event("startup")
 async def startup_db_client():
-    """Initialize database connection on application startup."""
+    """Initialize database connection, indexes and shared services on application startup."""
     await connect_to_mongo()
+    await ensure_indexes()
+    await init_services()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    """Close database connection on application shutdown."""
+    """Release shared services and close database connection on application shutdown."""
+    await close_services()
     await close_mongo_connection()
 
 @app.get("/")
@@ -43,12 +77,21 @@ def read_root():
     """
     return {"Hello" : "World"}
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Export request, MongoDB and AI metrics in the Prometheus text format.
+    
+    Returns:
+        Metrics of this application process.
+    """
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 @app.get("/model")
-def get_response():
+async def get_response(gemini_service: GeminiService = Depends(get_gemini_service)):
     """Test endpoint for AI model integration.
     
     Returns:
         Response from the AI model.
     """
-    response = model.generate_content("Explain how AI works in a few words")
-    return {"response": response.text}
\ No newline at end of file
+    response = await gemini_service.generate_text("Explain how AI works in a few words")
+    return {"response": response}
\ No newline at end of file
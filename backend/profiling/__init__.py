@@ -0,0 +1 @@
+"""Profiling package for capturing per-request sampling profiles."""
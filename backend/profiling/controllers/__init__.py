@@ -0,0 +1 @@
+"""Controllers package for API endpoints."""
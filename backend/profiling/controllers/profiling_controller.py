@@ -0,0 +1,50 @@
+"""Profiling API controller for retrieving captured request profiles."""
+
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from backend.config.dependencies import get_profile_store, require_admin
+from backend.profiling.models.profile_summary import ProfileSummary
+from backend.profiling.services.profile_store import CapturedProfile, ProfileStore
+
+router = APIRouter(prefix="/profiles", tags=["profiling"], dependencies=[Depends(require_admin)])
+
+def _get_profile(profile_id: str, store: ProfileStore) -> CapturedProfile:
+    """Look up a profile or answer 404 when it was never captured or was evicted."""
+    profile = store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
+@router.get("", response_model=List[ProfileSummary])
+async def list_profiles(store: ProfileStore = Depends(get_profile_store)):
+    """List the profiles kept in the ring buffer.
+    
+    Returns:
+        Profile summaries, newest first.
+    """
+    return store.list()
+
+@router.get("/{profile_id}/collapsed")
+async def get_collapsed_stacks(profile_id: str, store: ProfileStore = Depends(get_profile_store)):
+    """Get the collapsed stacks of a profile, one `stack count` per line.
+    
+    Args:
+        profile_id: The ID returned in the X-Profile-Id header.
+        
+    Returns:
+        Plain-text collapsed stacks, usable with flamegraph tools.
+    """
+    return Response(content=_get_profile(profile_id, store).collapsed, media_type="text/plain")
+
+@router.get("/{profile_id}/flamegraph")
+async def get_flamegraph(profile_id: str, store: ProfileStore = Depends(get_profile_store)):
+    """Get the flamegraph of a profile.
+    
+    Args:
+        profile_id: The ID returned in the X-Profile-Id header.
+        
+    Returns:
+        The flamegraph as an SVG image.
+    """
+    return Response(content=_get_profile(profile_id, store).flamegraph, media_type="image/svg+xml")
@@ -0,0 +1,100 @@
+"""ASGI middleware profiling the requests that ask for it."""
+
+from datetime import datetime
+from typing import Callable, Optional
+from urllib.parse import parse_qs
+import asyncio
+import hmac
+import logging
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.profiling.models.profile_summary import ProfileSummary
+from backend.profiling.services.profile_store import ProfileStore
+from backend.profiling.services.sampling_profiler import SamplingProfiler
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+PROFILE_QUERY_PARAMETER = "profile"
+TRUTHY = {"1", "true", "yes"}
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware running a sampling profiler for flagged requests.
+
+    A request is profiled when it sets the `X-Profile` header or the
+    `profile` query parameter and carries the admin token in
+    `X-Admin-Token`; any other request passes straight through. The
+    profile ID is returned in the `X-Profile-Id` response header. The
+    middleware is only installed when an admin token is configured.
+
+    Attributes:
+        admin_token: Token that allows a request to be profiled.
+        interval: Seconds between two stack samples.
+    """
+
+    def __init__(self, app: ASGIApp, admin_token: str, interval: float, get_store: Callable[[], Optional[ProfileStore]]):
+        """Initialize the ProfilingMiddleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            admin_token: Token that allows a request to be profiled.
+            interval: Seconds between two stack samples.
+            get_store: Returns the store receiving the profiles, None before startup.
+        """
+        self.app = app
+        self.admin_token = admin_token.encode("utf-8")
+        self.interval = interval
+        self.get_store = get_store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        store = self.get_store() if scope["type"] == "http" else None
+        if store is None or not self._profiling_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex[:16]
+        status_code = 500
+
+        async def send_with_profile_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile_id.encode("ascii"))]
+            await send(message)
+
+        created_at = datetime.utcnow()
+        start = time.perf_counter()
+        profiler = SamplingProfiler(asyncio.current_task(), self.interval)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            stacks = profiler.stop()
+            summary = ProfileSummary(
+                id=profile_id,
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                duration_seconds=time.perf_counter() - start,
+                sample_count=sum(stacks.values()),
+                created_at=created_at
+            )
+            store.add(summary, stacks)
+            logger.info(f"Captured profile {profile_id} of {scope['method']} {scope['path']} with {summary.sample_count} samples")
+
+    def _profiling_requested(self, scope: Scope) -> bool:
+        """Check the profiling flag and the admin token of a request."""
+        headers = dict(scope["headers"])
+        flagged = headers.get(PROFILE_HEADER, b"").decode("latin-1").lower() in TRUTHY
+        query_string = scope.get("query_string", b"")
+        if not flagged and PROFILE_QUERY_PARAMETER.encode("ascii") in query_string:
+            values = parse_qs(query_string.decode("latin-1")).get(PROFILE_QUERY_PARAMETER, [])
+            flagged = any(value.lower() in TRUTHY for value in values)
+        if not flagged:
+            return False
+        return hmac.compare_digest(headers.get(ADMIN_TOKEN_HEADER, b""), self.admin_token)
@@ -0,0 +1,5 @@
+"""Models package for profiling module."""
+
+from .profile_summary import ProfileSummary
+
+__all__ = ["ProfileSummary"]
@@ -0,0 +1,15 @@
+"""Profile summary model definition."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class ProfileSummary(BaseModel):
+    """Metadata of a captured request profile."""
+    id: str = Field(..., description="Identifier used to retrieve the profile")
+    method: str = Field(..., description="HTTP method of the profiled request")
+    path: str = Field(..., description="Path of the profiled request")
+    status_code: int = Field(..., description="Response status code")
+    duration_seconds: float = Field(..., description="Wall-clock duration of the request")
+    sample_count: int = Field(..., description="Number of stack samples taken")
+    created_at: datetime = Field(..., description="When the request started")
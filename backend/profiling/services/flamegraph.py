@@ -0,0 +1,75 @@
+"""SVG flamegraph rendering of collapsed stacks."""
+
+from typing import Dict, List, Mapping
+from xml.sax.saxutils import escape
+import zlib
+
+FRAME_HEIGHT = 16
+WIDTH = 1200
+MIN_LABEL_WIDTH = 30
+CHAR_WIDTH = 7
+
+def render_flamegraph(stacks: Mapping[str, int], title: str) -> str:
+    """Render collapsed stacks as a self-contained SVG flamegraph.
+
+    Frames are drawn bottom-up with a width proportional to their share of
+    samples, siblings sorted by name as in the reference flamegraph tool.
+    Hovering a frame shows its name, sample count and percentage.
+
+    Args:
+        stacks: Number of samples for each `outer;...;inner` stack.
+        title: Title drawn above the graph.
+
+    Returns:
+        The SVG document.
+    """
+    root = _build_tree(stacks)
+    total = root["count"] or 1
+    depth = _depth(root)
+    height = (depth + 2) * FRAME_HEIGHT
+
+    rectangles: List[str] = []
+    _draw(root["children"], 0.0, depth, total, rectangles)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{height}" font-family="monospace" font-size="11">'
+        f'<rect width="100%" height="100%" fill="#fafafa"/>'
+        f'<text x="{WIDTH / 2}" y="12" text-anchor="middle">{escape(title)} ({root["count"]} samples)</text>'
+        + "".join(rectangles)
+        + "</svg>"
+    )
+
+def _build_tree(stacks: Mapping[str, int]) -> Dict:
+    root = {"count": 0, "children": {}}
+    for stack, count in stacks.items():
+        root["count"] += count
+        node = root
+        for name in stack.split(";"):
+            node = node["children"].setdefault(name, {"count": 0, "children": {}})
+            node["count"] += count
+    return root
+
+def _depth(node: Dict) -> int:
+    return max((1 + _depth(child) for child in node["children"].values()), default=0)
+
+def _draw(children: Dict[str, Dict], x: float, level: int, total: int, rectangles: List[str]):
+    """Append the rectangles of a subtree, `level` rows above the bottom."""
+    for name in sorted(children):
+        child = children[name]
+        width = child["count"] / total * WIDTH
+        y = level * FRAME_HEIGHT
+        label = escape(name)
+        text = ""
+        if width >= MIN_LABEL_WIDTH:
+            visible = label[:int(width / CHAR_WIDTH) - 1]
+            text = f'<text x="{x + 3:.1f}" y="{y + 11}">{visible}</text>'
+        rectangles.append(
+            f'<g><title>{label} ({child["count"]} samples, {child["count"] / total:.1%})</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{width:.1f}" height="{FRAME_HEIGHT - 1}" fill="{_color(name)}"/>{text}</g>'
+        )
+        _draw(child["children"], x, level - 1, total, rectangles)
+        x += width
+
+def _color(name: str) -> str:
+    """Pick a stable warm color for a frame name."""
+    seed = zlib.crc32(name.encode("utf-8"))
+    return f"rgb({205 + seed % 50},{(seed >> 8) % 180},{(seed >> 16) % 55})"
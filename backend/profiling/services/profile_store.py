@@ -0,0 +1,57 @@
+"""In-memory ring buffer of captured request profiles."""
+
+from collections import OrderedDict
+from typing import List, Mapping, Optional
+import threading
+
+from backend.profiling.models.profile_summary import ProfileSummary
+from backend.profiling.services.flamegraph import render_flamegraph
+
+class CapturedProfile:
+    """A captured profile: its summary, collapsed stacks and flamegraph."""
+
+    def __init__(self, summary: ProfileSummary, collapsed: str, flamegraph: str):
+        self.summary = summary
+        self.collapsed = collapsed
+        self.flamegraph = flamegraph
+
+class ProfileStore:
+    """Keeps the last `max_profiles` request profiles in memory.
+
+    Attributes:
+        max_profiles: Number of profiles kept; the oldest is dropped first.
+    """
+
+    def __init__(self, max_profiles: int):
+        """Initialize the ProfileStore.
+
+        Args:
+            max_profiles: Number of profiles kept; the oldest is dropped first.
+        """
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, CapturedProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, summary: ProfileSummary, stacks: Mapping[str, int]):
+        """Store a profile, rendering its collapsed stacks and flamegraph.
+
+        Args:
+            summary: Metadata of the profiled request.
+            stacks: Number of samples for each collapsed stack.
+        """
+        collapsed = "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+        flamegraph = render_flamegraph(stacks, f"{summary.method} {summary.path}")
+        with self._lock:
+            self._profiles[summary.id] = CapturedProfile(summary, collapsed, flamegraph)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[CapturedProfile]:
+        """Retrieve a stored profile by ID, None once it has been evicted."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[ProfileSummary]:
+        """Summaries of the stored profiles, newest first."""
+        with self._lock:
+            return [profile.summary for profile in reversed(self._profiles.values())]
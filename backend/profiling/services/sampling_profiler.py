@@ -0,0 +1,109 @@
+"""Sampling profiler attributing wall-clock time of one asyncio task."""
+
+from collections import Counter
+from types import CodeType, FrameType
+from typing import List, Optional
+import asyncio
+import os
+import sys
+import threading
+
+IDLE_FRAME = "[awaiting]"
+SITE_PACKAGES = "site-packages" + os.sep
+PROJECT_DIR = "backend" + os.sep
+
+class SamplingProfiler:
+    """Samples the stack of one asyncio task from a background thread.
+
+    Every `interval` seconds the profiler reads the task's coroutine chain.
+    When the task is running, the synchronous frames the event loop thread
+    is executing below the innermost coroutine are appended, which shows
+    CPU work such as model validation. When the task is suspended, the
+    stack ends at the `await` it is blocked on, followed by an
+    `[awaiting]` marker, which attributes waiting time to MongoDB or model
+    calls. Samples are aggregated into collapsed stacks, the input format
+    of flamegraph tools.
+
+    Attributes:
+        interval: Seconds between two samples.
+    """
+
+    def __init__(self, task: asyncio.Task, interval: float):
+        """Initialize the SamplingProfiler.
+
+        Args:
+            task: The task to profile, usually the current request task.
+            interval: Seconds between two samples.
+        """
+        self.interval = interval
+        self._task = task
+        self._loop_thread_id = threading.get_ident()
+        self._stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """Stop sampling and return the collapsed stacks.
+
+        Returns:
+            Number of samples for each `outer;...;inner` stack.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self._stacks
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            stack = self._sample()
+            if stack:
+                self._stacks[";".join(stack)] += 1
+
+    def _sample(self) -> List[str]:
+        """Capture the current stack of the task, outermost frame first."""
+        coroutine_frames = []
+        awaitable = self._task.get_coro()
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "ag_frame", None)
+            if frame is None:
+                break
+            coroutine_frames.append(frame)
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "ag_await", None)
+        if not coroutine_frames:
+            return []
+
+        stack = [self._label(frame.f_code) for frame in coroutine_frames]
+        running = self._running_frames(coroutine_frames[-1])
+        if running is None:
+            stack.append(IDLE_FRAME)
+        else:
+            stack.extend(self._label(frame.f_code) for frame in running)
+        return stack
+
+    def _running_frames(self, innermost: FrameType) -> Optional[List[FrameType]]:
+        """Frames executing on the loop thread below a coroutine frame, None when it is suspended."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        callees = []
+        while frame is not None:
+            if frame is innermost:
+                return list(reversed(callees))
+            callees.append(frame)
+            frame = frame.f_back
+        return None
+
+    @staticmethod
+    def _label(code: CodeType) -> str:
+        """Name a frame by qualified function name and shortened file path."""
+        filename = code.co_filename
+        if SITE_PACKAGES in filename:
+            filename = filename.rsplit(SITE_PACKAGES, 1)[1]
+        elif PROJECT_DIR in filename:
+            filename = PROJECT_DIR + filename.rsplit(PROJECT_DIR, 1)[1]
+        else:
+            filename = os.path.basename(filename)
+        return f"{getattr(code, 'co_qualname', code.co_name)} ({filename})".replace(";", ":")
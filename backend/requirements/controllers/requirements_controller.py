@@ -1,102 +1,384 @@
 """Requirements API controller for handling requirement-related endpoints."""
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Query
-from pydantic import BaseModel
+from typing import AsyncIterator, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+import json
 import logging
+import orjson
 
+from backend.ai.exceptions import AIServiceError
 from backend.requirements.dtos.requirement_dto import RequirementDTO
+from backend.requirements.dtos.requirement_filter_dto import RequirementFilterDTO
+from backend.requirements.dtos.bulk_import_result_dto import BulkImportResultDTO
+from backend.requirements.dtos.prioritized_requirement_dto import PrioritizedRequirementDTO
+from backend.requirements.dtos.search_result_dto import SearchResultDTO
+from backend.requirements.dtos.similar_requirement_dto import SimilarRequirementDTO
+from backend.requirements.dtos.wiegers_weights_dto import WiegersWeightsDTO
+from backend.requirements.enums.priority_level import PriorityLevel
+from backend.requirements.enums.requirement_status import RequirementStatus
+from backend.requirements.enums.requirement_type import RequirementType
 from backend.requirements.models.requirement import Requirement
 from backend.requirements.services.requirements_service import RequirementsService
 from backend.requirements.models.wiegers_matrix import WiegersMatrix
 from backend.requirements.services.wiegers_service import WiegersService
 from backend.requirements.models.glossary import Glossary
 from backend.requirements.services.glossary_service import GlossaryService
+from backend.requirements.services.search_service import SearchService
+from backend.jobs.enums.job_type import JobType
+from backend.jobs.models.job import Job
+from backend.jobs.services.job_service import JobService
+from backend.config.settings import settings
+from backend.config.dependencies import get_requirements_service, get_wiegers_service, get_glossary_service, get_job_service, get_search_service, require_admin
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/requirement", tags=["requirement"])
 
+REQUIREMENT_LIST_ADAPTER = TypeAdapter(List[Requirement])
+
 class WiegersAnalysisRequest(BaseModel):
     """Request model for Wiegers matrix analysis."""
     requirement_ids: List[str]
 
+def get_requirement_filters(
+    status_filter: Optional[List[RequirementStatus]] = Query(None, alias="status"),
+    type_filter: Optional[List[RequirementType]] = Query(None, alias="type"),
+    stakeholders: Optional[List[str]] = Query(None, description="Keep requirements involving any of these stakeholders"),
+    priority: Optional[List[PriorityLevel]] = Query(None, description="Keep requirements with any of these priorities")
+) -> RequirementFilterDTO:
+    """Collect the requirement filter query parameters.
+    
+    Args:
+        status_filter: Requirement statuses to keep
+        type_filter: Requirement types to keep
+        stakeholders: Stakeholders of interest
+        priority: Attribute priority levels to keep
+        
+    Returns:
+        The filters as a RequirementFilterDTO.
+    """
+    return RequirementFilterDTO(
+        status=status_filter,
+        type=type_filter,
+        stakeholders=stakeholders,
+        priority=priority
+    )
+
+def _accepted(job: Job) -> ORJSONResponse:
+    """Build the 202 response pointing clients to the job status endpoint."""
+    return ORJSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(job, by_alias=True),
+        headers={"Location": f"/jobs/{job.id}"}
+    )
+
 @router.post("", response_model=Requirement)
-async def create_requirement(requirement: RequirementDTO):
+async def create_requirement(
+    requirement: RequirementDTO,
+    response: Response,
+    service: RequirementsService = Depends(get_requirements_service)
+):
     """Create a new requirement.
     
+    Existing requirements that look like near-duplicates of the new one
+    are listed in the `X-Possible-Duplicates` response header.
+    
     Args:
         requirement: The requirement data to create.
         
     Returns:
         The created requirement.
     """
-    service = RequirementsService()
     try:
         created_requirement = await service.create_requirement(requirement)
-        return created_requirement
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create requirement: {str(e)}")
+    
+    try:
+        duplicates = await service.find_similar_requirements(
+            created_requirement.id,
+            limit=5,
+            min_score=settings.SIMILARITY_DUPLICATE_THRESHOLD
+        )
+        if duplicates:
+            response.headers["X-Possible-Duplicates"] = ",".join(duplicate.requirement_id for duplicate in duplicates)
+    except Exception as e:
+        logger.warning(f"Failed to check requirement {created_requirement.id} for duplicates: {str(e)}")
+    return created_requirement
+
+@router.post("/bulk", response_model=BulkImportResultDTO)
+async def bulk_import_requirements(
+    request: Request,
+    generate_missing_descriptions: bool = Query(False, description="Generate an AI description for items without one"),
+    service: RequirementsService = Depends(get_requirements_service)
+):
+    """Import many requirements from a JSON array or an NDJSON upload.
+    
+    Send `Content-Type: application/x-ndjson` to stream one requirement per
+    line; any other content type is parsed as a JSON array.
+    
+    Args:
+        request: The incoming request carrying the upload.
+        generate_missing_descriptions: Generate an AI description for items without one.
+        
+    Returns:
+        Summary with the number of inserted items, generated and unfilled
+        descriptions, and per-item errors.
+    """
+    logger.info("POST /requirement/bulk endpoint called")
+    try:
+        result = await service.bulk_import(
+            _read_import_items(request),
+            generate_missing_descriptions=generate_missing_descriptions,
+            chunk_size=settings.BULK_IMPORT_CHUNK_SIZE,
+            description_batch_size=settings.BULK_IMPORT_DESCRIPTION_BATCH_SIZE
+        )
+        logger.info(f"Bulk import inserted {result.inserted_count} of {result.received} requirements")
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import payload: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to import requirements: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to import requirements: {str(e)}")
 
-@router.post("/ai-description", response_model=Requirement)
-async def create_requirement_with_ai_description(requirement: RequirementDTO):
+async def _read_import_items(request: Request) -> AsyncIterator[Union[dict, bytes]]:
+    """Yield raw NDJSON lines or parsed JSON array items from the request body."""
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+    else:
+        payload = json.loads(await request.body())
+        if not isinstance(payload, list):
+            raise ValueError("Expected a JSON array of requirements")
+        for item in payload:
+            yield item
+
+@router.post("/ai-description", response_model=Requirement, responses={202: {"model": Job}})
+async def create_requirement_with_ai_description(
+    requirement: RequirementDTO,
+    run_async: bool = Query(False, alias="async", description="Queue the operation as a background job and return 202"),
+    job_service: JobService = Depends(get_job_service),
+    service: RequirementsService = Depends(get_requirements_service)
+):
     """Create a new requirement with AI-generated description.
     
     Args:
         requirement: The requirement data to create (description will be generated by AI).
+        run_async: Queue the operation as a background job instead of waiting for it.
         
     Returns:
-        The created requirement with AI-generated description.
+        The created requirement with AI-generated description, or the
+        queued job with status 202 when `async` is set.
     """
-    service = RequirementsService()
     try:
+        if run_async:
+            job = await job_service.submit(JobType.AI_DESCRIPTION, {"requirement": requirement.model_dump(mode="json")})
+            return _accepted(job)
         created_requirement = await service.create_requirement_with_ai_description(requirement)
         return created_requirement
+    except AIServiceError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create requirement with AI description: {str(e)}")
+
+@router.post("/ai-description/stream", response_class=StreamingResponse)
+async def stream_requirement_with_ai_description(
+    requirement: RequirementDTO,
+    request: Request,
+    service: RequirementsService = Depends(get_requirements_service)
+):
+    """Create a requirement while streaming its AI-generated description as Server-Sent Events.
+    
+    Emits `token` events with `{"text": ...}` fragments as the model
+    produces them, then a single `done` event with the saved requirement.
+    A failure after the stream started, or a stream without any text, is
+    reported as an `error` event and nothing is saved. If the client
+    disconnects, the generation is cancelled and nothing is saved.
+    
+    Args:
+        requirement: The requirement data to create (description will be generated by AI).
+        
+    Returns:
+        A `text/event-stream` response.
+    """
+    logger.info("POST /requirement/ai-description/stream endpoint called")
+    stream = service.stream_ai_description(requirement)
+    try:
+        first_fragment = await stream.__anext__()
+    except StopAsyncIteration:
+        first_fragment = ""
+    except AIServiceError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create requirement with AI description: {str(e)}")
+    
+    async def events() -> AsyncIterator[str]:
+        fragments = [first_fragment]
+        try:
+            if first_fragment:
+                yield _sse_event("token", {"text": first_fragment})
+            async for fragment in stream:
+                if await request.is_disconnected():
+                    logger.info("Client disconnected, cancelling description stream")
+                    return
+                fragments.append(fragment)
+                yield _sse_event("token", {"text": fragment})
+            
+            description = "".join(fragments)
+            if not description.strip():
+                yield _sse_event("error", {"detail": "A IA não gerou nenhuma descrição; o requisito não foi salvo"})
+                return
+            created_requirement = await service.create_requirement_with_description(requirement, description)
+            yield _sse_event("done", jsonable_encoder(created_requirement, by_alias=True))
+        except Exception as e:
+            logger.error(f"Failed to stream requirement description: {str(e)}")
+            yield _sse_event("error", {"detail": str(e)})
+        finally:
+            await stream.aclose()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-@router.get("", response_model=List[Requirement])
-async def get_requirements(stakeholder: Optional[str] = Query(None, description="Nome da parte interessada para ordenação por prioridade")):
-    """Get all requirements.
+def _sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@router.get("", response_model=List[Requirement], response_model_exclude_unset=True)
+async def get_requirements(
+    stakeholder: Optional[str] = Query(None, description="Nome da parte interessada para ordenação por prioridade"),
+    refine_with_ai: bool = Query(False, description="Let the AI re-rank the top of the stakeholder ordering"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of requirements per page"),
+    after: Optional[str] = Query(None, description="Cursor returned in X-Next-Cursor by the previous page"),
+    filters: RequirementFilterDTO = Depends(get_requirement_filters),
+    fields: Optional[List[str]] = Query(None, description="Optional fields to include, e.g. description"),
+    service: RequirementsService = Depends(get_requirements_service)
+):
+    """Get requirements with cursor pagination, filtering and projection.
+    
+    The requirements are already validated by the service, so they are
+    serialized once to JSON bytes here instead of being validated and
+    encoded again through the response model.
     
     Args:
         stakeholder: Optional stakeholder name to sort requirements by priority
+        refine_with_ai: Let the AI re-rank the top of the stakeholder ordering
+        limit: Maximum number of requirements per page, all when omitted
+        after: Cursor of the previous page
+        filters: Server-side filters on status, type, stakeholders and priority
+        fields: Optional fields to include besides the required ones
     
     Returns:
-        List of all requirements, optionally sorted by stakeholder priority.
+        Page of requirements, optionally sorted by stakeholder priority.
+        The X-Next-Cursor header carries the cursor of the next page.
     """
     logger.info(f"GET /requirement endpoint called with stakeholder: {stakeholder}")
-    service = RequirementsService()
     try:
-        requirements = await service.get_all_requirements(stakeholder_name=stakeholder)
+        requirements = await service.get_all_requirements(
+            stakeholder_name=stakeholder,
+            filters=filters,
+            limit=limit,
+            after=after,
+            fields=fields,
+            refine_with_ai=refine_with_ai
+        )
+        headers = {}
+        if limit is not None and len(requirements) == limit:
+            headers["X-Next-Cursor"] = requirements[-1].id
         logger.info(f"Returning {len(requirements)} requirements")
-        return requirements
+        return Response(
+            content=REQUIREMENT_LIST_ADAPTER.dump_json(requirements, by_alias=True, exclude_unset=True),
+            media_type="application/json",
+            headers=headers
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to retrieve requirements: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve requirements: {str(e)}")
 
-@router.post("/glossary", response_model=Glossary)
-async def generate_and_save_glossary():
-    """Generate a new glossary from all requirements and save it to database.
+@router.get("/export")
+async def export_requirements(
+    filters: RequirementFilterDTO = Depends(get_requirement_filters),
+    service: RequirementsService = Depends(get_requirements_service)
+):
+    """Stream requirements as newline-delimited JSON.
+    
+    Args:
+        filters: Server-side filters on status, type, stakeholders and priority
+    
+    Returns:
+        Streaming NDJSON response with one requirement per line.
+    """
+    logger.info("GET /requirement/export endpoint called")
+    batch_size = settings.EXPORT_BATCH_SIZE
+    
+    async def ndjson_lines():
+        lines = []
+        async for requirement_doc in service.iter_requirement_documents(filters, batch_size=batch_size):
+            lines.append(orjson.dumps(requirement_doc))
+            if len(lines) >= batch_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+    
+    return StreamingResponse(
+        ndjson_lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="requirements.ndjson"'}
+    )
+
+@router.post("/glossary", response_model=Glossary, responses={202: {"model": Job}})
+async def generate_and_save_glossary(
+    full_rebuild: bool = Query(False, description="Regenerate every term instead of updating incrementally"),
+    run_async: bool = Query(False, alias="async", description="Queue the operation as a background job and return 202"),
+    job_service: JobService = Depends(get_job_service),
+    service: GlossaryService = Depends(get_glossary_service)
+):
+    """Update the glossary from requirements and save it to database.
+    
+    By default only new or changed requirements are sent to the model and
+    their terms are merged into the existing glossary.
     
-    Removes any existing glossary and creates a new one.
+    Args:
+        full_rebuild: Regenerate every term from all requirements.
+        run_async: Queue the operation as a background job instead of waiting for it.
     
     Returns:
-        The created glossary with terms and definitions.
+        The updated glossary with terms and definitions, or the queued job
+        with status 202 when `async` is set.
     """
     logger.info("POST /requirement/glossary endpoint called")
-    service = GlossaryService()
     try:
-        glossary = await service.generate_and_save_glossary()
+        if run_async:
+            job = await job_service.submit(JobType.GLOSSARY, {"full_rebuild": full_rebuild})
+            return _accepted(job)
+        glossary = await service.generate_and_save_glossary(full_rebuild=full_rebuild)
         logger.info(f"Generated and saved glossary with {len(glossary.terms)} terms")
         return glossary
+    except AIServiceError:
+        raise
     except Exception as e:
         logger.error(f"Failed to generate and save glossary: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate and save glossary: {str(e)}")
 
 @router.get("/glossary", response_model=Glossary)
-async def get_current_glossary():
+async def get_current_glossary(service: GlossaryService = Depends(get_glossary_service)):
     """Get the current glossary from database.
     
     Returns:
@@ -106,7 +388,6 @@ async def get_current_glossary():
         HTTPException: When no glossary is found.
     """
     logger.info("GET /requirement/glossary endpoint called")
-    service = GlossaryService()
     try:
         glossary = await service.get_current_glossary()
         if glossary is None:
@@ -119,50 +400,66 @@ async def get_current_glossary():
         logger.error(f"Failed to retrieve glossary: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve glossary: {str(e)}")
 
-@router.get("/{requirement_id}", response_model=Requirement)
-async def get_requirement(requirement_id: str):
-    """Get a specific requirement by ID.
+@router.get("/search", response_model=SearchResultDTO)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    offset: int = Query(0, ge=0, le=10000, description="Number of requirement hits to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of requirement hits"),
+    include_glossary: bool = Query(True, description="Also match glossary terms"),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    service: SearchService = Depends(get_search_service)
+):
+    """Search requirements and glossary terms.
     
     Args:
-        requirement_id: The unique identifier for the requirement.
+        q: Free-text query; accents and Portuguese inflections are ignored.
+        offset: Number of requirement hits to skip.
+        limit: Maximum number of requirement hits.
+        include_glossary: Also match glossary terms, returned with the first page.
+        after: Cursor of the previous page; deep pages should follow it instead of an offset.
         
     Returns:
-        The requirement data.
-        
-    Raises:
-        HTTPException: When requirement ID is invalid or requirement not found.
+        One page of ranked results.
     """
-    service = RequirementsService()
+    logger.info(f"GET /requirement/search endpoint called with q: {q}")
     try:
-        requirement = await service.get_requirement_by_id(requirement_id)
-        if requirement is None:
-            raise HTTPException(status_code=404, detail="Requirement not found")
-        return requirement
-    except HTTPException:
-        # Re-raise HTTPExceptions (like our 404) without wrapping them
-        raise
+        return await service.search(q, offset=offset, limit=limit, include_glossary=include_glossary, after=after)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve requirement: {str(e)}")
+        logger.error(f"Failed to search: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search: {str(e)}")
 
-@router.post("/wiegers/analyze", response_model=List[WiegersMatrix])
-async def analyze_requirements(request: WiegersAnalysisRequest):
+@router.post("/wiegers/analyze", response_model=List[WiegersMatrix], responses={202: {"model": Job}})
+async def analyze_requirements(
+    request: WiegersAnalysisRequest,
+    run_async: bool = Query(False, alias="async", description="Queue the operation as a background job and return 202"),
+    job_service: JobService = Depends(get_job_service),
+    wiegers_service: WiegersService = Depends(get_wiegers_service)
+):
     """Generate Wiegers matrix analysis for requirements using AI.
     
     Args:
         request: Request containing list of requirement IDs
+        run_async: Queue the operation as a background job instead of waiting for it
         
     Returns:
-        List of created WiegersMatrix objects ordered by priority
+        List of created WiegersMatrix objects ordered by priority, or the
+        queued job with status 202 when `async` is set
         
     Raises:
         HTTPException: When analysis fails
     """
-    wiegers_service = WiegersService()
     try:
+        if run_async:
+            job = await job_service.submit(JobType.WIEGERS_ANALYSIS, {"requirement_ids": request.requirement_ids})
+            return _accepted(job)
         matrices = await wiegers_service.generate_and_save_matrices(request.requirement_ids)
         return matrices
+    except AIServiceError:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -170,13 +467,12 @@ async def analyze_requirements(request: WiegersAnalysisRequest):
         )
 
 @router.get("/wiegers", response_model=List[WiegersMatrix])
-async def get_all_matrices():
-    """Get all Wiegers matrices ordered by priority.
+async def get_all_matrices(wiegers_service: WiegersService = Depends(get_wiegers_service)):
+    """Get the latest Wiegers matrix of every requirement ordered by priority.
     
     Returns:
-        List of WiegersMatrix objects
+        List of WiegersMatrix objects, highest priority first
     """
-    wiegers_service = WiegersService()
     try:
         return await wiegers_service.get_all()
     except Exception as e:
@@ -185,8 +481,60 @@ async def get_all_matrices():
             detail=f"Erro ao buscar matrizes Wiegers: {str(e)}"
         )
 
+@router.get("/wiegers/priorities", response_model=List[PrioritizedRequirementDTO])
+async def get_prioritized_requirements(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of requirements (top-k)"),
+    offset: int = Query(0, ge=0, description="Number of requirements to skip"),
+    min_priority: Optional[float] = Query(None, ge=0, description="Minimum Wiegers priority"),
+    wiegers_service: WiegersService = Depends(get_wiegers_service)
+):
+    """Get requirements joined with their latest Wiegers matrix, by priority.
+    
+    Args:
+        limit: Maximum number of requirements (top-k)
+        offset: Number of requirements to skip
+        min_priority: Minimum Wiegers priority
+        
+    Returns:
+        Requirements with their latest matrix, highest priority first
+    """
+    try:
+        return await wiegers_service.get_prioritized(limit=limit, offset=offset, min_priority=min_priority)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar prioridades Wiegers: {str(e)}"
+        )
+
+@router.get("/wiegers/weights", response_model=WiegersWeightsDTO)
+async def get_wiegers_weights(wiegers_service: WiegersService = Depends(get_wiegers_service)):
+    """Get the weights used by the Wiegers relative prioritization.
+    
+    Returns:
+        The current Wiegers weights
+    """
+    return wiegers_service.weights
+
+@router.put("/wiegers/weights", response_model=WiegersWeightsDTO, dependencies=[Depends(require_admin)])
+async def update_wiegers_weights(weights: WiegersWeightsDTO, wiegers_service: WiegersService = Depends(get_wiegers_service)):
+    """Change the Wiegers weights and recompute every relative priority; requires the admin token.
+    
+    Args:
+        weights: The new Wiegers weights
+        
+    Returns:
+        The weights now in use
+    """
+    try:
+        return await wiegers_service.update_weights(weights)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao atualizar pesos Wiegers: {str(e)}"
+        )
+
 @router.get("/wiegers/{requirement_id}", response_model=WiegersMatrix)
-async def get_matrix_by_requirement(requirement_id: str):
+async def get_matrix_by_requirement(requirement_id: str, wiegers_service: WiegersService = Depends(get_wiegers_service)):
     """Get Wiegers matrix by requirement ID.
     
     Args:
@@ -198,7 +546,6 @@ async def get_matrix_by_requirement(requirement_id: str):
     Raises:
         HTTPException: When matrix not found
     """
-    wiegers_service = WiegersService()
     try:
         matrix = await wiegers_service.get_by_requirement_id(requirement_id)
         if not matrix:
@@ -214,3 +561,62 @@ async def get_matrix_by_requirement(requirement_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erro ao buscar matriz Wiegers: {str(e)}"
         )
+
+@router.get("/{requirement_id}", response_model=Requirement)
+async def get_requirement(requirement_id: str, service: RequirementsService = Depends(get_requirements_service)):
+    """Get a specific requirement by ID.
+    
+    Args:
+        requirement_id: The unique identifier for the requirement.
+        
+    Returns:
+        The requirement data.
+        
+    Raises:
+        HTTPException: When requirement ID is invalid or requirement not found.
+    """
+    try:
+        requirement = await service.get_requirement_by_id(requirement_id)
+        if requirement is None:
+            raise HTTPException(status_code=404, detail="Requirement not found")
+        return requirement
+    except HTTPException:
+        # Re-raise HTTPExceptions (like our 404) without wrapping them
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve requirement: {str(e)}")
+
+@router.get("/{requirement_id}/similar", response_model=List[SimilarRequirementDTO])
+async def get_similar_requirements(
+    requirement_id: str,
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of similar requirements"),
+    min_score: float = Query(0.0, ge=0.0, le=1.0, description="Minimum similarity score"),
+    service: RequirementsService = Depends(get_requirements_service)
+):
+    """Get the requirements most similar to a given one.
+    
+    Args:
+        requirement_id: The unique identifier for the requirement.
+        limit: Maximum number of similar requirements.
+        min_score: Minimum similarity score in [0, 1].
+        
+    Returns:
+        Similar requirements from most to least similar.
+        
+    Raises:
+        HTTPException: When requirement ID is invalid or requirement not found.
+    """
+    try:
+        similar_requirements = await service.find_similar_requirements(requirement_id, limit, min_score)
+        if similar_requirements is None:
+            raise HTTPException(status_code=404, detail="Requirement not found")
+        return similar_requirements
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to find similar requirements: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to find similar requirements: {str(e)}")
@@ -2,5 +2,23 @@
 
 from .requirement_dto import RequirementDTO
 from .requirement_attributes_dto import RequirementAttributesDTO
+from .requirement_filter_dto import RequirementFilterDTO
+from .bulk_import_result_dto import BulkImportResultDTO, BulkImportErrorDTO
+from .similar_requirement_dto import SimilarRequirementDTO
+from .search_result_dto import SearchResultDTO, RequirementSearchHitDTO, GlossaryTermHitDTO
+from .prioritized_requirement_dto import PrioritizedRequirementDTO
+from .wiegers_weights_dto import WiegersWeightsDTO
 
-__all__ = ["RequirementDTO", "RequirementAttributesDTO"]
+__all__ = [
+    "RequirementDTO",
+    "RequirementAttributesDTO",
+    "RequirementFilterDTO",
+    "BulkImportResultDTO",
+    "BulkImportErrorDTO",
+    "SimilarRequirementDTO",
+    "SearchResultDTO",
+    "RequirementSearchHitDTO",
+    "GlossaryTermHitDTO",
+    "PrioritizedRequirementDTO",
+    "WiegersWeightsDTO"
+]
@@ -0,0 +1,35 @@
+"""Bulk import result DTO definitions."""
+
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class BulkImportErrorDTO(BaseModel):
+    """DTO describing why a single imported item was rejected.
+    
+    Attributes:
+        index: Zero-based position of the item in the upload.
+        error: Validation or write error message.
+    """
+    
+    index: int
+    error: str
+
+
+class BulkImportResultDTO(BaseModel):
+    """DTO summarizing the outcome of a bulk requirement import.
+    
+    Attributes:
+        received: Number of items read from the upload.
+        inserted_count: Number of requirements written to the database.
+        generated_descriptions: Number of descriptions generated by AI.
+        unfilled_descriptions: Number of valid items left without a
+            description because its generation failed.
+        errors: Per-item errors for the rejected items.
+    """
+    
+    received: int = 0
+    inserted_count: int = 0
+    generated_descriptions: int = 0
+    unfilled_descriptions: int = 0
+    errors: List[BulkImportErrorDTO] = Field(default_factory=list)
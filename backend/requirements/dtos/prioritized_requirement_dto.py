@@ -0,0 +1,18 @@
+"""Prioritized requirement DTO definitions for Wiegers rankings."""
+
+from pydantic import BaseModel
+
+from backend.requirements.models.requirement import Requirement
+from backend.requirements.models.wiegers_matrix import WiegersMatrix
+
+
+class PrioritizedRequirementDTO(BaseModel):
+    """DTO joining a requirement with its latest Wiegers matrix.
+    
+    Attributes:
+        matrix: The latest Wiegers matrix of the requirement.
+        requirement: The analysed requirement.
+    """
+    
+    matrix: WiegersMatrix
+    requirement: Requirement
@@ -0,0 +1,44 @@
+"""Requirement filter DTO definitions for list queries."""
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+from backend.requirements.enums.priority_level import PriorityLevel
+from backend.requirements.enums.requirement_status import RequirementStatus
+from backend.requirements.enums.requirement_type import RequirementType
+
+
+class RequirementFilterDTO(BaseModel):
+    """DTO for server-side filtering of requirements.
+
+    Every attribute accepts several values, which are combined with OR;
+    different attributes are combined with AND.
+
+    Attributes:
+        status: Requirement statuses to keep.
+        type: Requirement types to keep.
+        stakeholders: Keep requirements involving any of these stakeholders.
+        priority: Attribute priority levels to keep.
+    """
+
+    status: Optional[List[RequirementStatus]] = None
+    type: Optional[List[RequirementType]] = None
+    stakeholders: Optional[List[str]] = None
+    priority: Optional[List[PriorityLevel]] = None
+
+    def to_query(self) -> dict:
+        """Build the MongoDB filter document for these criteria.
+
+        Returns:
+            Filter document usable with `find`.
+        """
+        query = {}
+        if self.status:
+            query["status"] = {"$in": [value.value for value in self.status]}
+        if self.type:
+            query["type"] = {"$in": [value.value for value in self.type]}
+        if self.stakeholders:
+            query["stakeholders"] = {"$in": self.stakeholders}
+        if self.priority:
+            query["attributes.priority"] = {"$in": [value.value for value in self.priority]}
+        return query
@@ -0,0 +1,55 @@
+"""Search result DTO definitions."""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class RequirementSearchHitDTO(BaseModel):
+    """DTO describing a requirement matching a search query.
+
+    Attributes:
+        requirement_id: ID of the matching requirement.
+        title: Title of the matching requirement.
+        score: Relevance score; higher is more relevant.
+    """
+
+    requirement_id: str
+    title: str
+    score: float
+
+
+class GlossaryTermHitDTO(BaseModel):
+    """DTO describing a glossary term matching a search query.
+
+    Attributes:
+        name: The term name.
+        definition: The term definition.
+        score: Relevance score in [0, 1]; higher is more relevant.
+    """
+
+    name: str
+    definition: str
+    score: float
+
+
+class SearchResultDTO(BaseModel):
+    """DTO holding one page of search results.
+
+    Attributes:
+        query: The query that was searched.
+        requirements: Matching requirements, most relevant first.
+        glossary_terms: Matching glossary terms, most relevant first. Only
+            returned with the first page.
+        offset: Number of requirement hits skipped.
+        limit: Maximum number of requirement hits in the page.
+        has_more: Whether another page of requirement hits exists.
+        next_cursor: Cursor of the next page, passed back as `after`.
+    """
+
+    query: str
+    requirements: List[RequirementSearchHitDTO] = Field(default_factory=list)
+    glossary_terms: List[GlossaryTermHitDTO] = Field(default_factory=list)
+    offset: int = 0
+    limit: int = 20
+    has_more: bool = False
+    next_cursor: Optional[str] = None
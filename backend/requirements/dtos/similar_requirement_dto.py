@@ -0,0 +1,17 @@
+"""Similar requirement DTO definitions for similarity queries."""
+
+from pydantic import BaseModel, Field
+
+
+class SimilarRequirementDTO(BaseModel):
+    """DTO describing a requirement similar to another one.
+
+    Attributes:
+        requirement_id: ID of the similar requirement.
+        title: Title of the similar requirement.
+        score: Cosine similarity in [0, 1]; higher is more similar.
+    """
+
+    requirement_id: str
+    title: str
+    score: float = Field(..., ge=0.0, le=1.0)
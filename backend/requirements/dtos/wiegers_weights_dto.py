@@ -0,0 +1,28 @@
+"""Wiegers weights DTO definitions for relative prioritization."""
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class WiegersWeightsDTO(BaseModel):
+    """DTO holding the weights of the Wiegers relative prioritization.
+    
+    Attributes:
+        benefit: Weight of the value delivered when the requirement is implemented.
+        penalty: Weight of the penalty of not implementing it, taken from urgency.
+        cost: Weight of the relative implementation cost.
+        risk: Weight of the relative technical risk.
+    """
+    
+    benefit: float = Field(2.0, ge=0)
+    penalty: float = Field(1.0, ge=0)
+    cost: float = Field(1.0, ge=0)
+    risk: float = Field(0.5, ge=0)
+    
+    @model_validator(mode="after")
+    def check_not_degenerate(self):
+        """Reject weights that would make every value or every cost zero."""
+        if self.benefit + self.penalty <= 0:
+            raise ValueError("benefit and penalty weights cannot both be zero")
+        if self.cost + self.risk <= 0:
+            raise ValueError("cost and risk weights cannot both be zero")
+        return self
@@ -16,7 +16,7 @@ class Requirement(BaseModel):
     created_at: Optional[datetime] = None
     title: str
     details: Optional[str] = None
-    description: Optional[str]
+    description: Optional[str] = None
     stakeholders: List[str]
     type: RequirementType
     attributes: RequirementAttributes
@@ -23,7 +23,10 @@ class WiegersMatrix(BaseModel):
     urgency: int = Field(..., ge=1, le=5, description="Urgency (1-5)")
     
     # Calculated priority
-    priority: Optional[float] = Field(None, description="Calculated priority: (value + urgency) - (cost + risk)")
+    priority: Optional[float] = Field(None, description="Relative Wiegers priority within the current set of matrices")
+    value_percentage: Optional[float] = Field(None, description="Share of the total weighted value of the set (%)")
+    cost_percentage: Optional[float] = Field(None, description="Share of the total cost of the set (%)")
+    risk_percentage: Optional[float] = Field(None, description="Share of the total risk of the set (%)")
     
     class Config:
         allow_population_by_field_name = True
@@ -33,7 +36,11 @@ class WiegersMatrix(BaseModel):
         }
     
     def calculate_priority(self) -> float:
-        """Calculate priority using Wiegers formula: (value + urgency) - (cost + risk)."""
+        """Calculate a provisional priority: (value + urgency) - (cost + risk).
+        
+        The relative priority of the latest matrices is recomputed over the
+        whole set by the WiegersService once the matrix is saved.
+        """
         calculated_priority = float((self.value + self.urgency) - (self.cost + self.risk))
         self.priority = max(0.0, calculated_priority)
         return self.priority
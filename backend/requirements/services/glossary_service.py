@@ -1,71 +1,145 @@
 """Glossary service for handling glossary-related operations."""
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+import hashlib
+import json
 import logging
 from datetime import datetime
+from bson import ObjectId
+from pymongo import DESCENDING, IndexModel, ReturnDocument
 
 from backend.requirements.models.glossary import Glossary
+from backend.requirements.models.requirement import Requirement
 from backend.config.database import get_database
+from backend.core.utils.text import fold_text
+from backend.config.indexes import register_indexes
+from backend.ai.exceptions import AIServiceError
 from backend.ai.services.gemini_service import GeminiService
 from backend.requirements.services.requirements_service import RequirementsService
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+register_indexes("glossaries", [
+    IndexModel([("created_at", DESCENDING)], name="created_at"),
+])
+
 class GlossaryService:
     """Service class for handling glossary-related operations."""
     
-    def __init__(self):
-        """Initialize the GlossaryService."""
+    def __init__(self, requirements_service: RequirementsService, gemini_service: GeminiService):
+        """Initialize the GlossaryService.
+        
+        Args:
+            requirements_service: Shared service used to read requirements.
+            gemini_service: Shared Gemini service used for AI generation.
+        """
         self.db = get_database()
-        self.gemini_service = GeminiService()
-        self.requirements_service = RequirementsService()
+        self.gemini_service = gemini_service
+        self.requirements_service = requirements_service
     
-    async def generate_and_save_glossary(self) -> Glossary:
-        """Generate a new glossary from all requirements and save it to database.
+    async def generate_and_save_glossary(self, full_rebuild: bool = False) -> Glossary:
+        """Generate the glossary from requirements and save it to database.
+        
+        In incremental mode only requirements that are new or whose content
+        changed since the last run are sent to the model, and the resulting
+        terms are merged into the existing glossary. A requirement counts as
+        processed only once a call covering it returned valid terms. The glossary document is
+        replaced in a single write, so it never disappears mid-update.
         
-        Removes any existing glossary and creates a new one.
+        Args:
+            full_rebuild: Regenerate every term from all requirements instead
+                of updating the existing glossary incrementally.
         
         Returns:
-            The created glossary.
+            The updated glossary.
             
         Raises:
             Exception: When AI generation or database operation fails.
         """
         try:
-            logger.info("Generating and saving new glossary")
+            logger.info(f"Generating glossary ({'full rebuild' if full_rebuild else 'incremental'})")
             
-            # Remove existing glossary
-            await self.db.glossaries.delete_many({})
-            logger.info("Removed existing glossary")
-            
-            # Get all requirements
+            existing_doc = await self.db.glossaries.find_one({}, sort=[("created_at", -1)])
             requirements = await self.requirements_service.get_all_requirements()
+            content_hashes = {requirement.id: self._content_hash(requirement) for requirement in requirements}
+            
+            if full_rebuild or existing_doc is None:
+                existing_terms = []
+                processed = {}
+            else:
+                existing_terms = existing_doc.get("terms", [])
+                processed = existing_doc.get("processed_requirements", {})
+            pending = [requirement for requirement in requirements if processed.get(requirement.id) != content_hashes[requirement.id]]
             
-            if not requirements:
-                logger.warning("No requirements found for glossary generation")
-                terms = []
+            new_terms = []
+            processed_requirements = {requirement.id: processed[requirement.id] for requirement in requirements if requirement.id in processed}
+            if pending:
+                logger.info(f"Sending {len(pending)} of {len(requirements)} requirements to the model")
+                for members, terms in await self.gemini_service.generate_glossary_batches(pending):
+                    new_terms.extend(terms)
+                    processed_requirements.update({requirement.id: content_hashes[requirement.id] for requirement in members})
+                unprocessed = sum(1 for requirement in pending if processed_requirements.get(requirement.id) != content_hashes[requirement.id])
+                if unprocessed:
+                    logger.warning(f"{unprocessed} requirements got no valid glossary response and will be sent again on the next run")
             else:
-                # Generate glossary using AI
-                terms = await self.gemini_service.generate_glossary(requirements)
+                logger.info("No new or changed requirements, keeping current terms")
             
-            # Create and save new glossary
+            now = datetime.utcnow()
             glossary_data = {
-                'terms': terms,
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow()
+                'terms': self._merge_terms(existing_terms, new_terms),
+                'processed_requirements': processed_requirements,
+                'created_at': existing_doc['created_at'] if existing_doc and existing_doc.get('created_at') else now,
+                'updated_at': now
             }
             
-            result = await self.db.glossaries.insert_one(glossary_data)
-            created_glossary_doc = await self.db.glossaries.find_one({"_id": result.inserted_id})
+            glossary_id = existing_doc['_id'] if existing_doc else ObjectId()
+            saved_doc = await self.db.glossaries.find_one_and_replace(
+                {"_id": glossary_id},
+                glossary_data,
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            await self.db.glossaries.delete_many({"_id": {"$ne": glossary_id}})
             
-            logger.info(f"Successfully generated and saved glossary with {len(terms)} terms")
-            return Glossary.from_mongo(created_glossary_doc)
+            logger.info(f"Successfully saved glossary with {len(glossary_data['terms'])} terms")
+            return Glossary.from_mongo(saved_doc)
             
+        except AIServiceError:
+            raise
         except Exception as e:
             logger.error(f"Error generating and saving glossary: {str(e)}")
             raise Exception(f"Failed to generate and save glossary: {str(e)}")
     
+    @staticmethod
+    def _content_hash(requirement: Requirement) -> str:
+        """Hash the requirement fields that feed the glossary prompt."""
+        content = json.dumps(
+            [requirement.title, requirement.details, requirement.description, requirement.type.value, requirement.stakeholders],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _normalize_term_name(name: str) -> str:
+        """Fold case, accents and whitespace so equivalent term names collide."""
+        return fold_text(name)
+    
+    def _merge_terms(self, existing_terms: List[Dict[str, str]], new_terms: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Merge new terms into existing ones, deduplicated by normalized name.
+        
+        A new definition replaces the existing one for the same term, and the
+        result is ordered by normalized name so repeated runs are stable.
+        """
+        merged = {}
+        for term in [*existing_terms, *new_terms]:
+            if not isinstance(term, dict) or not term.get("name") or not term.get("definition"):
+                continue
+            key = self._normalize_term_name(str(term["name"]))
+            if key:
+                merged[key] = {"name": str(term["name"]).strip(), "definition": str(term["definition"]).strip()}
+        return [merged[key] for key in sorted(merged)]
+    
     async def get_current_glossary(self) -> Optional[Glossary]:
         """Get the current glossary from database.
         
@@ -1,18 +1,41 @@
 """Requirements service for handling business logic related to requirements."""
 
-from typing import List, Optional
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
 from bson import ObjectId
+from pydantic import ValidationError
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError
+import asyncio
+import heapq
 import logging
 from datetime import datetime
 
 from backend.requirements.models.requirement import Requirement
 from backend.config.database import get_database
+from backend.config.indexes import register_indexes
 from backend.requirements.dtos.requirement_dto import RequirementDTO
+from backend.requirements.dtos.requirement_filter_dto import RequirementFilterDTO
+from backend.requirements.dtos.bulk_import_result_dto import BulkImportResultDTO, BulkImportErrorDTO
+from backend.requirements.dtos.similar_requirement_dto import SimilarRequirementDTO
+from backend.ai.exceptions import AIServiceError
 from backend.ai.services.gemini_service import GeminiService
+from backend.requirements.services.similarity_service import SimilarityService
+from backend.requirements.services.stakeholder_ranking_service import StakeholderRankingService
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+REQUIRED_FIELDS = {"title", "stakeholders", "type", "attributes", "version"}
+PROJECTABLE_FIELDS = set(Requirement.model_fields) - {"id"}
+
+register_indexes("requirements", [
+    IndexModel([("status", ASCENDING), ("_id", ASCENDING)], name="status_id"),
+    IndexModel([("type", ASCENDING), ("_id", ASCENDING)], name="type_id"),
+    IndexModel([("stakeholders", ASCENDING), ("_id", ASCENDING)], name="stakeholders_id"),
+    IndexModel([("attributes.priority", ASCENDING), ("_id", ASCENDING)], name="priority_id"),
+    IndexModel([("created_at", DESCENDING)], name="created_at"),
+])
+
 class RequirementsService:
     """Service class for handling requirement-related operations.
     
@@ -20,10 +43,18 @@ class RequirementsService:
     requirement data from the database.
     """
     
-    def __init__(self):
-        """Initialize the RequirementsService."""
+    def __init__(self, gemini_service: GeminiService, ranking_service: StakeholderRankingService, similarity_service: SimilarityService):
+        """Initialize the RequirementsService.
+        
+        Args:
+            gemini_service: Shared Gemini service used for AI generation.
+            ranking_service: Shared service ordering requirements for a stakeholder.
+            similarity_service: Shared vector index used for duplicate detection.
+        """
         self.db = get_database()
-        self.gemini_service = GeminiService()
+        self.gemini_service = gemini_service
+        self.ranking_service = ranking_service
+        self.similarity_service = similarity_service
     
     async def create_requirement(self, requirement_data: RequirementDTO) -> Requirement:
         """Create a new requirement in the database.
@@ -39,9 +70,11 @@ class RequirementsService:
         """
         requirement_dict = requirement_data.model_dump()
         requirement_dict['created_at'] = datetime.utcnow()
+        requirement_dict.update(self.ranking_service.ranking_fields(requirement_dict))
         
         result = await self.db.requirements.insert_one(requirement_dict)
         created_requirement_doc = await self.db.requirements.find_one({"_id": result.inserted_id})
+        await self._index_for_similarity([created_requirement_doc])
         return Requirement.from_mongo(created_requirement_doc)
     
     async def create_requirement_with_ai_description(self, requirement_dto: RequirementDTO) -> Requirement:
@@ -64,76 +97,448 @@ class RequirementsService:
                 details=requirement_dto.details if requirement_dto.details is not None else ""
             )
             
-            requirement_dict = requirement_dto.model_dump()
-            requirement_dict['description'] = ai_generated_description
-            requirement_dict['created_at'] = datetime.utcnow()
-            
-            result = await self.db.requirements.insert_one(requirement_dict)
-            created_requirement_doc = await self.db.requirements.find_one({"_id": result.inserted_id})
-            return Requirement.from_mongo(created_requirement_doc)
+            return await self.create_requirement_with_description(requirement_dto, ai_generated_description)
             
+        except AIServiceError:
+            raise
         except Exception as e:
             raise Exception(f"Falha ao gerar descrição com IA ou salvar requisito: {str(e)}")
     
-    async def get_all_requirements(self, stakeholder_name: Optional[str] = None) -> List[Requirement]:
-        """Retrieve all requirements from the database.
+    def stream_ai_description(self, requirement_dto: RequirementDTO) -> AsyncIterator[str]:
+        """Stream an AI-generated description for a requirement that is not saved yet.
         
         Args:
-            stakeholder_name: Optional stakeholder name to sort requirements by priority
+            requirement_dto: The requirement data the description is generated from.
+            
+        Returns:
+            Async iterator over fragments of the description; closing it
+            cancels the generation.
+        """
+        return self.gemini_service.stream_requirement_description(
+            title=requirement_dto.title,
+            requirement_type=requirement_dto.type,
+            stakeholders=requirement_dto.stakeholders,
+            details=requirement_dto.details if requirement_dto.details is not None else ""
+        )
+    
+    async def create_requirement_with_description(self, requirement_dto: RequirementDTO, description: str) -> Requirement:
+        """Create a new requirement with a description generated beforehand.
+        
+        Args:
+            requirement_dto: The requirement data to create.
+            description: The description to store.
+            
+        Returns:
+            The created requirement.
+        """
+        requirement_dict = requirement_dto.model_dump()
+        requirement_dict['description'] = description
+        requirement_dict['created_at'] = datetime.utcnow()
+        requirement_dict.update(self.ranking_service.ranking_fields(requirement_dict))
+        
+        result = await self.db.requirements.insert_one(requirement_dict)
+        created_requirement_doc = await self.db.requirements.find_one({"_id": result.inserted_id})
+        await self._index_for_similarity([created_requirement_doc])
+        return Requirement.from_mongo(created_requirement_doc)
+    
+    async def bulk_import(
+        self,
+        items: AsyncIterator[Union[dict, str, bytes]],
+        generate_missing_descriptions: bool = False,
+        chunk_size: int = 1000,
+        description_batch_size: int = 10
+    ) -> BulkImportResultDTO:
+        """Import many requirements with chunked validation and unordered bulk writes.
         
+        Items are validated chunk by chunk, so a malformed item only rejects
+        itself. Each chunk is written with a single unordered `insert_many`,
+        which keeps going past individual write failures. Missing
+        descriptions are generated `description_batch_size` at a time, so
+        a large upload waits on the model rate limit instead of exhausting
+        it; items whose generation still fails are imported without one
+        and counted as unfilled.
+        
+        Args:
+            items: Requirement payloads, either parsed dictionaries or raw JSON documents.
+            generate_missing_descriptions: Generate an AI description for items without one.
+            chunk_size: Number of items validated and written together.
+            description_batch_size: Number of descriptions generated concurrently.
+            
         Returns:
-            List of all requirements, optionally sorted by stakeholder priority.
+            Summary with the number of inserted items, generated and
+            unfilled descriptions, and per-item errors.
         """
+        result = BulkImportResultDTO()
+        chunk = []
+        async for item in items:
+            chunk.append((result.received, item))
+            result.received += 1
+            if len(chunk) >= chunk_size:
+                await self._import_chunk(chunk, generate_missing_descriptions, description_batch_size, result)
+                chunk = []
+        if chunk:
+            await self._import_chunk(chunk, generate_missing_descriptions, description_batch_size, result)
+        
+        logger.info(f"Bulk import finished: {result.inserted_count}/{result.received} requirements inserted")
+        return result
+    
+    async def _import_chunk(
+        self,
+        chunk: List[Tuple[int, Any]],
+        generate_missing_descriptions: bool,
+        description_batch_size: int,
+        result: BulkImportResultDTO
+    ):
+        """Validate, optionally describe and insert one chunk of imported items."""
+        indexes = []
+        requirements = []
+        for index, item in chunk:
+            try:
+                if isinstance(item, (str, bytes)):
+                    requirement = RequirementDTO.model_validate_json(item)
+                else:
+                    requirement = RequirementDTO.model_validate(item)
+            except ValidationError as e:
+                result.errors.append(BulkImportErrorDTO(index=index, error=self._format_validation_error(e)))
+                continue
+            indexes.append(index)
+            requirements.append(requirement)
+        
+        if not requirements:
+            return
+        
+        if generate_missing_descriptions:
+            generated, unfilled = await self._fill_missing_descriptions(requirements, description_batch_size)
+            result.generated_descriptions += generated
+            result.unfilled_descriptions += unfilled
+        
+        created_at = datetime.utcnow()
+        documents = []
+        for requirement in requirements:
+            requirement_dict = requirement.model_dump()
+            requirement_dict['created_at'] = created_at
+            requirement_dict.update(self.ranking_service.ranking_fields(requirement_dict))
+            documents.append(requirement_dict)
+        
+        failed_positions = set()
         try:
-            logger.info("Fetching all requirements from database")
-            requirements = []
-            cursor = self.db.requirements.find()
-            count = 0
-            async for requirement_doc in cursor:
-                count += 1
-                logger.debug(f"Processing requirement {count}: {requirement_doc.get('_id')}")
-                try:
-                    requirement = Requirement.from_mongo(requirement_doc)
-                    requirements.append(requirement)
-                except Exception as validation_error:
-                    logger.warning(f"Skipping requirement {requirement_doc.get('_id')} due to validation error: {str(validation_error)}")
+            insert_result = await self.db.requirements.insert_many(documents, ordered=False)
+            result.inserted_count += len(insert_result.inserted_ids)
+        except BulkWriteError as e:
+            result.inserted_count += e.details.get("nInserted", 0)
+            for write_error in e.details.get("writeErrors", []):
+                failed_positions.add(write_error["index"])
+                result.errors.append(BulkImportErrorDTO(
+                    index=indexes[write_error["index"]],
+                    error=write_error.get("errmsg", "Write failed")
+                ))
+        
+        await self._index_for_similarity(
+            [document for position, document in enumerate(documents) if position not in failed_positions]
+        )
+    
+    async def _index_for_similarity(self, documents: List[dict]):
+        """Add created requirements to the similarity index without failing the write."""
+        try:
+            await self.similarity_service.index_documents(documents)
+        except Exception as e:
+            logger.warning(f"Failed to index requirements for similarity: {str(e)}")
+    
+    async def find_similar_requirements(self, requirement_id: str, limit: int = 10, min_score: float = 0.0) -> Optional[List[SimilarRequirementDTO]]:
+        """Find the requirements most similar to a given one.
+        
+        Args:
+            requirement_id: The requirement to compare against.
+            limit: Maximum number of similar requirements.
+            min_score: Minimum similarity score in [0, 1].
+            
+        Returns:
+            Similar requirements from most to least similar, or None when
+            the requirement does not exist.
+            
+        Raises:
+            ValueError: When requirement ID is invalid.
+        """
+        if not ObjectId.is_valid(requirement_id):
+            raise ValueError("Invalid requirement ID format")
+        
+        neighbours = await self.similarity_service.find_similar(requirement_id, limit, min_score)
+        if neighbours is None:
+            return None
+        
+        requirements = await self.get_requirements_by_ids([neighbour_id for neighbour_id, _ in neighbours])
+        titles = {requirement.id: requirement.title for requirement in requirements}
+        return [
+            SimilarRequirementDTO(requirement_id=neighbour_id, title=titles[neighbour_id], score=min(score, 1.0))
+            for neighbour_id, score in neighbours
+            if neighbour_id in titles
+        ]
+    
+    async def _fill_missing_descriptions(self, requirements: List[RequirementDTO], batch_size: int) -> Tuple[int, int]:
+        """Generate descriptions in bounded concurrent batches for requirements that have none.
+        
+        Returns:
+            Numbers of generated descriptions and of requirements left without one.
+        """
+        missing = [requirement for requirement in requirements if not requirement.description]
+        generated = 0
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            descriptions = await asyncio.gather(
+                *[
+                    self.gemini_service.generate_requirement_description(
+                        title=requirement.title,
+                        requirement_type=requirement.type,
+                        stakeholders=requirement.stakeholders,
+                        details=requirement.details if requirement.details is not None else ""
+                    )
+                    for requirement in batch
+                ],
+                return_exceptions=True
+            )
+            for requirement, description in zip(batch, descriptions):
+                if isinstance(description, Exception):
+                    logger.warning(f"Importing '{requirement.title}' without description: {str(description)}")
                     continue
+                requirement.description = description
+                generated += 1
+        return generated, len(missing) - generated
+    
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        """Condense a Pydantic validation error into a single line."""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    
+    async def get_all_requirements(
+        self,
+        stakeholder_name: Optional[str] = None,
+        filters: Optional[RequirementFilterDTO] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        refine_with_ai: bool = False
+    ) -> List[Requirement]:
+        """Retrieve requirements from the database.
+        
+        Without a stakeholder, results are paged with a keyset cursor on
+        `_id`, so each page is an indexed range scan instead of a skip. With
+        a stakeholder, pages are read with a keyset cursor on the stored
+        ranking scores once every requirement has been scored, and ranked
+        on the fly otherwise.
+        
+        Args:
+            stakeholder_name: Optional stakeholder name to sort requirements by priority
+            filters: Optional server-side filters on status, type, stakeholders and priority
+            limit: Maximum number of requirements to return, all when None
+            after: ID of the last requirement of the previous page
+            fields: Optional fields to include besides the required ones
+            refine_with_ai: Let the LLM re-rank the head of the stakeholder ordering
+        
+        Returns:
+            Requirements matching the filters, optionally sorted by stakeholder priority.
+            
+        Raises:
+            ValueError: When the cursor or a projected field is invalid, or
+                the cursor is not a requirement of the ordering.
+        """
+        if after is not None and not ObjectId.is_valid(after):
+            raise ValueError("Invalid cursor format")
+        projection = self._build_projection(fields)
+        query = filters.to_query() if filters else {}
+        
+        try:
+            logger.info("Fetching requirements from database")
+            if stakeholder_name and not refine_with_ai and self.ranking_service.ready:
+                requirements = await self._page_ranked(stakeholder_name, query, projection, after, limit)
+                logger.info(f"Returning {len(requirements)} requirements from the stored ranking scores")
+                return requirements
+            
+            if stakeholder_name:
+                requirements = await self._find_requirements(query, projection)
+            else:
+                if after is not None:
+                    query["_id"] = {"$gt": ObjectId(after)}
+                requirements = await self._find_requirements(query, projection, limit)
             
             logger.info(f"Successfully retrieved {len(requirements)} requirements")
             
             # Sort by stakeholder priority if stakeholder_name is provided
             if stakeholder_name and requirements:
                 try:
-                    logger.info(f"Sorting requirements by stakeholder priority: {stakeholder_name}")
-                    sorted_ids = await self.gemini_service.sort_requirements_by_stakeholder(
-                        requirements, stakeholder_name
+                    logger.info(f"Ranking requirements for stakeholder: {stakeholder_name}")
+                    requirements = await self.ranking_service.rank(
+                        requirements, stakeholder_name, refine_with_ai=refine_with_ai
                     )
-                    
-                    # Create a mapping of requirement ID to requirement object
-                    req_map = {req.id: req for req in requirements}
-                    
-                    # Sort requirements based on AI response
-                    sorted_requirements = []
-                    for req_id in sorted_ids:
-                        if req_id in req_map:
-                            sorted_requirements.append(req_map[req_id])
-                    
-                    # Add any remaining requirements that weren't in the AI response
-                    remaining_requirements = [req for req in requirements if req.id not in sorted_ids]
-                    sorted_requirements.extend(remaining_requirements)
-                    
-                    logger.info(f"Successfully sorted requirements for stakeholder: {stakeholder_name}")
-                    return sorted_requirements
-                    
                 except Exception as e:
                     logger.warning(f"Failed to sort by stakeholder priority, returning unsorted list: {str(e)}")
-                    return requirements
             
+            if stakeholder_name:
+                return self._page_after(requirements, after, limit)
             return requirements
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving requirements: {str(e)}")
             raise Exception(f"Database error while retrieving requirements: {str(e)}")
     
+    async def iter_requirements(self, filters: Optional[RequirementFilterDTO] = None, batch_size: int = 500) -> AsyncIterator[Requirement]:
+        """Stream requirements from the database in `_id` order.
+        
+        Documents are pulled from the cursor in batches of `batch_size`, so
+        memory use does not depend on the size of the collection.
+        
+        Args:
+            filters: Optional server-side filters on status, type, stakeholders and priority
+            batch_size: Number of documents fetched per round trip
+            
+        Yields:
+            Each valid requirement matching the filters.
+        """
+        query = filters.to_query() if filters else {}
+        cursor = self.db.requirements.find(query).sort("_id", ASCENDING).batch_size(batch_size)
+        async for requirement_doc in cursor:
+            try:
+                yield Requirement.from_mongo(requirement_doc)
+            except Exception as validation_error:
+                logger.warning(f"Skipping requirement {requirement_doc.get('_id')} due to validation error: {str(validation_error)}")
+    
+    async def iter_requirement_documents(self, filters: Optional[RequirementFilterDTO] = None, batch_size: int = 500) -> AsyncIterator[dict]:
+        """Stream raw requirement documents in `_id` order, without validation.
+        
+        Every write path validates requirements before storing them, so
+        consumers that only serialize what they read can skip building
+        models. Only requirement fields are projected and `_id` is
+        converted to its string form.
+        
+        Args:
+            filters: Optional server-side filters on status, type, stakeholders and priority
+            batch_size: Number of documents fetched per round trip
+            
+        Yields:
+            Each requirement document matching the filters.
+        """
+        query = filters.to_query() if filters else {}
+        projection = {field: 1 for field in PROJECTABLE_FIELDS}
+        cursor = self.db.requirements.find(query, projection).sort("_id", ASCENDING).batch_size(batch_size)
+        async for requirement_doc in cursor:
+            requirement_doc["_id"] = str(requirement_doc["_id"])
+            yield requirement_doc
+    
+    async def _find_requirements(self, query: dict, projection: Optional[dict], limit: Optional[int] = None) -> List[Requirement]:
+        """Run a requirements query in `_id` order and validate the documents."""
+        cursor = self.db.requirements.find(query, projection).sort("_id", ASCENDING)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        
+        requirements = []
+        async for requirement_doc in cursor:
+            try:
+                requirements.append(Requirement.from_mongo(requirement_doc))
+            except Exception as validation_error:
+                logger.warning(f"Skipping requirement {requirement_doc.get('_id')} due to validation error: {str(validation_error)}")
+        return requirements
+    
+    def _build_projection(self, fields: Optional[List[str]]) -> Optional[dict]:
+        """Build a projection keeping the required fields plus the requested ones.
+        
+        Raises:
+            ValueError: When a requested field does not exist.
+        """
+        if not fields:
+            return None
+        unknown = set(fields) - PROJECTABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown requirement fields: {', '.join(sorted(unknown))}")
+        return {field: 1 for field in REQUIRED_FIELDS | set(fields)}
+    
+    async def _page_ranked(
+        self,
+        stakeholder_name: str,
+        query: dict,
+        projection: Optional[dict],
+        after: Optional[str],
+        limit: Optional[int]
+    ) -> List[Requirement]:
+        """Page through a stakeholder ordering with a keyset cursor on the stored scores.
+        
+        The ordering is the merge of two indexed scans sorted by
+        `(ranking_score, _id)`: the stakeholder's requirements, whose score
+        includes the membership weight, and every other requirement. Each
+        scan starts after the cursor and reads at most `limit` documents.
+        Scores and the membership weight are stored on a common binary grid,
+        so the bound shifted into the other group equals stored scores exactly
+        and ties continue on `_id`.
+        
+        Raises:
+            ValueError: When the cursor is not a scored requirement.
+        """
+        stakeholder_key = self.ranking_service.stakeholder_key(stakeholder_name)
+        weight = self.ranking_service.membership_weight
+        if projection is not None:
+            projection = {**projection, "ranking_score": 1}
+        
+        cursor = None
+        if after is not None:
+            cursor_doc = await self.db.requirements.find_one(
+                {"_id": ObjectId(after)}, {"ranking_score": 1, "stakeholder_keys": 1}
+            )
+            if cursor_doc is None or cursor_doc.get("ranking_score") is None:
+                raise ValueError(f"Unknown cursor: {after}")
+            membership = 1.0 if stakeholder_key in cursor_doc.get("stakeholder_keys", []) else 0.0
+            cursor = (cursor_doc["ranking_score"], membership, cursor_doc["_id"])
+        
+        groups = []
+        for membership, group_filter in ((1.0, {"stakeholder_keys": stakeholder_key}), (0.0, {"stakeholder_keys": {"$ne": stakeholder_key}})):
+            conditions = [condition for condition in (query, group_filter) if condition]
+            if cursor is not None:
+                cursor_score, cursor_membership, cursor_id = cursor
+                bound = cursor_score if membership == cursor_membership else cursor_score + weight * (cursor_membership - membership)
+                conditions.append({"$or": [
+                    {"ranking_score": {"$lt": bound}},
+                    {"ranking_score": bound, "_id": {"$gt": cursor_id}},
+                ]})
+            groups.append(self._scan_ranked(conditions, projection, membership * weight, limit))
+        
+        requirements = []
+        for _, requirement_doc in heapq.merge(*await asyncio.gather(*groups)):
+            if limit is not None and len(requirements) == limit:
+                break
+            try:
+                requirements.append(Requirement.from_mongo(requirement_doc))
+            except Exception as validation_error:
+                logger.warning(f"Skipping requirement {requirement_doc.get('_id')} due to validation error: {str(validation_error)}")
+        return requirements
+    
+    async def _scan_ranked(self, conditions: List[dict], projection: Optional[dict], bonus: float, limit: Optional[int]) -> List[Tuple[Tuple[float, ObjectId], dict]]:
+        """Read one group of a stakeholder ordering as `(sort key, document)` pairs."""
+        cursor = self.db.requirements.find({"$and": conditions} if conditions else {}, projection).sort(
+            [("ranking_score", DESCENDING), ("_id", ASCENDING)]
+        )
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return [((-(requirement_doc["ranking_score"] + bonus), requirement_doc["_id"]), requirement_doc) async for requirement_doc in cursor]
+    
+    @staticmethod
+    def _page_after(requirements: List[Requirement], after: Optional[str], limit: Optional[int]) -> List[Requirement]:
+        """Slice an already ordered list to the page following the cursor.
+        
+        Raises:
+            ValueError: When the cursor is not in the list.
+        """
+        start = 0
+        if after is not None:
+            for index, requirement in enumerate(requirements):
+                if requirement.id == after:
+                    start = index + 1
+                    break
+            else:
+                raise ValueError(f"Unknown cursor: {after}")
+        end = start + limit if limit is not None else None
+        return requirements[start:end]
+    
     async def get_requirement_by_id(self, requirement_id: str) -> Optional[Requirement]:
         """Retrieve a specific requirement by its ID.
         
@@ -157,6 +562,35 @@ class RequirementsService:
         except Exception as e:
             raise Exception(f"Database error while retrieving requirement: {str(e)}")
     
+    async def get_requirements_by_ids(self, requirement_ids: List[str]) -> List[Requirement]:
+        """Retrieve several requirements with a single `$in` query.
+        
+        Args:
+            requirement_ids: The unique identifiers of the requirements.
+            
+        Returns:
+            The requirements found, in the order of `requirement_ids`.
+            
+        Raises:
+            ValueError: When a requirement ID is invalid.
+        """
+        invalid_ids = [requirement_id for requirement_id in requirement_ids if not ObjectId.is_valid(requirement_id)]
+        if invalid_ids:
+            raise ValueError(f"Invalid requirement ID format: {', '.join(invalid_ids)}")
+        
+        object_ids = list({ObjectId(requirement_id) for requirement_id in requirement_ids})
+        try:
+            requirements = await self._find_requirements({"_id": {"$in": object_ids}}, None)
+        except Exception as e:
+            raise Exception(f"Database error while retrieving requirements: {str(e)}")
+        
+        requirements_by_id = {requirement.id: requirement for requirement in requirements}
+        ordered = []
+        for requirement_id in dict.fromkeys(requirement_ids):
+            if requirement_id in requirements_by_id:
+                ordered.append(requirements_by_id[requirement_id])
+        return ordered
+    
     async def generate_glossary(self) -> dict:
         """Generate a glossary from all requirements using AI.
         
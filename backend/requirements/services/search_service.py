@@ -0,0 +1,205 @@
+"""Search service for full-text queries over requirements and the glossary."""
+
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+from bson import ObjectId
+from pymongo import IndexModel, TEXT
+
+from backend.config.database import get_database
+from backend.config.indexes import register_indexes
+from backend.core.utils.text import fold_text, tokenize
+from backend.requirements.dtos.search_result_dto import GlossaryTermHitDTO, RequirementSearchHitDTO, SearchResultDTO
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+register_indexes("requirements", [
+    IndexModel(
+        [("title", TEXT), ("details", TEXT), ("description", TEXT)],
+        name="text_search",
+        weights={"title": 10, "details": 4, "description": 1},
+        default_language="portuguese",
+        language_override="text_language"
+    ),
+])
+
+NAME_MATCH_WEIGHT = 2.0
+DEFINITION_MATCH_WEIGHT = 1.0
+
+class SearchService:
+    """Service class answering full-text search queries.
+
+    Requirements are matched with the MongoDB text index on title, details
+    and description, which applies Portuguese stemming and is case and
+    diacritic insensitive, and are ordered by text score with title matches
+    weighted highest. Quoted phrases and `-negated` words follow the
+    MongoDB `$text` syntax. Pages follow a keyset cursor on `(score, _id)`,
+    so a deep page sorts only its own hits instead of every skipped one;
+    `offset` is still accepted for direct access to shallow pages.
+
+    Glossary terms live in a single small document, so they are matched in
+    process with an inverted index over folded, stemmed term names and
+    definitions. The index is rebuilt only when the glossary changes.
+    """
+
+    def __init__(self):
+        """Initialize the SearchService."""
+        self.db = get_database()
+        self._glossary_version: Optional[Tuple] = None
+        self._glossary_terms: List[Dict[str, str]] = []
+        self._name_postings: Dict[str, Set[int]] = {}
+        self._definition_postings: Dict[str, Set[int]] = {}
+        self._folded_names: List[str] = []
+
+    async def search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 20,
+        include_glossary: bool = True,
+        after: Optional[str] = None
+    ) -> SearchResultDTO:
+        """Search requirements and glossary terms.
+
+        Args:
+            query: Free-text query.
+            offset: Number of requirement hits to skip.
+            limit: Maximum number of requirement hits to return.
+            include_glossary: Also match glossary terms. They are only
+                returned with the first page.
+            after: `next_cursor` of the previous page, instead of an offset.
+
+        Returns:
+            One page of ranked results.
+
+        Raises:
+            ValueError: When the query has no searchable words, or the
+                cursor is invalid or combined with an offset.
+            Exception: When the database query fails.
+        """
+        if not tokenize(query):
+            raise ValueError("Search query must contain at least one searchable word")
+        if after is not None and offset:
+            raise ValueError("Use either offset or after, not both")
+        bound = self.decode_cursor(after) if after is not None else None
+
+        try:
+            requirement_hits = await self._search_requirements(query, offset, limit + 1, bound)
+            first_page = offset == 0 and after is None
+            glossary_hits = await self._search_glossary(query) if include_glossary and first_page else []
+        except Exception as e:
+            logger.error(f"Error searching for '{query}': {str(e)}")
+            raise Exception(f"Failed to search: {str(e)}")
+
+        has_more = len(requirement_hits) > limit
+        page = requirement_hits[:limit]
+        return SearchResultDTO(
+            query=query,
+            requirements=page,
+            glossary_terms=glossary_hits,
+            offset=offset,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=self.encode_cursor(page[-1]) if has_more else None
+        )
+
+    @staticmethod
+    def encode_cursor(hit: RequirementSearchHitDTO) -> str:
+        """Build the cursor of the page following a hit.
+
+        Args:
+            hit: Last hit of a page.
+
+        Returns:
+            The exact score and the ID of the hit, as `score:id`.
+        """
+        return f"{hit.score!r}:{hit.requirement_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[float, ObjectId]:
+        """Read a cursor built by `encode_cursor`.
+
+        Args:
+            cursor: The `score:id` cursor.
+
+        Returns:
+            The score and ID of the last hit of the previous page.
+
+        Raises:
+            ValueError: When the cursor is malformed.
+        """
+        score, _, requirement_id = cursor.rpartition(":")
+        try:
+            value = float(score)
+        except ValueError:
+            raise ValueError("Invalid search cursor")
+        if not ObjectId.is_valid(requirement_id) or value != value:
+            raise ValueError("Invalid search cursor")
+        return value, ObjectId(requirement_id)
+
+    async def _search_requirements(self, query: str, offset: int, limit: int, after: Optional[Tuple[float, ObjectId]]) -> List[RequirementSearchHitDTO]:
+        """Run a ranked `$text` query and return one page of hits, after a `(score, _id)` bound when given."""
+        pipeline = [
+            {"$match": {"$text": {"$search": query}}},
+            {"$project": {"title": 1, "score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            score, requirement_id = after
+            pipeline.append({"$match": {"$or": [
+                {"score": {"$lt": score}},
+                {"score": score, "_id": {"$gt": requirement_id}},
+            ]}})
+        pipeline.append({"$sort": {"score": -1, "_id": 1}})
+        if offset:
+            pipeline.append({"$skip": offset})
+        pipeline.append({"$limit": limit})
+        return [
+            RequirementSearchHitDTO(requirement_id=str(document["_id"]), title=document.get("title", ""), score=document["score"])
+            async for document in self.db.requirements.aggregate(pipeline)
+        ]
+
+    async def _search_glossary(self, query: str) -> List[GlossaryTermHitDTO]:
+        """Match glossary terms against the stems of the query."""
+        await self._refresh_glossary_index()
+        stems = set(tokenize(query))
+        folded_query = fold_text(query)
+
+        scores: Dict[int, float] = {}
+        for stem in stems:
+            for index in self._name_postings.get(stem, ()):
+                scores[index] = scores.get(index, 0.0) + NAME_MATCH_WEIGHT
+            for index in self._definition_postings.get(stem, ()):
+                scores[index] = scores.get(index, 0.0) + DEFINITION_MATCH_WEIGHT
+
+        maximum = (NAME_MATCH_WEIGHT + DEFINITION_MATCH_WEIGHT) * len(stems)
+        hits = []
+        for index, raw_score in scores.items():
+            score = 1.0 if self._folded_names[index] == folded_query else min(raw_score / maximum, 1.0)
+            term = self._glossary_terms[index]
+            hits.append(GlossaryTermHitDTO(name=term["name"], definition=term["definition"], score=score))
+        hits.sort(key=lambda hit: (-hit.score, fold_text(hit.name)))
+        return hits
+
+    async def _refresh_glossary_index(self):
+        """Rebuild the glossary inverted index when the stored glossary changed."""
+        glossary_doc = await self.db.glossaries.find_one({}, {"terms": 1, "updated_at": 1}, sort=[("created_at", -1)])
+        version = (glossary_doc["_id"], glossary_doc.get("updated_at")) if glossary_doc else None
+        if version == self._glossary_version:
+            return
+
+        terms = [term for term in (glossary_doc or {}).get("terms", []) if term.get("name") and term.get("definition")]
+        name_postings: Dict[str, Set[int]] = {}
+        definition_postings: Dict[str, Set[int]] = {}
+        for index, term in enumerate(terms):
+            for stem in tokenize(term["name"]):
+                name_postings.setdefault(stem, set()).add(index)
+            for stem in tokenize(term["definition"]):
+                definition_postings.setdefault(stem, set()).add(index)
+
+        self._glossary_terms = terms
+        self._name_postings = name_postings
+        self._definition_postings = definition_postings
+        self._folded_names = [fold_text(term["name"]) for term in terms]
+        self._glossary_version = version
+        logger.info(f"Indexed {len(terms)} glossary terms for search")
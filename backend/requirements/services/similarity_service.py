@@ -0,0 +1,358 @@
+"""Similarity service indexing requirements for near-duplicate detection."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import zlib
+
+import numpy as np
+from bson import ObjectId
+
+from backend.config.database import get_database
+from backend.core.utils.text import tokenize
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+INDEX_PROJECTION = {"title": 1, "details": 1, "description": 1}
+ROW_DTYPE = np.dtype([("id", "S24"), ("hash", "S32")])
+INITIAL_CAPACITY = 1024
+SYNC_BATCH_SIZE = 500
+NORM_CHUNK_ROWS = 8192
+IDF_REFRESH_RATIO = 0.1
+FLUSH_DELAY_SECONDS = 1.0
+
+class SimilarityService:
+    """Service class maintaining a vector index of requirement texts.
+
+    Title, details and description are embedded with a hashed TF-IDF
+    vectorizer: stemmed unigrams and bigrams are hashed into a fixed number
+    of signed buckets, so no vocabulary has to be stored and the index
+    works offline. Term frequencies are kept in a memory-mapped matrix on
+    disk together with per-bucket document frequencies, which makes every
+    insert an in-place row write.
+
+    Queries weight the vectors with a snapshot of the IDF weights and the
+    row norms taken under that snapshot. New and changed rows get their
+    norm on write; the snapshot and all norms are recomputed in a worker
+    thread once more than `IDF_REFRESH_RATIO` of the rows changed since.
+    The search is exact: every query scores all rows with one
+    matrix-vector product in a worker thread, which is linear in the
+    corpus size (about 200 MB of vectors per 100k requirements at 512
+    dimensions). Writes are flushed to disk at most every
+    `FLUSH_DELAY_SECONDS`; rows lost to a crash before a flush are
+    re-indexed by the startup synchronization.
+
+    The index files are owned by one application process; each worker
+    process needs its own `index_dir`.
+
+    Attributes:
+        index_dir: Directory holding the index files.
+        dimensions: Number of hashed feature buckets per vector.
+    """
+
+    def __init__(self, index_dir: str, dimensions: int):
+        """Initialize the SimilarityService.
+
+        Args:
+            index_dir: Directory holding the index files.
+            dimensions: Number of hashed feature buckets per vector.
+        """
+        self.db = get_database()
+        self.index_dir = index_dir
+        self.dimensions = dimensions
+        self._count = 0
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._rows: Optional[np.memmap] = None
+        self._document_frequency: Optional[np.memmap] = None
+        self._ids: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._idf: Optional[np.ndarray] = None
+        self._idf_count = 0
+        self._stale_rows = 0
+        self._lock = asyncio.Lock()
+        self._sync_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Open the on-disk index and index missing requirements in the background."""
+        self._open()
+        self._sync_task = asyncio.create_task(self._sync_in_background())
+
+    async def stop(self):
+        """Stop the background synchronization and flush the index to disk."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+            self._sync_task = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        if self._vectors is not None:
+            self._flush()
+
+    async def sync(self) -> int:
+        """Index every stored requirement that is new or changed since it was indexed.
+
+        Returns:
+            Number of requirements added or refreshed.
+        """
+        indexed = 0
+        batch = []
+        async for requirement_doc in self.db.requirements.find({}, INDEX_PROJECTION):
+            batch.append(requirement_doc)
+            if len(batch) >= SYNC_BATCH_SIZE:
+                indexed += await self.index_documents(batch)
+                batch = []
+        if batch:
+            indexed += await self.index_documents(batch)
+        return indexed
+
+    async def index_documents(self, documents: Iterable[dict]) -> int:
+        """Add requirements to the index, refreshing those whose text changed.
+
+        Args:
+            documents: Requirement documents with `_id`, `title`, `details`
+                and `description` fields.
+
+        Returns:
+            Number of requirements added or refreshed.
+        """
+        async with self._lock:
+            changed = 0
+            for document in documents:
+                requirement_id = str(document["_id"])
+                text = self.document_text(document)
+                digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest().encode("ascii")
+                row = self._row_by_id.get(requirement_id)
+                if row is not None and self._rows[row]["hash"] == digest:
+                    continue
+
+                vector = self.vectorize(text)
+                if row is None:
+                    row = self._append_row(requirement_id)
+                else:
+                    self._document_frequency -= self._vectors[row] != 0
+                self._vectors[row] = vector
+                self._rows[row] = (requirement_id.encode("ascii"), digest)
+                self._document_frequency += vector != 0
+                if self._idf is not None:
+                    self._norms[row] = np.linalg.norm(vector * self._idf)
+                changed += 1
+
+            if changed:
+                self._stale_rows += changed
+                self._schedule_flush()
+            return changed
+
+    async def find_similar(self, requirement_id: str, limit: int, min_score: float = 0.0) -> Optional[List[Tuple[str, float]]]:
+        """Find the requirements closest to a stored requirement.
+
+        Args:
+            requirement_id: The requirement to compare against.
+            limit: Maximum number of neighbours.
+            min_score: Minimum cosine similarity in [0, 1].
+
+        Returns:
+            `(requirement_id, score)` pairs from most to least similar, or
+            None when the requirement does not exist.
+        """
+        row = self._row_by_id.get(requirement_id)
+        if row is None:
+            requirement_doc = await self.db.requirements.find_one({"_id": ObjectId(requirement_id)}, INDEX_PROJECTION)
+            if requirement_doc is None:
+                return None
+            await self.index_documents([requirement_doc])
+            row = self._row_by_id[requirement_id]
+        return await self._nearest(np.array(self._vectors[row]), limit, min_score, exclude_row=row)
+
+    async def find_similar_text(self, text: str, limit: int, min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """Find the requirements closest to an arbitrary text.
+
+        Args:
+            text: Text to compare against.
+            limit: Maximum number of neighbours.
+            min_score: Minimum cosine similarity in [0, 1].
+
+        Returns:
+            `(requirement_id, score)` pairs from most to least similar.
+        """
+        return await self._nearest(self.vectorize(text), limit, min_score)
+
+    @staticmethod
+    def document_text(document: dict) -> str:
+        """Concatenate the indexed fields of a requirement, weighting the title twice."""
+        title = document.get("title") or ""
+        return " ".join(part for part in (title, title, document.get("details"), document.get("description")) if part)
+
+    def vectorize(self, text: str) -> np.ndarray:
+        """Embed a text as a hashed, log-scaled term frequency vector.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Float32 vector with `dimensions` entries.
+        """
+        tokens = tokenize(text)
+        features = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in features:
+            hashed = zlib.crc32(feature.encode("utf-8"))
+            vector[hashed % self.dimensions] += 1.0 if hashed & 0x80000000 else -1.0
+        return np.sign(vector) * np.log1p(np.abs(vector))
+
+    async def _nearest(self, vector: np.ndarray, limit: int, min_score: float, exclude_row: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Rank indexed rows by IDF-weighted cosine similarity to a vector."""
+        await self._refresh_weights()
+        count = self._count
+        if count == 0 or limit <= 0:
+            return []
+
+        query = vector * self._idf
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+
+        scores = await asyncio.to_thread(self._score_rows, self._vectors, self._norms, count, query * self._idf, query_norm)
+        if exclude_row is not None:
+            scores[exclude_row] = -np.inf
+
+        k = min(limit, count)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._ids[row], float(scores[row])) for row in candidates if scores[row] >= min_score and scores[row] > 0]
+
+    async def _refresh_weights(self):
+        """Take a new IDF snapshot and recompute every row norm once enough rows changed."""
+        if not self._weights_stale():
+            return
+        async with self._lock:
+            if not self._weights_stale():
+                return
+            count = self._count
+            idf = (np.log((1.0 + count) / (1.0 + np.asarray(self._document_frequency))) + 1.0).astype(np.float32)
+            norms = await asyncio.to_thread(self._row_norms, self._vectors, count, idf)
+            self._norms[:count] = norms
+            self._idf, self._idf_count, self._stale_rows = idf, count, 0
+
+    def _weights_stale(self) -> bool:
+        return self._idf is None or self._stale_rows > IDF_REFRESH_RATIO * self._idf_count
+
+    @staticmethod
+    def _row_norms(vectors: np.memmap, count: int, idf: np.ndarray) -> np.ndarray:
+        """IDF-weighted norm of the first `count` rows, read in chunks."""
+        squared_idf = idf * idf
+        norms = np.empty(count, dtype=np.float32)
+        for start in range(0, count, NORM_CHUNK_ROWS):
+            end = min(start + NORM_CHUNK_ROWS, count)
+            chunk = np.asarray(vectors[start:end])
+            norms[start:end] = np.sqrt((chunk * chunk) @ squared_idf)
+        return norms
+
+    @staticmethod
+    def _score_rows(vectors: np.memmap, norms: np.ndarray, count: int, weighted_query: np.ndarray, query_norm: float) -> np.ndarray:
+        """Cosine similarity of the first `count` rows to a weighted query."""
+        scores = np.zeros(count, dtype=np.float64)
+        for start in range(0, count, NORM_CHUNK_ROWS):
+            end = min(start + NORM_CHUNK_ROWS, count)
+            chunk_norms = norms[start:end]
+            dots = np.asarray(vectors[start:end]) @ weighted_query
+            np.divide(dots, chunk_norms * query_norm, out=scores[start:end], where=chunk_norms > 0)
+        return scores
+
+    def _append_row(self, requirement_id: str) -> int:
+        """Reserve the next row for a requirement, growing the files when full."""
+        if self._count == self._capacity:
+            self._resize(self._capacity * 2)
+        row = self._count
+        self._count += 1
+        self._ids.append(requirement_id)
+        self._row_by_id[requirement_id] = row
+        return row
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.index_dir, name)
+
+    def _open(self):
+        """Map the index files, creating an empty index when none is usable."""
+        os.makedirs(self.index_dir, exist_ok=True)
+        meta = None
+        if os.path.exists(self._path("meta.json")):
+            with open(self._path("meta.json"), "r", encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+
+        if meta is None or meta.get("dimensions") != self.dimensions:
+            if meta is not None:
+                logger.warning("Similarity index dimensions changed, rebuilding the index")
+            self._create(INITIAL_CAPACITY)
+            return
+
+        self._capacity = os.path.getsize(self._path("vectors.f32")) // (self.dimensions * 4)
+        self._count = meta["count"]
+        self._map("r+")
+        self._ids = [raw_id.decode("ascii") for raw_id in self._rows["id"][:self._count]]
+        self._row_by_id = {requirement_id: row for row, requirement_id in enumerate(self._ids)}
+        self._norms = np.zeros(self._capacity, dtype=np.float32)
+        logger.info(f"Opened similarity index with {self._count} requirements")
+
+    def _create(self, capacity: int):
+        self._capacity = capacity
+        self._count = 0
+        self._ids = []
+        self._row_by_id = {}
+        self._norms = np.zeros(capacity, dtype=np.float32)
+        self._map("w+")
+        self._flush()
+
+    def _map(self, mode: str):
+        self._vectors = np.memmap(self._path("vectors.f32"), dtype=np.float32, mode=mode, shape=(self._capacity, self.dimensions))
+        self._rows = np.memmap(self._path("rows.bin"), dtype=ROW_DTYPE, mode=mode, shape=(self._capacity,))
+        self._document_frequency = np.memmap(self._path("df.f32"), dtype=np.float32, mode=mode, shape=(self.dimensions,))
+
+    def _resize(self, capacity: int):
+        """Grow the row files to a new capacity and remap them."""
+        self._flush()
+        del self._vectors, self._rows
+        for name, row_bytes in (("vectors.f32", self.dimensions * 4), ("rows.bin", ROW_DTYPE.itemsize)):
+            with open(self._path(name), "r+b") as index_file:
+                index_file.truncate(capacity * row_bytes)
+        self._capacity = capacity
+        self._vectors = np.memmap(self._path("vectors.f32"), dtype=np.float32, mode="r+", shape=(capacity, self.dimensions))
+        self._rows = np.memmap(self._path("rows.bin"), dtype=ROW_DTYPE, mode="r+", shape=(capacity,))
+        self._norms = np.concatenate([self._norms, np.zeros(capacity - len(self._norms), dtype=np.float32)])
+
+    def _flush(self):
+        """Write mapped pages to disk, then record the row count atomically."""
+        self._vectors.flush()
+        self._rows.flush()
+        self._document_frequency.flush()
+        temporary_path = self._path("meta.json.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as meta_file:
+            json.dump({"dimensions": self.dimensions, "count": self._count}, meta_file)
+        os.replace(temporary_path, self._path("meta.json"))
+
+    def _schedule_flush(self):
+        """Flush the index after `FLUSH_DELAY_SECONDS` unless a flush is already pending."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(FLUSH_DELAY_SECONDS)
+        async with self._lock:
+            self._flush()
+
+    async def _sync_in_background(self):
+        try:
+            indexed = await self.sync()
+            logger.info(f"Similarity index synchronized, {indexed} requirements added or refreshed")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to synchronize similarity index: {str(e)}")
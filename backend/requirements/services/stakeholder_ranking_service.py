@@ -0,0 +1,356 @@
+"""Stakeholder ranking service for ordering requirements without the LLM."""
+
+from typing import Dict, List, Tuple
+import asyncio
+import logging
+
+import numpy as np
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+
+from backend.ai.services.gemini_service import GeminiService
+from backend.config.database import get_database
+from backend.config.indexes import register_indexes
+from backend.config.settings import settings
+from backend.requirements.enums.complexity_level import ComplexityLevel
+from backend.requirements.enums.priority_level import PriorityLevel
+from backend.requirements.enums.risk_level import RiskLevel
+from backend.requirements.models.requirement import Requirement
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+PRIORITY_SCORES = {level: index / (len(PriorityLevel) - 1) for index, level in enumerate(PriorityLevel)}
+RISK_SCORES = {level: index / (len(RiskLevel) - 1) for index, level in enumerate(RiskLevel)}
+COMPLEXITY_SCORES = {level: index / (len(ComplexityLevel) - 1) for index, level in enumerate(ComplexityLevel)}
+
+RANKING_PROJECTION = {"stakeholders": 1, "attributes": 1, "ranking_score": 1, "stakeholder_keys": 1}
+WATCHED_COLLECTIONS = ["wiegers_matrices"]
+RESCORE_BATCH_SIZE = 1000
+SCORE_QUANTUM = 2.0 ** -20
+
+register_indexes("requirements", [
+    IndexModel(
+        [("stakeholder_keys", ASCENDING), ("ranking_score", DESCENDING), ("_id", ASCENDING)],
+        name="stakeholder_keys_ranking_score_id"
+    ),
+    IndexModel([("ranking_score", DESCENDING), ("_id", ASCENDING)], name="ranking_score_id"),
+])
+
+class StakeholderRankingService:
+    """Service class ranking requirements for a stakeholder from stored fields.
+
+    Each requirement is scored from stakeholder membership, attribute
+    priority, risk, complexity, effort estimation and the latest Wiegers
+    priority. Scores are computed with NumPy over column arrays of the
+    whole corpus, so ranking costs milliseconds instead of an LLM call.
+    An optional LLM pass can refine the head of the ranking.
+
+    For paging, the stakeholder-independent part of the score is stored
+    on each requirement as `ranking_score`, together with its normalized
+    `stakeholder_keys`. A stakeholder ordering is then the merge of two
+    index scans: its own requirements by `ranking_score` plus the
+    membership weight, and the others by `ranking_score`. New requirements
+    are scored when they are written. The whole corpus is rescored in the
+    background only when Wiegers priorities or the scale of the effort
+    column change, detected with change streams when the deployment
+    supports them and with a periodic rescore otherwise; only documents
+    whose score changed are written back.
+
+    Attributes:
+        weights: Weights of membership, priority, risk, complexity, effort
+            and Wiegers priority.
+        ready: Whether every stored requirement has been scored, so pages
+            can be read from the stored scores.
+    """
+
+    def __init__(self, gemini_service: GeminiService):
+        """Initialize the StakeholderRankingService.
+
+        Args:
+            gemini_service: Shared Gemini service used for optional AI refinement.
+        """
+        self.db = get_database()
+        self.gemini_service = gemini_service
+        self.weights = np.array([
+            settings.RANKING_WEIGHT_MEMBERSHIP,
+            settings.RANKING_WEIGHT_PRIORITY,
+            settings.RANKING_WEIGHT_RISK,
+            settings.RANKING_WEIGHT_COMPLEXITY,
+            settings.RANKING_WEIGHT_EFFORT,
+            settings.RANKING_WEIGHT_WIEGERS,
+        ], dtype=np.float64)
+        self.ready = False
+        self._effort_max = 0.0
+        self._wiegers_max = 0.0
+        self._dirty = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def membership_weight(self) -> float:
+        """Score bonus of requirements that belong to the ranked stakeholder, rounded like the stored scores."""
+        return float(np.round(self.weights[0] / SCORE_QUANTUM) * SCORE_QUANTUM)
+
+    async def start(self):
+        """Start the background tasks maintaining the stored ranking scores."""
+        await self.db.stakeholder_rankings.drop()
+        self._dirty.set()
+        self._tasks = [
+            asyncio.create_task(self._rebuild_loop()),
+            asyncio.create_task(self._watch_changes()),
+        ]
+
+    async def stop(self):
+        """Cancel the background tasks and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def mark_dirty(self):
+        """Schedule a rescore of every stored requirement."""
+        self._dirty.set()
+
+    def ranking_fields(self, requirement_doc: dict) -> Dict[str, object]:
+        """Compute the stored ranking fields of a requirement about to be written.
+
+        The score uses the column scales of the last rescore. A new
+        requirement has no Wiegers matrix yet; one whose effort exceeds the
+        current scale schedules a rescore of the corpus.
+
+        Args:
+            requirement_doc: Requirement document with `stakeholders` and `attributes`.
+
+        Returns:
+            The `ranking_score` and `stakeholder_keys` fields to store.
+        """
+        row = self._feature_row(requirement_doc, {})
+        if row[3] > self._effort_max:
+            self.mark_dirty()
+        score = self._score_rows(np.array([row], dtype=np.float64), self._effort_max, self._wiegers_max)[0]
+        return {"ranking_score": float(score), "stakeholder_keys": self.stakeholder_keys(requirement_doc.get("stakeholders", []))}
+
+    async def rebuild_rankings(self) -> int:
+        """Rescore every stored requirement and write back the changed scores.
+
+        Documents are read as raw columns without model validation, the
+        scores are computed in a worker thread, and only requirements whose
+        score or stakeholder keys changed are updated, in unordered batches.
+
+        Returns:
+            Number of requirements updated.
+        """
+        wiegers_priorities = await self.get_wiegers_priorities()
+        ids = []
+        rows = []
+        stored = []
+        async for requirement_doc in self.db.requirements.find({}, RANKING_PROJECTION).batch_size(RESCORE_BATCH_SIZE):
+            try:
+                rows.append(self._feature_row(requirement_doc, wiegers_priorities))
+            except (KeyError, TypeError, ValueError) as validation_error:
+                logger.warning(f"Skipping requirement {requirement_doc.get('_id')} in ranking: {str(validation_error)}")
+                continue
+            ids.append(requirement_doc["_id"])
+            stored.append(requirement_doc)
+
+        features = np.array(rows, dtype=np.float64).reshape(len(rows), 5)
+        effort_max = float(features[:, 3].max()) if rows else 0.0
+        wiegers_max = float(features[:, 4].max()) if rows else 0.0
+        scores = await asyncio.to_thread(self._score_rows, features, effort_max, wiegers_max)
+
+        updated = 0
+        operations = []
+        for requirement_id, requirement_doc, score in zip(ids, stored, scores.tolist()):
+            fields = {}
+            if requirement_doc.get("ranking_score") != score:
+                fields["ranking_score"] = score
+            keys = self.stakeholder_keys(requirement_doc.get("stakeholders") or [])
+            if requirement_doc.get("stakeholder_keys") != keys:
+                fields["stakeholder_keys"] = keys
+            if fields:
+                operations.append(UpdateOne({"_id": requirement_id}, {"$set": fields}))
+            if len(operations) >= RESCORE_BATCH_SIZE:
+                await self.db.requirements.bulk_write(operations, ordered=False)
+                updated += len(operations)
+                operations = []
+        if operations:
+            await self.db.requirements.bulk_write(operations, ordered=False)
+            updated += len(operations)
+
+        self._effort_max = effort_max
+        self._wiegers_max = wiegers_max
+        self.ready = True
+        logger.info(f"Rescored {len(ids)} requirements for stakeholder rankings, {updated} updated")
+        return updated
+
+    async def rank(self, requirements: List[Requirement], stakeholder_name: str, refine_with_ai: bool = False) -> List[Requirement]:
+        """Order requirements by relevance for a stakeholder.
+
+        Args:
+            requirements: Requirements to order.
+            stakeholder_name: Name of the stakeholder to rank for.
+            refine_with_ai: Re-rank the head of the list with the LLM.
+
+        Returns:
+            The requirements ordered from most to least relevant.
+        """
+        if not requirements:
+            return []
+
+        wiegers_priorities = await self.get_wiegers_priorities()
+        scores = self.score(requirements, stakeholder_name, wiegers_priorities)
+        order = np.argsort(-scores, kind="stable")
+        ranked = [requirements[index] for index in order]
+
+        if refine_with_ai:
+            ranked = await self._refine_with_ai(ranked, stakeholder_name)
+        return ranked
+
+    def score(self, requirements: List[Requirement], stakeholder_name: str, wiegers_priorities: Dict[str, float]) -> np.ndarray:
+        """Compute the relevance score of every requirement.
+
+        Args:
+            requirements: Requirements to score.
+            stakeholder_name: Name of the stakeholder to score for.
+            wiegers_priorities: Latest Wiegers priority by requirement ID.
+
+        Returns:
+            Array of scores aligned with `requirements`.
+        """
+        stakeholder_key = self.stakeholder_key(stakeholder_name)
+        membership = np.fromiter(
+            (any(self.stakeholder_key(name) == stakeholder_key for name in req.stakeholders) for req in requirements),
+            dtype=np.float64, count=len(requirements)
+        )
+        return self.base_scores(requirements, wiegers_priorities) + self.weights[0] * membership
+
+    def base_scores(self, requirements: List[Requirement], wiegers_priorities: Dict[str, float]) -> np.ndarray:
+        """Compute the stakeholder-independent part of every score.
+
+        Args:
+            requirements: Requirements to score.
+            wiegers_priorities: Latest Wiegers priority by requirement ID.
+
+        Returns:
+            Array of scores aligned with `requirements`, without membership.
+        """
+        count = len(requirements)
+        priority = np.fromiter((PRIORITY_SCORES[req.attributes.priority] for req in requirements), dtype=np.float64, count=count)
+        risk = np.fromiter((RISK_SCORES[req.attributes.risk] for req in requirements), dtype=np.float64, count=count)
+        complexity = np.fromiter((COMPLEXITY_SCORES[req.attributes.complexity] for req in requirements), dtype=np.float64, count=count)
+        effort = np.fromiter((max(req.attributes.effort_estimation, 0) for req in requirements), dtype=np.float64, count=count)
+        wiegers = np.fromiter((wiegers_priorities.get(req.id, 0.0) for req in requirements), dtype=np.float64, count=count)
+
+        features = np.column_stack([
+            priority,
+            risk,
+            complexity,
+            self._scale(effort),
+            self._scale(wiegers),
+        ])
+        return features @ self.weights[1:]
+
+    @staticmethod
+    def stakeholder_key(stakeholder_name: str) -> str:
+        """Normalize a stakeholder name for comparisons and storage keys."""
+        return " ".join(stakeholder_name.casefold().split())
+
+    @classmethod
+    def stakeholder_keys(cls, stakeholder_names: List[str]) -> List[str]:
+        """Normalize the stakeholders of a requirement into sorted, unique, non-empty keys."""
+        return sorted({key for key in (cls.stakeholder_key(name) for name in stakeholder_names) if key})
+
+    async def get_wiegers_priorities(self) -> Dict[str, float]:
+        """Load the latest Wiegers priority of every analysed requirement.
+
+        Only matrices flagged `latest` are read, as a covered query on the
+        `latest_priority_requirement_id` index.
+
+        Returns:
+            Mapping of requirement ID to its most recent Wiegers priority.
+        """
+        cursor = self.db.wiegers_matrices.find(
+            {"latest": True},
+            {"_id": 0, "requirement_id": 1, "priority": 1}
+        )
+        priorities = {}
+        async for row in cursor:
+            if row.get("priority") is not None:
+                priorities[row["requirement_id"]] = float(row["priority"])
+        return priorities
+
+    async def _rebuild_loop(self):
+        """Rescore requirements when marked dirty, and periodically as a fallback."""
+        while True:
+            try:
+                await asyncio.wait_for(self._dirty.wait(), timeout=settings.RANKING_REBUILD_INTERVAL_SECONDS)
+                await asyncio.sleep(settings.RANKING_REBUILD_DEBOUNCE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._dirty.clear()
+            try:
+                await self.rebuild_rankings()
+            except Exception as e:
+                logger.error(f"Failed to rescore requirements for stakeholder rankings: {str(e)}")
+
+    async def _watch_changes(self):
+        """Mark rankings dirty on every change stream event of the watched collections."""
+        pipeline = [{"$match": {"ns.coll": {"$in": WATCHED_COLLECTIONS}}}]
+        try:
+            async with self.db.watch(pipeline) as stream:
+                logger.info("Watching requirement changes with change streams")
+                async for _ in stream:
+                    self.mark_dirty()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"Change streams unavailable, relying on periodic ranking rebuilds: {str(e)}")
+
+    async def _refine_with_ai(self, ranked: List[Requirement], stakeholder_name: str) -> List[Requirement]:
+        """Let the LLM reorder the top of a local ranking, keeping the tail."""
+        head = ranked[:settings.RANKING_AI_REFINE_TOP_N]
+        tail = ranked[settings.RANKING_AI_REFINE_TOP_N:]
+        try:
+            sorted_ids = await self.gemini_service.sort_requirements_by_stakeholder(head, stakeholder_name)
+        except Exception as e:
+            logger.warning(f"AI refinement failed, keeping local ranking: {str(e)}")
+            return ranked
+
+        head_by_id = {req.id: req for req in head}
+        refined = []
+        seen = set()
+        for req_id in sorted_ids:
+            if req_id in head_by_id and req_id not in seen:
+                refined.append(head_by_id[req_id])
+                seen.add(req_id)
+        refined.extend(req for req in head if req.id not in seen)
+        return refined + tail
+
+    @staticmethod
+    def _feature_row(requirement_doc: dict, wiegers_priorities: Dict[str, float]) -> Tuple[float, float, float, float, float]:
+        """Read the unscaled score features of a raw requirement document."""
+        attributes = requirement_doc["attributes"]
+        return (
+            PRIORITY_SCORES[PriorityLevel(attributes["priority"])],
+            RISK_SCORES[RiskLevel(attributes["risk"])],
+            COMPLEXITY_SCORES[ComplexityLevel(attributes["complexity"])],
+            float(max(int(attributes["effort_estimation"]), 0)),
+            wiegers_priorities.get(str(requirement_doc.get("_id")), 0.0),
+        )
+
+    def _score_rows(self, features: np.ndarray, effort_max: float, wiegers_max: float) -> np.ndarray:
+        """Weight feature rows into stakeholder-independent scores, scaling effort and Wiegers columns.
+
+        Scores are rounded to multiples of `SCORE_QUANTUM`, so that adding or
+        subtracting the equally rounded membership weight is exact and
+        keyset bounds compare equal to the stored scores.
+        """
+        scaled = features.copy()
+        for column, maximum in ((3, effort_max), (4, wiegers_max)):
+            scaled[:, column] = np.minimum(scaled[:, column] / maximum, 1.0) if maximum > 0 else 0.0
+        return np.round((scaled @ self.weights[1:]) / SCORE_QUANTUM) * SCORE_QUANTUM
+
+    @staticmethod
+    def _scale(values: np.ndarray) -> np.ndarray:
+        """Scale non-negative values into [0, 1] by the column maximum."""
+        maximum = values.max() if values.size else 0.0
+        return values / maximum if maximum > 0 else np.zeros_like(values)
@@ -1,94 +1,354 @@
 """Wiegers matrix service for handling prioritization operations."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+import asyncio
+import logging
+import numpy as np
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
 from backend.config.database import get_database
+from backend.config.indexes import register_indexes
+from backend.config.settings import settings
+from backend.requirements.models.requirement import Requirement
 from backend.requirements.models.wiegers_matrix import WiegersMatrix
+from backend.requirements.dtos.prioritized_requirement_dto import PrioritizedRequirementDTO
+from backend.requirements.dtos.wiegers_weights_dto import WiegersWeightsDTO
+from backend.ai.exceptions import AIServiceError
 from backend.ai.services.gemini_service import GeminiService
 from backend.requirements.services.requirements_service import RequirementsService
+from backend.requirements.services.stakeholder_ranking_service import StakeholderRankingService
+from backend.requirements.services.wiegers_priority_engine import WiegersPriorityEngine
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+register_indexes("wiegers_matrices", [
+    IndexModel([("requirement_id", ASCENDING), ("created_at", DESCENDING)], name="requirement_id_created_at"),
+    IndexModel([("priority", DESCENDING)], name="priority"),
+    IndexModel(
+        [("latest", ASCENDING), ("priority", DESCENDING), ("requirement_id", ASCENDING)],
+        name="latest_priority_requirement_id"
+    ),
+])
+
+WEIGHTS_DOCUMENT_ID = "current"
+PRIORITY_FIELDS = ("priority", "value_percentage", "cost_percentage", "risk_percentage")
 
 
 class WiegersService:
-    """Service class for handling Wiegers matrix operations."""
+    """Service class for handling Wiegers matrix operations.
     
-    def __init__(self):
-        """Initialize the WiegersService."""
+    Every analysis stores new matrices and keeps the previous ones as
+    history. The most recent matrix of each requirement carries
+    `latest: true`, so rankings read a single index range ordered by
+    priority instead of grouping the whole history.
+    
+    Priorities of the latest matrices are relative to each other, so they
+    are recomputed for the whole set after every analysis and whenever
+    the weights change.
+    """
+    
+    def __init__(
+        self,
+        requirement_service: RequirementsService,
+        gemini_service: GeminiService,
+        ranking_service: StakeholderRankingService
+    ):
+        """Initialize the WiegersService.
+        
+        Args:
+            requirement_service: Shared service used to read requirements.
+            gemini_service: Shared Gemini service used for AI generation.
+            ranking_service: Shared service maintaining stakeholder rankings.
+        """
         self.db = get_database()
-        self.requirement_service = RequirementsService()
-        self.gemini_service = GeminiService()
+        self.requirement_service = requirement_service
+        self.gemini_service = gemini_service
+        self.ranking_service = ranking_service
+        self.engine = WiegersPriorityEngine()
+        self.weights = WiegersWeightsDTO(
+            benefit=settings.WIEGERS_WEIGHT_BENEFIT,
+            penalty=settings.WIEGERS_WEIGHT_PENALTY,
+            cost=settings.WIEGERS_WEIGHT_COST,
+            risk=settings.WIEGERS_WEIGHT_RISK
+        )
+        self._recompute_lock = asyncio.Lock()
+    
+    async def start(self):
+        """Load the stored weights and bring matrices saved by older versions up to date."""
+        weights_doc = await self.db.wiegers_weights.find_one({"_id": WEIGHTS_DOCUMENT_ID})
+        if weights_doc:
+            weights_doc.pop("_id")
+            self.weights = WiegersWeightsDTO(**weights_doc)
+        
+        await self._flag_latest_matrices()
+        if await self.db.wiegers_matrices.find_one({"latest": True, "value_percentage": {"$exists": False}}, {"_id": 1}):
+            await self.recompute_priorities()
+    
+    async def _flag_latest_matrices(self):
+        """Flag the latest matrix of every requirement in matrices stored without the flag."""
+        if not await self.db.wiegers_matrices.find_one({"latest": {"$exists": False}}, {"_id": 1}):
+            return
+        
+        pipeline = [
+            {"$sort": {"requirement_id": 1, "created_at": -1}},
+            {"$group": {"_id": "$requirement_id", "matrix_id": {"$first": "$_id"}}},
+        ]
+        operations = [UpdateOne({"_id": row["matrix_id"]}, {"$set": {"latest": True}}) async for row in self.db.wiegers_matrices.aggregate(pipeline)]
+        await self.db.wiegers_matrices.update_many({"latest": {"$exists": False}}, {"$set": {"latest": False}})
+        if operations:
+            await self.db.wiegers_matrices.bulk_write(operations, ordered=False)
+        logger.info(f"Flagged the latest Wiegers matrix of {len(operations)} requirements")
     
     async def generate_and_save_matrices(self, requirement_ids: List[str]) -> List[WiegersMatrix]:
         """Generate Wiegers matrices for requirements using AI and save to database.
         
+        Requirements are fetched in one query and analysed in chunks of
+        `WIEGERS_CHUNK_SIZE` sent in parallel. A failed chunk is retried on
+        its own, and every successful matrix is saved with one bulk write.
+        
         Args:
             requirement_ids: List of requirement IDs
             
         Returns:
-            List of created WiegersMatrix objects
+            List of created WiegersMatrix objects ordered by priority
             
         Raises:
-            Exception: When generation or saving fails
+            Exception: When generation or saving fails for every chunk
         """
-        # Fetch requirements from database
-        requirements = []
-        for req_id in requirement_ids:
-            requirement = await self.requirement_service.get_requirement_by_id(req_id)
-            if requirement:
-                requirements.append(requirement)
+        requirements = await self.requirement_service.get_requirements_by_ids(requirement_ids)
         
         if not requirements:
             raise Exception("Nenhum requisito encontrado com os IDs fornecidos")
         
-        # Generate AI analysis
-        ai_analysis = await self.gemini_service.generate_wiegers_matrix(requirements)
+        chunk_size = settings.WIEGERS_CHUNK_SIZE
+        chunks = [requirements[i:i + chunk_size] for i in range(0, len(requirements), chunk_size)]
+        semaphore = asyncio.Semaphore(settings.WIEGERS_MAX_PARALLEL_CHUNKS)
+        current_time = datetime.utcnow()
+        
+        results = await asyncio.gather(
+            *[self._analyze_chunk(chunk, semaphore, current_time) for chunk in chunks],
+            return_exceptions=True
+        )
         
-        # Create and save WiegersMatrix objects
         created_matrices = []
-        current_time = datetime.utcnow()
+        errors = []
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+            else:
+                created_matrices.extend(result)
+        
+        if not created_matrices:
+            if isinstance(errors[0], AIServiceError):
+                raise errors[0]
+            raise Exception(f"Falha ao gerar análise Wiegers: {str(errors[0])}")
+        if errors:
+            logger.warning(f"{len(errors)} of {len(chunks)} Wiegers chunks failed after retries: {str(errors[0])}")
+        
+        insert_result = await self.db.wiegers_matrices.insert_many(
+            [{**matrix.model_dump(by_alias=True, exclude={"id"}), "latest": True} for matrix in created_matrices]
+        )
+        for matrix, inserted_id in zip(created_matrices, insert_result.inserted_ids):
+            matrix.id = str(inserted_id)
+        await self._demote_superseded_matrices([matrix.requirement_id for matrix in created_matrices])
+        relative_priorities = await self.recompute_priorities()
+        for matrix in created_matrices:
+            for field, field_value in relative_priorities.get(matrix.id, {}).items():
+                setattr(matrix, field, field_value)
         
-        for analysis in ai_analysis:
-            matrix = WiegersMatrix(
-                requirement_id=analysis["requirement_id"],
-                requirement_title=analysis["requirement_title"],
-                value=analysis["value"],
-                cost=analysis["cost"],
-                risk=analysis["risk"],
-                urgency=analysis["urgency"],
-                created_at=current_time,
-                updated_at=current_time
-            )
+        created_matrices.sort(key=lambda matrix: matrix.priority, reverse=True)
+        return created_matrices
+    
+    async def _demote_superseded_matrices(self, requirement_ids: List[str]):
+        """Keep `latest` only on the newest matrix of each requirement.
+
+        The newest matrix is the one with the greatest `(created_at, _id)`.
+        Every analysis runs this after its insert, so when two analyses of
+        the same requirement overlap, the one finishing last sees both
+        inserts and demotes the older one, whatever order they ran in.
+        """
+        newest: Dict[str, tuple] = {}
+        superseded = []
+        cursor = self.db.wiegers_matrices.find(
+            {"requirement_id": {"$in": requirement_ids}, "latest": True},
+            {"requirement_id": 1, "created_at": 1}
+        )
+        async for doc in cursor:
+            candidate = (doc.get("created_at") or datetime.min, doc["_id"])
+            current = newest.get(doc["requirement_id"])
+            if current is None or candidate > current:
+                if current is not None:
+                    superseded.append(current[1])
+                newest[doc["requirement_id"]] = candidate
+            else:
+                superseded.append(doc["_id"])
+        if superseded:
+            await self.db.wiegers_matrices.update_many({"_id": {"$in": superseded}}, {"$set": {"latest": False}})
+    
+    async def update_weights(self, weights: WiegersWeightsDTO) -> WiegersWeightsDTO:
+        """Store new weights and recompute every relative priority with them.
+        
+        Args:
+            weights: The new Wiegers weights
             
-            # Calculate priority
-            matrix.calculate_priority()
+        Returns:
+            The weights now in use
+        """
+        await self.db.wiegers_weights.replace_one({"_id": WEIGHTS_DOCUMENT_ID}, weights.model_dump(), upsert=True)
+        self.weights = weights
+        await self.recompute_priorities()
+        return self.weights
+    
+    async def recompute_priorities(self) -> Dict[str, Dict[str, float]]:
+        """Recompute the relative priority of every latest matrix.
+        
+        The latest matrices are loaded as columns, prioritized together by
+        the WiegersPriorityEngine and written back with one bulk write.
+        
+        Returns:
+            The new priority fields by matrix ID
+        """
+        async with self._recompute_lock:
+            matrix_docs = await self.db.wiegers_matrices.find(
+                {"latest": True},
+                {"value": 1, "urgency": 1, "cost": 1, "risk": 1}
+            ).to_list(length=None)
+            if not matrix_docs:
+                return {}
             
-            # Save to database
-            matrix_dict = matrix.dict(by_alias=True, exclude={"id"})
-            result = await self.db.wiegers_matrices.insert_one(matrix_dict)
-            matrix.id = str(result.inserted_id)
+            count = len(matrix_docs)
+            columns = {
+                name: np.fromiter((doc[name] for doc in matrix_docs), dtype=np.float64, count=count)
+                for name in ("value", "urgency", "cost", "risk")
+            }
+            results = self.engine.compute(weights=self.weights, **columns)
             
-            created_matrices.append(matrix)
+            rows = np.column_stack([results[field] for field in PRIORITY_FIELDS]).tolist()
+            operations = []
+            relative_priorities = {}
+            for doc, row in zip(matrix_docs, rows):
+                fields = dict(zip(PRIORITY_FIELDS, row))
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+                relative_priorities[str(doc["_id"])] = fields
+            await self.db.wiegers_matrices.bulk_write(operations, ordered=False)
         
-        return created_matrices
+        self.ranking_service.mark_dirty()
+        logger.info(f"Recomputed relative Wiegers priorities of {count} requirements")
+        return relative_priorities
+    
+    async def _analyze_chunk(self, requirements: List[Requirement], semaphore: asyncio.Semaphore, current_time: datetime) -> List[WiegersMatrix]:
+        """Analyse one chunk of requirements, retrying only this chunk on failure."""
+        requirements_by_id = {requirement.id: requirement for requirement in requirements}
+        attempts = settings.WIEGERS_CHUNK_RETRIES + 1
+        
+        async with semaphore:
+            for attempt in range(1, attempts + 1):
+                try:
+                    ai_analysis = await self.gemini_service.generate_wiegers_matrix(requirements)
+                    matrices = []
+                    for analysis in ai_analysis:
+                        requirement = requirements_by_id.get(analysis.requirement_id)
+                        if requirement is None:
+                            continue
+                        matrix = WiegersMatrix(
+                            requirement_id=requirement.id,
+                            requirement_title=requirement.title,
+                            value=analysis.value,
+                            cost=analysis.cost,
+                            risk=analysis.risk,
+                            urgency=analysis.urgency,
+                            created_at=current_time,
+                            updated_at=current_time
+                        )
+                        matrix.calculate_priority()
+                        matrices.append(matrix)
+                    if not matrices:
+                        raise Exception("A resposta da IA não contém nenhum requisito solicitado")
+                    return matrices
+                except AIServiceError:
+                    raise
+                except Exception as e:
+                    if attempt == attempts:
+                        raise
+                    logger.warning(f"Wiegers chunk failed (attempt {attempt}/{attempts}), retrying: {str(e)}")
     
     async def get_by_requirement_id(self, requirement_id: str) -> WiegersMatrix:
-        """Get Wiegers matrix by requirement ID.
+        """Get the latest Wiegers matrix of a requirement.
         
         Args:
             requirement_id: The requirement ID
             
         Returns:
-            WiegersMatrix object or None
+            The most recent WiegersMatrix object or None
         """
-        data = await self.db.wiegers_matrices.find_one({"requirement_id": requirement_id})
+        data = await self.db.wiegers_matrices.find_one(
+            {"requirement_id": requirement_id},
+            sort=[("created_at", DESCENDING), ("_id", DESCENDING)]
+        )
         return WiegersMatrix.from_mongo(data) if data else None
     
+    async def get_prioritized(self, limit: int = 50, offset: int = 0, min_priority: Optional[float] = None) -> List[PrioritizedRequirementDTO]:
+        """Get requirements joined with their latest matrix, ordered by priority.
+        
+        A single aggregation reads the latest matrices from the
+        `latest_priority_requirement_id` index, pages them and joins the
+        requirements with `$lookup`. Matrices whose requirement no longer
+        exists are left out of the page.
+        
+        Args:
+            limit: Maximum number of requirements to return (top-k)
+            offset: Number of requirements to skip
+            min_priority: Optional lower bound on the Wiegers priority
+            
+        Returns:
+            Requirements with their latest matrix, highest priority first
+        """
+        match: Dict[str, Any] = {"latest": True}
+        if min_priority is not None:
+            match["priority"] = {"$gte": min_priority}
+        
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"priority": -1, "requirement_id": 1}},
+            {"$skip": offset},
+            {"$limit": limit},
+            {"$addFields": {
+                "requirement_object_id": {"$convert": {"input": "$requirement_id", "to": "objectId", "onError": None}}
+            }},
+            {"$lookup": {
+                "from": "requirements",
+                "localField": "requirement_object_id",
+                "foreignField": "_id",
+                "as": "requirement"
+            }},
+            {"$unwind": "$requirement"},
+            {"$project": {"requirement_object_id": 0, "latest": 0}},
+        ]
+        
+        prioritized = []
+        async for data in self.db.wiegers_matrices.aggregate(pipeline):
+            requirement_doc = data.pop("requirement")
+            try:
+                prioritized.append(PrioritizedRequirementDTO(
+                    matrix=WiegersMatrix.from_mongo(data),
+                    requirement=Requirement.from_mongo(requirement_doc)
+                ))
+            except Exception as validation_error:
+                logger.warning(f"Skipping Wiegers matrix {data.get('id')} due to validation error: {str(validation_error)}")
+        return prioritized
+    
     async def get_all(self) -> List[WiegersMatrix]:
-        """Get all Wiegers matrices ordered by priority.
+        """Get the latest Wiegers matrix of every requirement ordered by priority.
+        
+        Older matrices are history whose priorities are not comparable
+        with the relative priorities of the current set, so they are left
+        out.
         
         Returns:
-            List of WiegersMatrix objects
+            List of WiegersMatrix objects, highest priority first
         """
-        cursor = self.db.wiegers_matrices.find({}).sort("priority", -1)
+        cursor = self.db.wiegers_matrices.find({"latest": True}).sort([("priority", DESCENDING), ("requirement_id", ASCENDING)])
         matrices = []
         async for data in cursor:
             matrix = WiegersMatrix.from_mongo(data)
@@ -0,0 +1,21 @@
+"""Shared pytest configuration of the backend tests."""
+
+import os
+
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "specforge_test")
+
+import mongomock_motor
+import pytest
+
+from backend.config import database
+
+@pytest.fixture
+def mongo_database():
+    """Point the services at an empty in-memory database for one test."""
+    client = mongomock_motor.AsyncMongoMockClient()
+    database.mongodb.client = client
+    database.mongodb.database = client[os.environ["DATABASE_NAME"]]
+    yield database.mongodb.database
+    database.mongodb.client = None
+    database.mongodb.database = None
@@ -0,0 +1,46 @@
+"""Tests of the chunked bulk import of requirements."""
+
+import asyncio
+
+from backend.ai.providers.local_provider import LocalProvider
+from backend.ai.services.gemini_service import GeminiService
+from backend.requirements.services.requirements_service import RequirementsService
+from backend.requirements.services.stakeholder_ranking_service import StakeholderRankingService
+
+class NullSimilarity:
+    """Similarity index stand-in ignoring every write."""
+
+    async def index_documents(self, documents):
+        return 0
+
+def item(title: str) -> dict:
+    """Build a valid import payload."""
+    return {
+        "title": title,
+        "description": "Descrição",
+        "stakeholders": ["Ana"],
+        "type": "FUNCTIONAL",
+        "attributes": {"priority": "LOW", "risk": "LOW", "complexity": "LOW", "effort_estimation": 1},
+        "version": "1.0",
+    }
+
+async def stream(payloads):
+    for payload in payloads:
+        yield payload
+
+def test_write_errors_report_the_global_item_index(mongo_database):
+    gemini = GeminiService(provider=LocalProvider())
+    service = RequirementsService(gemini, StakeholderRankingService(gemini), NullSimilarity())
+    payloads = [item("Primeiro"), item("Segundo"), {"title": "Sem campos"}, item("Duplicado"), item("Quinto")]
+
+    async def scenario():
+        await mongo_database.requirements.create_index("title", unique=True)
+        await mongo_database.requirements.insert_one(item("Duplicado"))
+        return await service.bulk_import(stream(payloads), chunk_size=2)
+
+    result = asyncio.run(scenario())
+
+    assert result.received == 5
+    assert result.inserted_count == 3
+    assert [error.index for error in result.errors] == [2, 3]
+    assert "duplicate" in result.errors[1].error.lower()
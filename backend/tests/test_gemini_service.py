@@ -0,0 +1,78 @@
+"""Tests of the multi-call stakeholder sort and glossary repairs of the Gemini service."""
+
+import asyncio
+import json
+
+from backend.ai.models.llm_response import LLMResponse
+from backend.ai.providers.local_provider import LISTING_PATTERN, LocalProvider
+from backend.ai.services.gemini_service import GeminiService
+from backend.ai.services.prompt_builder import PromptBuilder
+from backend.requirements.models.requirement import Requirement
+
+class ReversingProvider(LocalProvider):
+    """Local provider ranking each listing backwards and forgetting one ID."""
+
+    def __init__(self, forgotten: str):
+        super().__init__()
+        self.forgotten = forgotten
+        self.calls = 0
+
+    async def generate(self, prompt: str, task: str, json_mode: bool = False) -> LLMResponse:
+        self.calls += 1
+        ids = [match["id"] for match in LISTING_PATTERN.finditer(prompt) if match["id"] != self.forgotten]
+        return LLMResponse(text=json.dumps({"sorted_requirement_ids": list(reversed(ids)) + ["unknown"]}))
+
+def requirement(index: int) -> Requirement:
+    """Build a stored requirement with a distinct ID."""
+    return Requirement.model_validate({
+        "_id": f"r{index}",
+        "title": f"Requisito {index}",
+        "stakeholders": ["Ana"],
+        "type": "FUNCTIONAL",
+        "attributes": {"priority": "LOW", "risk": "LOW", "complexity": "LOW", "effort_estimation": 1},
+        "version": "1.0",
+    })
+
+def test_orderings_merge_by_relative_position_with_local_tie_break():
+    merged = GeminiService._merge_orderings(
+        ["a", "b", "c", "d", "e"],
+        [(["a", "b"], ["b", "a"]), (["c", "d", "e"], ["e", "x", "d"])],
+    )
+
+    assert merged == ["b", "e", "a", "d"]
+
+def test_split_sort_returns_every_requirement_once():
+    provider = ReversingProvider(forgotten="r3")
+    gemini = GeminiService(provider=provider)
+    gemini.prompt_builder = PromptBuilder(max_input_tokens=300, max_description_tokens=5)
+    requirements = [requirement(index) for index in range(6)]
+
+    sorted_ids = asyncio.run(gemini.sort_requirements_by_stakeholder(requirements, "Ana"))
+
+    assert provider.calls > 2
+    assert sorted(sorted_ids) == sorted(req.id for req in requirements)
+    assert sorted_ids[-1] == "r3"
+
+class FirstAnswerInvalidProvider(LocalProvider):
+    """Local provider answering its first call with invalid JSON."""
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    async def generate(self, prompt: str, task: str, json_mode: bool = False) -> LLMResponse:
+        self.prompts.append(prompt)
+        if len(self.prompts) == 1:
+            return LLMResponse(text="not json")
+        return await super().generate(prompt, task, json_mode)
+
+def test_invalid_glossary_batches_are_asked_again():
+    provider = FirstAnswerInvalidProvider()
+    gemini = GeminiService(provider=provider)
+    requirements = [requirement(1), requirement(2)]
+
+    batches = asyncio.run(gemini.generate_glossary_batches(requirements))
+
+    assert len(provider.prompts) == 2
+    assert [[req.id for req in members] for members, _ in batches] == [["r1", "r2"]]
+    assert [term["name"] for term in batches[0][1]] == ["Requisito 1", "Requisito 2"]
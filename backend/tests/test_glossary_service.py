@@ -0,0 +1,74 @@
+"""Tests of the incremental glossary bookkeeping."""
+
+import asyncio
+from typing import List
+
+from backend.ai.models.llm_response import LLMResponse
+from backend.ai.providers.local_provider import LocalProvider
+from backend.ai.services.gemini_service import GeminiService
+from backend.ai.services.prompt_builder import PromptBuilder
+from backend.requirements.models.requirement import Requirement
+from backend.requirements.services.glossary_service import GlossaryService
+
+class FlakyProvider(LocalProvider):
+    """Local provider answering with invalid JSON while a title is listed as broken."""
+
+    def __init__(self):
+        super().__init__()
+        self.broken_titles: List[str] = []
+
+    async def generate(self, prompt: str, task: str, json_mode: bool = False) -> LLMResponse:
+        if any(title in prompt for title in self.broken_titles):
+            return LLMResponse(text="not json")
+        return await super().generate(prompt, task, json_mode)
+
+class StaticRequirements:
+    """Requirements service stand-in serving a fixed list."""
+
+    def __init__(self, requirements: List[Requirement]):
+        self.requirements = requirements
+
+    async def get_all_requirements(self) -> List[Requirement]:
+        return self.requirements
+
+def requirement(index: int) -> Requirement:
+    """Build a stored requirement with a distinct title."""
+    return Requirement.model_validate({
+        "_id": f"{index:024x}",
+        "title": f"Termo {index}",
+        "description": f"Definição do termo {index}",
+        "stakeholders": ["Ana"],
+        "type": "FUNCTIONAL",
+        "attributes": {"priority": "LOW", "risk": "LOW", "complexity": "LOW", "effort_estimation": 1},
+        "version": "1.0",
+    })
+
+def test_requirements_of_invalid_batches_are_sent_again(mongo_database):
+    provider = FlakyProvider()
+    gemini = GeminiService(provider=provider)
+    gemini.prompt_builder = PromptBuilder(max_input_tokens=150, max_description_tokens=20)
+    requirements = [requirement(1), requirement(2)]
+    service = GlossaryService(StaticRequirements(requirements), gemini)
+    provider.broken_titles = ["Termo 2"]
+
+    async def scenario():
+        first = await service.generate_and_save_glossary()
+        first_doc = await mongo_database.glossaries.find_one({})
+        provider.broken_titles = []
+        prompts = []
+        original = provider.generate
+
+        async def recording_generate(prompt, task, json_mode=False):
+            prompts.append(prompt)
+            return await original(prompt, task, json_mode)
+
+        provider.generate = recording_generate
+        second = await service.generate_and_save_glossary()
+        return first, first_doc, second, prompts
+
+    first, first_doc, second, prompts = asyncio.run(scenario())
+
+    assert [term.name for term in first.terms] == ["Termo 1"]
+    assert list(first_doc["processed_requirements"]) == [requirements[0].id]
+    assert len(prompts) == 1 and "Termo 2" in prompts[0] and "Termo 1" not in prompts[0]
+    assert [term.name for term in second.terms] == ["Termo 1", "Termo 2"]
@@ -0,0 +1,70 @@
+"""Tests of the token budget splitting and truncation of the prompt builder."""
+
+from backend.ai.services.prompt_builder import TRUNCATION_MARKER, PromptBuilder
+from backend.requirements.models.requirement import Requirement
+
+TEMPLATE = "Liste: {requirements_text}"
+
+def requirement(title: str, description: str = "") -> Requirement:
+    """Build a requirement whose listing line is its title."""
+    return Requirement.model_validate({
+        "title": title,
+        "description": description or None,
+        "stakeholders": ["Ana"],
+        "type": "FUNCTIONAL",
+        "attributes": {"priority": "LOW", "risk": "LOW", "complexity": "LOW", "effort_estimation": 1},
+        "version": "1.0",
+    })
+
+def by_title(req: Requirement, description: str) -> str:
+    return req.title
+
+def builder(max_input_tokens: int) -> PromptBuilder:
+    """Build a prompt builder counting one token per character."""
+    return PromptBuilder(max_input_tokens=max_input_tokens, max_description_tokens=10, chars_per_token=1.0)
+
+def titles(groups):
+    return [[req.title for req in members] for members, _ in groups]
+
+def test_listing_that_fits_exactly_stays_in_one_call():
+    requirements = [requirement("a" * 10), requirement("b" * 20), requirement("c" * 5)]
+    budget = len(TEMPLATE) + sum(len(req.title) + 1 for req in requirements)
+
+    assert titles(builder(budget).pack_groups(requirements, by_title, TEMPLATE)) == [["a" * 10, "b" * 20, "c" * 5]]
+    assert titles(builder(budget - 1).pack_groups(requirements, by_title, TEMPLATE)) == [["a" * 10, "b" * 20], ["c" * 5]]
+
+def test_item_over_the_budget_gets_a_call_of_its_own():
+    requirements = [requirement("a" * 5), requirement("b" * 100), requirement("c" * 5)]
+
+    groups = builder(len(TEMPLATE) + 20).pack_groups(requirements, by_title, TEMPLATE)
+
+    assert titles(groups) == [["a" * 5], ["b" * 100], ["c" * 5]]
+    assert [listing for _, listing in groups] == ["a" * 5, "b" * 100, "c" * 5]
+
+def test_pack_returns_the_listings_of_pack_groups():
+    requirements = [requirement("a" * 10), requirement("b" * 10)]
+    prompt_builder = builder(len(TEMPLATE) + 12)
+
+    assert prompt_builder.pack(requirements, by_title, TEMPLATE) == ["a" * 10, "b" * 10]
+
+def test_descriptions_are_truncated_before_formatting():
+    long_description = " ".join(["palavra"] * 10)
+    seen = []
+
+    builder(1000).pack([requirement("a", long_description)], lambda req, description: seen.append(description) or req.title, TEMPLATE)
+
+    assert seen[0].endswith(TRUNCATION_MARKER)
+    assert len(seen[0]) <= 10
+
+def test_text_that_fits_exactly_is_not_truncated():
+    assert builder(100).truncate("x" * 12, 12) == "x" * 12
+
+def test_text_one_token_over_is_cut_on_a_word_boundary():
+    truncated = builder(100).truncate("abcd efgh ijkl mnop", 18)
+
+    assert truncated == "abcd efgh" + TRUNCATION_MARKER
+    assert len(truncated) <= 18
+
+def test_budget_too_small_for_the_marker_cuts_the_text():
+    assert builder(100).truncate("abcdefgh", 3) == "abc"
+    assert builder(100).truncate("abcdefgh", 0) == ""
@@ -0,0 +1,132 @@
+"""Tests of the single-flight lookups, eviction, MongoDB tier and admin endpoint of the prompt cache."""
+
+import asyncio
+
+import pytest
+
+from backend.ai.services import prompt_cache as prompt_cache_module
+from backend.ai.services.prompt_cache import PromptCache
+
+class CountingFactory:
+    """Coroutine factory counting its calls and answering once released."""
+
+    def __init__(self, value: str = "answer"):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        cache = PromptCache(max_entries=10, ttl_seconds=60)
+        factory = CountingFactory()
+        waiters = [asyncio.create_task(cache.get_or_create("key", factory)) for _ in range(5)]
+        await asyncio.sleep(0)
+        factory.release.set()
+        values = await asyncio.gather(*waiters)
+        return factory.calls, values, cache.stats()
+
+    calls, values, stats = asyncio.run(scenario())
+
+    assert calls == 1
+    assert values == ["answer"] * 5
+    assert stats["entries"] == 1
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    async def scenario():
+        cache = PromptCache(max_entries=10, ttl_seconds=60)
+        factory = CountingFactory()
+        first = asyncio.create_task(cache.get_or_create("key", factory))
+        second = asyncio.create_task(cache.get_or_create("key", factory))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        factory.release.set()
+        return first.cancelled(), await second, factory.calls, await cache.get("key")
+
+    first_cancelled, value, calls, cached = asyncio.run(scenario())
+
+    assert first_cancelled
+    assert value == "answer"
+    assert calls == 1
+    assert cached == "answer"
+
+def test_failed_call_is_not_cached_and_is_retried():
+    async def failing():
+        raise RuntimeError("model down")
+
+    async def scenario():
+        cache = PromptCache(max_entries=10, ttl_seconds=60)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_create("key", failing)
+        factory = CountingFactory()
+        factory.release.set()
+        return await cache.get_or_create("key", factory), factory.calls
+
+    assert asyncio.run(scenario()) == ("answer", 1)
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(prompt_cache_module.time, "monotonic", lambda: clock[0])
+
+    async def scenario():
+        cache = PromptCache(max_entries=10, ttl_seconds=60)
+        await cache.set("key", "answer")
+        clock[0] += 59
+        fresh = await cache.get("key")
+        clock[0] += 1
+        return fresh, await cache.get("key"), cache.stats()["entries"]
+
+    assert asyncio.run(scenario()) == ("answer", None, 0)
+
+def test_least_recently_used_entry_is_evicted():
+    async def scenario():
+        cache = PromptCache(max_entries=2, ttl_seconds=60)
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+        return [await cache.get(key) for key in ("a", "b", "c")], cache.stats()["evictions"]
+
+    assert asyncio.run(scenario()) == (["1", None, "3"], 1)
+
+def test_persistent_tier_survives_a_cleared_memory_tier(mongo_database):
+    async def scenario():
+        cache = PromptCache(max_entries=10, ttl_seconds=60, persistent=True)
+        await cache.set("key", "answer")
+        cache.clear()
+        factory = CountingFactory()
+        value = await cache.get_or_create("key", factory)
+        await cache.invalidate("key")
+        cache.clear()
+        return value, factory.calls, cache.stats()["persistent_hits"], await cache.get("key")
+
+    assert asyncio.run(scenario()) == ("answer", 0, 1, None)
+
+def test_clearing_the_cache_requires_the_admin_token(monkeypatch):
+    import httpx
+    from fastapi import FastAPI
+
+    from backend.ai.controllers.ai_controller import router
+    from backend.config.dependencies import get_prompt_cache
+    from backend.config.settings import settings
+
+    cache = PromptCache(max_entries=10, ttl_seconds=60)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_prompt_cache] = lambda: cache
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "secret")
+
+    async def scenario():
+        await cache.set("key", "answer")
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            anonymous = await client.delete("/ai/cache")
+            kept = cache.stats()["entries"]
+            admin = await client.delete("/ai/cache", headers={"X-Admin-Token": "secret"})
+        return anonymous.status_code, kept, admin.status_code, cache.stats()["entries"]
+
+    assert asyncio.run(scenario()) == (403, 1, 204, 0)
@@ -0,0 +1,53 @@
+"""Query plan checks of the service queries against a real mongod.
+
+These tests only run when TEST_MONGODB_URL points at a disposable mongod;
+the in-memory stand-in used by the other tests has no query planner.
+"""
+
+import asyncio
+import os
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from backend.benchmarks.environment import BenchmarkEnvironment
+from backend.benchmarks.explain import check_query_plans, format_query_plans
+from backend.config.settings import settings
+
+TEST_MONGODB_URL = os.environ.get("TEST_MONGODB_URL")
+
+def _mongod_available() -> bool:
+    """Whether TEST_MONGODB_URL is set and answers a ping."""
+    if not TEST_MONGODB_URL:
+        return False
+
+    async def ping():
+        client = AsyncIOMotorClient(TEST_MONGODB_URL, serverSelectionTimeoutMS=1000)
+        try:
+            await client.admin.command("ping")
+            return True
+        except Exception:
+            return False
+        finally:
+            client.close()
+
+    return asyncio.run(ping())
+
+pytestmark = pytest.mark.skipif(not _mongod_available(), reason="needs a mongod at TEST_MONGODB_URL")
+
+def test_service_queries_use_their_indexes(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "MONGODB_URL", TEST_MONGODB_URL)
+    monkeypatch.setattr(settings, "AI_PROVIDER", "local")
+    monkeypatch.setattr(settings, "SIMILARITY_INDEX_DIR", str(tmp_path / "similarity_index"))
+
+    async def scenario():
+        environment = BenchmarkEnvironment(TEST_MONGODB_URL, "local", latency=0.0)
+        await environment.start()
+        try:
+            return await check_query_plans(environment, corpus=2000)
+        finally:
+            await environment.stop()
+
+    rows = asyncio.run(scenario())
+
+    assert all(row["passed"] for row in rows), format_query_plans(rows)
@@ -0,0 +1,95 @@
+"""Tests of the keyset pages of a stakeholder ordering read from the stored ranking scores."""
+
+import asyncio
+from typing import List
+
+from bson import ObjectId
+
+from backend.ai.providers.local_provider import LocalProvider
+from backend.ai.services.gemini_service import GeminiService
+from backend.requirements.services.requirements_service import RequirementsService
+from backend.requirements.services.stakeholder_ranking_service import SCORE_QUANTUM, StakeholderRankingService
+
+def quantized(value: float) -> float:
+    """Round a score like the ranking service stores it."""
+    return round(value / SCORE_QUANTUM) * SCORE_QUANTUM
+
+def requirement_doc(score: float, stakeholders: List[str]) -> dict:
+    """Build a scored requirement document."""
+    return {
+        "_id": ObjectId(),
+        "title": "Requisito",
+        "stakeholders": stakeholders,
+        "type": "FUNCTIONAL",
+        "attributes": {"priority": "LOW", "risk": "LOW", "complexity": "LOW", "effort_estimation": 1},
+        "version": "1.0",
+        "status": "DRAFT",
+        "ranking_score": score,
+        "stakeholder_keys": StakeholderRankingService.stakeholder_keys(stakeholders),
+    }
+
+def build_service() -> RequirementsService:
+    """Build a requirements service whose ranking is ready to page from stored scores."""
+    gemini = GeminiService(provider=LocalProvider())
+    ranking = StakeholderRankingService(gemini)
+    ranking.weights[0] = 0.3
+    ranking.ready = True
+    return RequirementsService(gemini, ranking, None)
+
+async def read_pages(service: RequirementsService, stakeholder_name: str, limit: int) -> List[str]:
+    """Follow the cursor until an empty page, returning every ID read."""
+    ids = []
+    after = None
+    while True:
+        page = await service.get_all_requirements(stakeholder_name=stakeholder_name, limit=limit, after=after)
+        if not page:
+            return ids
+        ids.extend(requirement.id for requirement in page)
+        after = page[-1].id
+
+def expected_order(documents: List[dict], weight: float) -> List[str]:
+    """Sort documents by score plus membership bonus, then by ID."""
+    def key(document):
+        bonus = weight if "ana" in document["stakeholder_keys"] else 0.0
+        return (-(document["ranking_score"] + bonus), document["_id"])
+    return [str(document["_id"]) for document in sorted(documents, key=key)]
+
+def test_pages_cover_ties_within_and_across_groups(mongo_database):
+    service = build_service()
+    weight = service.ranking_service.membership_weight
+    base = quantized(0.1)
+    documents = (
+        [requirement_doc(base, ["Ana"]) for _ in range(4)]
+        + [requirement_doc(base + weight, ["Bruno"]) for _ in range(4)]
+        + [requirement_doc(base, ["Carla"]) for _ in range(3)]
+        + [requirement_doc(quantized(0.7), ["Ana", "Bruno"]), requirement_doc(quantized(0.2), [])]
+    )
+
+    async def scenario():
+        await mongo_database.requirements.insert_many(documents)
+        paged = {limit: await read_pages(service, "Ana", limit) for limit in (1, 2, 3, 5)}
+        everything = await service.get_all_requirements(stakeholder_name="Ana")
+        return paged, [requirement.id for requirement in everything]
+
+    paged, everything = asyncio.run(scenario())
+
+    expected = expected_order(documents, weight)
+    assert everything == expected
+    for limit, ids in paged.items():
+        assert ids == expected, f"limit {limit}"
+
+def test_stakeholder_requirements_outrank_equal_scores_of_others(mongo_database):
+    service = build_service()
+    others = [requirement_doc(quantized(0.5), ["Bruno"]) for _ in range(2)]
+    members = [requirement_doc(quantized(0.5), [" ana "]) for _ in range(2)]
+
+    async def scenario():
+        await mongo_database.requirements.insert_many(others + members)
+        first = await service.get_all_requirements(stakeholder_name="ANA", limit=2)
+        second = await service.get_all_requirements(stakeholder_name="ANA", limit=2, after=first[-1].id)
+        return [requirement.id for requirement in first], [requirement.id for requirement in second]
+
+    first, second = asyncio.run(scenario())
+
+    assert first == [str(document["_id"]) for document in members]
+    assert second == [str(document["_id"]) for document in others]
@@ -0,0 +1,193 @@
+"""Tests of the retry, backoff, circuit breaker and rate limiting policies."""
+
+import asyncio
+import math
+from typing import List
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from backend.ai.exceptions import AIDeadlineExceededError, AIRateLimitError, AIUnavailableError
+from backend.ai.providers.gemini_provider import GeminiProvider
+from backend.ai.services import resilience
+from backend.benchmarks.fake_generative_model import FakeGenerativeModel
+from backend.ai.services.resilience import ResilientCaller
+
+KEY = "gemini:test"
+
+def make_caller(**overrides) -> ResilientCaller:
+    """Build a caller with fast defaults, overridable per test."""
+    options = {
+        "rate_per_second": 1000.0,
+        "burst": 100,
+        "max_retries": 3,
+        "backoff_base": 0.001,
+        "backoff_max": 0.004,
+        "failure_threshold": 10,
+        "reset_timeout": 30.0,
+        "deadline": 5.0,
+    }
+    options.update(overrides)
+    return ResilientCaller(**options)
+
+def call(caller: ResilientCaller, model: FakeGenerativeModel) -> str:
+    """Send one prompt through the caller to a Gemini provider backed by the fake model."""
+    provider = GeminiProvider(None, "test", model=model)
+
+    async def operation(remaining: float):
+        response = await asyncio.wait_for(provider.generate("prompt", "test"), timeout=remaining)
+        return response.text
+
+    return asyncio.run(caller.call(KEY, operation))
+
+def unavailable() -> google_exceptions.ServiceUnavailable:
+    """Build the transient server error the Gemini client raises."""
+    return google_exceptions.ServiceUnavailable("upstream unavailable")
+
+def test_transient_errors_are_retried_until_success():
+    model = FakeGenerativeModel("ok")
+    model.fail_next(unavailable(), unavailable())
+
+    assert call(make_caller(), model) == "ok"
+    assert len(model.calls) == 3
+
+def test_exhausted_retries_report_unavailable_with_reset_timeout():
+    model = FakeGenerativeModel("ok")
+    model.fail_next(*(unavailable() for _ in range(4)))
+
+    with pytest.raises(AIUnavailableError) as error:
+        call(make_caller(max_retries=3, reset_timeout=12.0), model)
+
+    assert len(model.calls) == 4
+    assert error.value.retry_after == 12.0
+
+def test_backoff_doubles_up_to_the_maximum(monkeypatch: pytest.MonkeyPatch):
+    delays: List[float] = []
+    real_sleep = asyncio.sleep
+
+    async def record_sleep(delay: float):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(resilience.asyncio, "sleep", record_sleep)
+    model = FakeGenerativeModel("ok")
+    model.fail_next(*(unavailable() for _ in range(4)))
+
+    assert call(make_caller(max_retries=4, backoff_base=1.0, backoff_max=3.0, deadline=60.0), model) == "ok"
+    assert delays == [1.0, 2.0, 3.0, 3.0]
+
+def test_backoff_past_the_deadline_stops_retrying(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    model = FakeGenerativeModel("ok")
+    model.fail_next(unavailable())
+
+    with pytest.raises(AIUnavailableError):
+        call(make_caller(backoff_base=10.0, backoff_max=10.0, deadline=1.0), model)
+    assert len(model.calls) == 1
+
+def test_non_retryable_errors_propagate_without_opening_the_circuit():
+    caller = make_caller(failure_threshold=1)
+    model = FakeGenerativeModel("ok")
+    model.fail_next(google_exceptions.InvalidArgument("bad prompt"))
+
+    with pytest.raises(google_exceptions.InvalidArgument):
+        call(caller, model)
+    assert len(model.calls) == 1
+    assert caller.breaker(KEY).state == "closed"
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast():
+    caller = make_caller(max_retries=0, failure_threshold=2, reset_timeout=30.0)
+    model = FakeGenerativeModel("ok")
+    model.fail_next(unavailable(), unavailable())
+
+    for _ in range(2):
+        with pytest.raises(AIUnavailableError):
+            call(caller, model)
+    assert caller.breaker(KEY).state == "open"
+
+    with pytest.raises(AIUnavailableError) as error:
+        call(caller, model)
+    assert len(model.calls) == 2
+    assert 1.0 <= error.value.retry_after <= 30.0
+
+def test_half_open_probe_success_closes_the_circuit():
+    caller = make_caller(max_retries=0, failure_threshold=1, reset_timeout=0.05)
+    model = FakeGenerativeModel("ok")
+    model.fail_next(unavailable())
+
+    with pytest.raises(AIUnavailableError):
+        call(caller, model)
+    asyncio.run(asyncio.sleep(0.06))
+    assert caller.breaker(KEY).state == "half_open"
+
+    assert call(caller, model) == "ok"
+    assert caller.breaker(KEY).state == "closed"
+
+def test_half_open_probe_failure_reopens_the_circuit():
+    caller = make_caller(max_retries=0, failure_threshold=1, reset_timeout=0.05)
+    model = FakeGenerativeModel("ok")
+    model.fail_next(unavailable(), unavailable())
+
+    with pytest.raises(AIUnavailableError):
+        call(caller, model)
+    asyncio.run(asyncio.sleep(0.06))
+
+    with pytest.raises(AIUnavailableError):
+        call(caller, model)
+    assert caller.breaker(KEY).state == "open"
+    assert len(model.calls) == 2
+
+def test_only_one_probe_is_admitted_while_half_open():
+    breaker = make_caller(failure_threshold=1, reset_timeout=0.0).breaker(KEY)
+    breaker.record_failure()
+
+    breaker.before_call()
+    with pytest.raises(AIUnavailableError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+def test_exhausted_provider_quota_reports_rate_limit_with_backoff_max():
+    model = FakeGenerativeModel("ok")
+    model.fail_next(*(google_exceptions.TooManyRequests("quota") for _ in range(2)))
+
+    with pytest.raises(AIRateLimitError) as error:
+        call(make_caller(max_retries=1, backoff_max=7.0), model)
+    assert error.value.retry_after == 7.0
+
+def test_empty_token_bucket_reports_rate_limit_with_refill_time():
+    caller = make_caller(rate_per_second=0.5, burst=1, deadline=0.5)
+    model = FakeGenerativeModel("ok")
+
+    assert call(caller, model) == "ok"
+    with pytest.raises(AIRateLimitError) as error:
+        call(caller, model)
+    assert len(model.calls) == 1
+    assert 1.0 < error.value.retry_after <= 2.0
+
+def test_slow_model_exceeds_the_deadline():
+    model = FakeGenerativeModel("ok", latency=0.2)
+
+    with pytest.raises(AIDeadlineExceededError):
+        call(make_caller(deadline=0.05), model)
+
+@pytest.mark.parametrize("error, status_code", [
+    (AIRateLimitError("rate limited", retry_after=2.2), 429),
+    (AIUnavailableError("unavailable", retry_after=30.0), 503),
+])
+def test_errors_map_to_status_and_retry_after_header(error, status_code):
+    from backend.main import ai_service_error_handler
+
+    response = asyncio.run(ai_service_error_handler(None, error))
+
+    assert response.status_code == status_code
+    assert response.headers["retry-after"] == str(math.ceil(error.retry_after))
+
+def test_errors_without_retry_hint_have_no_retry_after_header():
+    from backend.main import ai_service_error_handler
+
+    response = asyncio.run(ai_service_error_handler(None, AIDeadlineExceededError("deadline")))
+
+    assert response.status_code == 504
+    assert "retry-after" not in response.headers
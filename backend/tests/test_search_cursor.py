@@ -0,0 +1,30 @@
+"""Tests of the keyset cursor of the search pages."""
+
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from backend.requirements.dtos.search_result_dto import RequirementSearchHitDTO
+from backend.requirements.services.search_service import SearchService
+
+def test_cursor_round_trips_the_exact_score_and_id():
+    requirement_id = ObjectId()
+    hit = RequirementSearchHitDTO(requirement_id=str(requirement_id), title="Login", score=1.1 / 3)
+
+    score, decoded_id = SearchService.decode_cursor(SearchService.encode_cursor(hit))
+
+    assert score == hit.score
+    assert decoded_id == requirement_id
+
+@pytest.mark.parametrize("cursor", ["", "1.5", "abc:" + str(ObjectId()), "1.5:not-an-id", "nan:" + str(ObjectId())])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        SearchService.decode_cursor(cursor)
+
+def test_cursor_and_offset_are_exclusive(mongo_database):
+    service = SearchService()
+    hit = RequirementSearchHitDTO(requirement_id=str(ObjectId()), title="Login", score=1.0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.search("login", offset=20, after=SearchService.encode_cursor(hit)))
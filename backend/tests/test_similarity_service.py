@@ -0,0 +1,65 @@
+"""Tests of the incremental weights and the search of the similarity index."""
+
+import asyncio
+
+import numpy as np
+from bson import ObjectId
+
+from backend.requirements.services import similarity_service
+from backend.requirements.services.similarity_service import SimilarityService
+
+TEXTS = [
+    "Cadastrar usuário por e-mail com confirmação",
+    "Exportar relatório mensal de faturas",
+    "Aprovar pagamento com assinatura digital",
+    "Consultar contrato vigente do cliente",
+]
+
+def documents(texts):
+    """Build requirement documents with fresh IDs."""
+    return [{"_id": ObjectId(), "title": text, "details": text, "description": None} for text in texts]
+
+def test_new_rows_are_scored_against_the_snapshot_until_it_goes_stale(mongo_database, tmp_path, monkeypatch):
+    monkeypatch.setattr(similarity_service, "IDF_REFRESH_RATIO", 0.5)
+
+    async def scenario():
+        service = SimilarityService(str(tmp_path), dimensions=256)
+        service._open()
+        await service.index_documents(documents(TEXTS))
+        await service.find_similar_text("relatório", limit=1)
+        snapshot = service._idf
+
+        duplicate = documents(["Exportar relatório mensal de faturas em lote"])[0]
+        await service.index_documents([duplicate])
+        neighbours = await service.find_similar(str(duplicate["_id"]), limit=1)
+        assert service._idf is snapshot
+        expected_norm = np.linalg.norm(np.asarray(service._vectors[4]) * snapshot)
+        assert np.isclose(service._norms[4], expected_norm)
+
+        await service.index_documents(documents(["Agendar entrega", "Cancelar pedido"]))
+        await service.find_similar_text("pedido", limit=1)
+        assert service._idf is not snapshot
+        assert service._idf_count == 7
+        await service.stop()
+        return neighbours
+
+    neighbours = asyncio.run(scenario())
+
+    assert len(neighbours) == 1
+    assert neighbours[0][1] > 0.5
+
+def test_writes_are_flushed_once_after_the_delay(mongo_database, tmp_path, monkeypatch):
+    monkeypatch.setattr(similarity_service, "FLUSH_DELAY_SECONDS", 0.01)
+    flushes = []
+
+    async def scenario():
+        service = SimilarityService(str(tmp_path), dimensions=256)
+        service._open()
+        monkeypatch.setattr(service, "_flush", lambda: flushes.append(service._count))
+        for document in documents(TEXTS):
+            await service.index_documents([document])
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+
+    assert flushes == [len(TEXTS)]
@@ -0,0 +1,75 @@
+"""Tests of the vectorized Wiegers relative prioritization."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.requirements.dtos.wiegers_weights_dto import WiegersWeightsDTO
+from backend.requirements.services.wiegers_priority_engine import WiegersPriorityEngine
+
+def columns(*rows):
+    """Split `(value, urgency, cost, risk)` rows into float columns."""
+    return [np.array(column, dtype=np.float64) for column in zip(*rows)]
+
+def test_priorities_match_hand_computed_values():
+    result = WiegersPriorityEngine.compute(*columns((5, 3, 2, 1), (1, 1, 3, 4)), WiegersWeightsDTO())
+
+    assert result["value_percentage"] == pytest.approx([81.25, 18.75])
+    assert result["cost_percentage"] == pytest.approx([40.0, 60.0])
+    assert result["risk_percentage"] == pytest.approx([20.0, 80.0])
+    assert result["priority"] == pytest.approx([0.8125 / 0.5, 0.1875 / 1.0])
+
+def test_zero_sum_risk_column_leaves_cost_as_the_only_penalty():
+    result = WiegersPriorityEngine.compute(*columns((2, 2, 1, 0), (4, 4, 3, 0)), WiegersWeightsDTO())
+
+    assert result["risk_percentage"].tolist() == [0.0, 0.0]
+    assert result["priority"] == pytest.approx([(6 / 18) / 0.25, (12 / 18) / 0.75])
+
+def test_zero_sum_value_and_penalty_columns_give_zero_priorities():
+    weights = WiegersWeightsDTO(benefit=1.0, penalty=0.0, cost=0.0, risk=1.0)
+
+    with np.errstate(all="raise"):
+        result = WiegersPriorityEngine.compute(*columns((0, 3, 2, 0), (0, 1, 5, 0)), weights)
+
+    assert result["value_percentage"].tolist() == [0.0, 0.0]
+    assert result["priority"].tolist() == [0.0, 0.0]
+
+def test_empty_set_has_no_priorities():
+    empty = np.array([], dtype=np.float64)
+
+    result = WiegersPriorityEngine.compute(empty, empty, empty, empty, WiegersWeightsDTO())
+
+    assert result["priority"].size == 0
+
+def test_updating_the_weights_requires_the_admin_token(monkeypatch):
+    import httpx
+    from fastapi import FastAPI
+
+    from backend.config.dependencies import get_wiegers_service
+    from backend.config.settings import settings
+    from backend.requirements.controllers.requirements_controller import router
+
+    class RecordingWiegersService:
+        def __init__(self):
+            self.updates = []
+
+        async def update_weights(self, weights):
+            self.updates.append(weights)
+            return weights
+
+    service = RecordingWiegersService()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_wiegers_service] = lambda: service
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "secret")
+    body = {"benefit": 1.0, "penalty": 1.0, "cost": 1.0, "risk": 1.0}
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            anonymous = await client.put("/requirement/wiegers/weights", json=body)
+            admin = await client.put("/requirement/wiegers/weights", json=body, headers={"X-Admin-Token": "secret"})
+        return anonymous.status_code, admin.status_code
+
+    assert asyncio.run(scenario()) == (403, 200)
+    assert len(service.updates) == 1